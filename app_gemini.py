@@ -6,6 +6,7 @@ POSCO International CRM Manual Chatbot
 import streamlit as st
 import sys
 import json
+import hashlib
 from pathlib import Path
 from typing import List, Dict
 from collections import Counter
@@ -19,7 +20,9 @@ from dotenv import load_dotenv
 import os
 
 from src.services.embedding_service import EmbeddingService
-from src.services.vector_store import VectorStore, SearchResult
+from src.core.config import get_settings
+from src.services.vector_store import create_vector_store, SearchResult
+from src.services.index_artifact import IndexArtifact, DEFAULT_INDEX_ARTIFACT_PATH
 from src.rag.query_processor import QueryProcessor
 from src.rag.generator import AnswerGenerator
 
@@ -209,19 +212,40 @@ def initialize_services():
     embedding_service = EmbeddingService(
         model_name="openai/text-embedding-3-large",
         api_key=api_key,
-        cache_enabled=True
+        cache_enabled=True,
+        output_dimension=int(os.getenv("EMBEDDING_DIMENSION", "3072"))
     )
 
-    vector_store = VectorStore(use_memory=True)
+    # Small bundled corpus: numpy brute-force search by default (VECTOR_STORE_BACKEND=qdrant for Qdrant in-memory)
+    vector_store = create_vector_store(get_settings().vector_store_backend, use_memory=True)
     query_processor = QueryProcessor()
     answer_generator = AnswerGenerator(api_key=api_key, model="gpt-4", temperature=0.3)
 
     return embedding_service, vector_store, query_processor, answer_generator
 
 
+def get_data_version(processed_dir: str = "data/processed") -> str:
+    """Fingerprint of the chunk JSON files and index artifact (name, mtime, size) used as cache key"""
+    files = sorted(Path(processed_dir).glob("*_chunks.json"))
+    artifact_path = Path(get_index_artifact_path())
+    if artifact_path.exists():
+        files.append(artifact_path)
+
+    fingerprint = hashlib.md5()
+    for file_path in files:
+        stat = file_path.stat()
+        fingerprint.update(f"{file_path.name}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return fingerprint.hexdigest()
+
+
+def get_index_artifact_path() -> str:
+    """Index artifact path (INDEX_ARTIFACT_PATH overrides the default)"""
+    return os.getenv("INDEX_ARTIFACT_PATH", DEFAULT_INDEX_ARTIFACT_PATH)
+
+
 @st.cache_data
-def load_chunks_from_json(processed_dir: str = "data/processed"):
-    """Load chunks from JSON files (cached)"""
+def load_chunks_from_json(processed_dir: str = "data/processed", data_version: str = ""):
+    """Load chunks from JSON files (cached per data_version, each call gets its own copy)"""
     processed_path = Path(processed_dir)
     chunks_by_collection = {}
 
@@ -294,37 +318,70 @@ def save_query_history(query: str):
         print(f"Error saving query history: {e}")
 
 
-def setup_vector_store(vector_store, embedding_service, chunks_by_collection):
-    """Setup vector store with chunks"""
-    if 'vector_store_ready' not in st.session_state:
-        with st.spinner("🔧 초기화 중..."):
-            for collection_name, chunks in chunks_by_collection.items():
-                vector_store.create_collection(
-                    collection_name=collection_name,
-                    vector_size=3072,
-                    recreate=True
-                )
+@st.cache_resource(max_entries=1)
+def load_index_artifact(path: str, data_version: str = ""):
+    """Memory-map the prebuilt index artifact if present (cached per data_version, shared across sessions)"""
+    try:
+        return IndexArtifact.open(path)
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Ignoring index artifact: {e}")
+        return None
+
+
+@st.cache_resource(show_spinner="🔧 초기화 중...")
+def build_vector_index(_vector_store, _embedding_service, _chunks_by_collection, vector_store_id: int, data_version: str, _artifact=None):
+    """
+    Build the shared vector index once per process (all sessions reuse it)
+
+    vector_store_id and data_version key the cache so a recreated vector store
+    or new chunk JSON / artifact files are rebuilt.
+    With a prebuilt artifact, vectors come straight from the mmap (no embedding calls).
+    """
+    total_chunks = 0
+    for collection_name, chunks in _chunks_by_collection.items():
+        _vector_store.create_collection(
+            collection_name=collection_name,
+            vector_size=_embedding_service.dimension,
+            recreate=True
+        )
 
-                chunk_texts = [chunk['text'] for chunk in chunks]
-                embeddings = embedding_service.embed_batch(chunk_texts, show_progress=False)
-
-                vector_chunks = []
-                for chunk, embedding in zip(chunks, embeddings):
-                    vector_chunk = {
-                        "chunk_id": chunk["chunk_id"],
-                        "text": chunk["text"],
-                        "embedding": embedding,
-                        "metadata": chunk["metadata"]
-                    }
-                    vector_chunks.append(vector_chunk)
-
-                vector_store.add_documents(
-                    collection_name=collection_name,
-                    chunks=vector_chunks,
-                    show_progress=False
-                )
+        if _artifact is not None:
+            embeddings = _artifact.get_vectors(collection_name)
+        else:
+            chunk_texts = [chunk['text'] for chunk in chunks]
+            embeddings = _embedding_service.embed_batch(
+                chunk_texts,
+                show_progress=False,
+                as_numpy=True
+            )
+
+        _vector_store.add_documents(
+            collection_name=collection_name,
+            chunks=chunks,
+            show_progress=False,
+            embeddings=embeddings
+        )
+        total_chunks += len(chunks)
+
+    return {
+        "ready": True,
+        "collections": len(_chunks_by_collection),
+        "chunks": total_chunks,
+        "source": "artifact" if _artifact is not None else "json",
+        "built_at": time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
 
-            st.session_state.vector_store_ready = True
+
+def setup_vector_store(vector_store, embedding_service, chunks_by_collection, data_version: str, artifact=None):
+    """Setup vector store with chunks (no per-session indexing work)"""
+    return build_vector_index(
+        vector_store,
+        embedding_service,
+        chunks_by_collection,
+        vector_store_id=id(vector_store),
+        data_version=data_version,
+        _artifact=artifact
+    )
 
 
 def perform_search(query: str, embedding_service, vector_store, query_processor, chunks_by_collection):
@@ -357,8 +414,12 @@ def main():
 
     # Initialize services
     embedding_service, vector_store, query_processor, answer_generator = initialize_services()
-    chunks_by_collection = load_chunks_from_json()
-    setup_vector_store(vector_store, embedding_service, chunks_by_collection)
+    data_version = get_data_version()
+    artifact = load_index_artifact(get_index_artifact_path(), data_version)
+    if artifact is not None and not artifact.is_compatible(embedding_service.cache_key_model, embedding_service.dimension):
+        artifact = None
+    chunks_by_collection = artifact.chunks_by_collection() if artifact else load_chunks_from_json(data_version=data_version)
+    setup_vector_store(vector_store, embedding_service, chunks_by_collection, data_version, artifact)
 
     # Initialize chat history
     if 'chat_history' not in st.session_state:
@@ -0,0 +1,169 @@
+"""
+벡터 DB 레이아웃 벤치마크
+- multi: 타입/언어별 8개 컬렉션 (MultiCollectionVectorStore, 컬렉션별 동시 검색)
+- unified: 단일 컬렉션 + payload 인덱스 필터 검색 (UnifiedCollectionVectorStore)
+- 질의 범위별(전체 / 언어 / 언어+타입) search_all_collections p50/p99 지연
+
+사용법:
+    python scripts/benchmark_layouts.py                       # Qdrant 메모리 모드, 합성 데이터
+    python scripts/benchmark_layouts.py --host localhost       # 실제 Qdrant 서버 (HNSW + payload 인덱스)
+    python scripts/benchmark_layouts.py --artifact data/processed/crm_index.bin --host localhost
+"""
+
+import sys
+import json
+import time
+import argparse
+import contextlib
+import io
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.services.vector_store import (
+    VectorStore,
+    MultiCollectionVectorStore,
+    UnifiedCollectionVectorStore,
+    DOC_TYPE_PAYLOAD,
+    LANGUAGE_PAYLOAD,
+)
+from src.services.index_artifact import IndexArtifact
+
+
+# 벤치마크 전용 컬렉션 이름 (실제 crm_{type}_{lang} / crm_unified 컬렉션은 건드리지 않음)
+BENCH_PREFIX = "crm_bench"
+
+SCOPES = [
+    ("all", None, None),
+    ("lang", "ko", None),
+    ("lang+type", "ko", "account"),
+]
+
+
+def synthetic_corpus(per_collection: int, dim: int, seed: int = 42) -> Dict[Tuple[str, str], Tuple[List[Dict], np.ndarray]]:
+    """(타입, 언어)별 합성 청크/벡터"""
+    rng = np.random.default_rng(seed)
+    corpus = {}
+    for doc_type in DOC_TYPE_PAYLOAD:
+        for language in LANGUAGE_PAYLOAD:
+            document_id = f"crm_{doc_type}_{language}_v1_0"
+            chunks = [
+                {
+                    "chunk_id": f"{document_id}_chunk_{i:04d}",
+                    "text": f"synthetic chunk {i}",
+                    "metadata": {
+                        "document_id": document_id,
+                        "type": DOC_TYPE_PAYLOAD[doc_type],
+                        "language": LANGUAGE_PAYLOAD[language],
+                    }
+                }
+                for i in range(per_collection)
+            ]
+            corpus[(doc_type, language)] = (chunks, rng.standard_normal((per_collection, dim)).astype(np.float32))
+    return corpus
+
+
+def artifact_corpus(path: str) -> Dict[Tuple[str, str], Tuple[List[Dict], np.ndarray]]:
+    """인덱스 아티팩트의 컬렉션(crm_{type}_{lang})별 청크/벡터"""
+    artifact = IndexArtifact(path)
+    corpus = {}
+    for name in artifact.collections:
+        _, doc_type, language = name.split("_")[:3]
+        corpus[(doc_type, language)] = (artifact.get_chunks(name), np.asarray(artifact.get_vectors(name)))
+    return corpus
+
+
+def make_store(host: Optional[str], port: int) -> VectorStore:
+    return VectorStore(host=host, port=port) if host else VectorStore(use_memory=True)
+
+
+def run_layout(layout, corpus, queries: np.ndarray, top_k: int, vector_size: int) -> Dict[str, Dict]:
+    """레이아웃 구축 후 질의 범위별 지연 측정"""
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        layout.initialize_crm_collections(vector_size=vector_size, recreate=True)
+        for (doc_type, language), (chunks, embeddings) in corpus.items():
+            layout.add_document_chunks(doc_type, language, chunks, batch_size=256, embeddings=embeddings)
+
+    try:
+        return measure_scopes(layout, queries, top_k)
+    finally:
+        # 서버에 벤치마크 컬렉션을 남기지 않음
+        with contextlib.redirect_stdout(io.StringIO()):
+            for name in layout.store.list_collections():
+                if name.startswith(BENCH_PREFIX):
+                    layout.store.delete_collection(name)
+
+
+def measure_scopes(layout, queries: np.ndarray, top_k: int) -> Dict[str, Dict]:
+    """질의 범위별 search_all_collections p50/p99 지연"""
+    results = {}
+    for label, language, doc_type in SCOPES:
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            layout.search_all_collections(query.tolist(), top_k=top_k, language=language, doc_type=doc_type)
+            latencies.append(time.perf_counter() - start)
+        results[label] = {
+            "p50_ms": float(np.percentile(latencies, 50) * 1000),
+            "p99_ms": float(np.percentile(latencies, 99) * 1000),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-collection vs unified collection layout")
+    parser.add_argument("--host", type=str, default=None, help="Qdrant host (default: in-memory)")
+    parser.add_argument("--port", type=int, default=6333)
+    parser.add_argument("--per-collection", type=int, default=500, help="Synthetic chunks per collection")
+    parser.add_argument("--dim", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--artifact", type=str, default=None, help="Use the real corpus from an index artifact")
+    parser.add_argument("--output", type=str, default=None, help="Save results as JSON")
+    args = parser.parse_args()
+
+    corpus = artifact_corpus(args.artifact) if args.artifact else synthetic_corpus(args.per_collection, args.dim)
+    vector_size = next(iter(corpus.values()))[1].shape[1]
+    total = sum(len(chunks) for chunks, _ in corpus.values())
+
+    rng = np.random.default_rng(7)
+    queries = rng.standard_normal((args.queries, vector_size)).astype(np.float32)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        layouts = {
+            "multi": MultiCollectionVectorStore(
+                store=make_store(args.host, args.port),
+                search_timeout=None,
+                collection_prefix=BENCH_PREFIX
+            ),
+            "unified": UnifiedCollectionVectorStore(
+                collection_name=f"{BENCH_PREFIX}_unified",
+                store=make_store(args.host, args.port)
+            ),
+        }
+
+    print(f"📂 {len(corpus)} collections, {total} chunks, dim={vector_size}, "
+          f"{'Qdrant ' + args.host if args.host else 'in-memory'}")
+    print(f"\n{'layout':>8} | {'scope':>10} | {'p50 (ms)':>9} | {'p99 (ms)':>9}")
+    print("-" * 46)
+
+    results = []
+    for name, layout in layouts.items():
+        measured = run_layout(layout, corpus, queries, args.top_k, vector_size)
+        layout.close()
+        for scope, m in measured.items():
+            print(f"{name:>8} | {scope:>10} | {m['p50_ms']:>9.3f} | {m['p99_ms']:>9.3f}")
+            results.append({"layout": name, "scope": scope, **{k: round(v, 4) for k, v in m.items()}})
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"chunks": total, "dimension": vector_size, "queries": args.queries,
+                       "top_k": args.top_k, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
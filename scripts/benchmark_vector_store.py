@@ -0,0 +1,165 @@
+"""
+벡터 스토어 백엔드 벤치마크
+- NumPy 브루트포스(NumpyVectorStore) vs Qdrant 메모리 모드(VectorStore)
+- 인덱스 구축 시간, 검색 지연(p50/p99), 필터 검색 지연, 배치 검색(search_batch) 쿼리당 지연,
+  결과 일치율(top-k overlap)
+
+사용법:
+    python scripts/benchmark_vector_store.py
+    python scripts/benchmark_vector_store.py --sizes 500 2000 5000 --dim 1024 --queries 200
+    python scripts/benchmark_vector_store.py --artifact data/processed/crm_index.bin  # 실제 코퍼스
+"""
+
+import sys
+import json
+import time
+import argparse
+import contextlib
+import io
+from pathlib import Path
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.services.vector_store import create_vector_store
+from src.services.index_artifact import IndexArtifact
+
+
+DOC_TYPES = ["account_contact", "meeting_memo", "order", "common"]
+
+
+def synthetic_corpus(size: int, dim: int, seed: int = 42) -> Tuple[List[Dict], np.ndarray]:
+    """무작위 벡터 + 타입 메타데이터를 가진 합성 청크"""
+    rng = np.random.default_rng(seed)
+    embeddings = rng.standard_normal((size, dim)).astype(np.float32)
+    chunks = [
+        {
+            "chunk_id": f"chunk_{i:06d}",
+            "text": f"synthetic chunk {i}",
+            "metadata": {"type": DOC_TYPES[i % len(DOC_TYPES)], "page": i // 10}
+        }
+        for i in range(size)
+    ]
+    return chunks, embeddings
+
+
+def percentile_ms(samples: List[float], q: float) -> float:
+    return float(np.percentile(samples, q) * 1000)
+
+
+def run_backend(
+    backend: str,
+    chunks: List[Dict],
+    embeddings: np.ndarray,
+    queries: np.ndarray,
+    top_k: int,
+    filters: Dict
+) -> Dict:
+    """단일 백엔드 측정 (백엔드 로그 출력은 숨김)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        store = create_vector_store(backend, use_memory=True)
+
+        start = time.perf_counter()
+        store.create_collection("bench", vector_size=embeddings.shape[1], recreate=True)
+        store.add_documents("bench", chunks, batch_size=256, show_progress=False, embeddings=embeddings)
+        # 첫 검색에 포함되는 지연 초기화 비용까지 구축 시간에 포함
+        store.search("bench", queries[0].tolist(), top_k=top_k)
+        build_s = time.perf_counter() - start
+
+        latencies, filtered_latencies, hits = [], [], []
+        for query in queries:
+            query_list = query.tolist()
+
+            start = time.perf_counter()
+            results = store.search("bench", query_list, top_k=top_k)
+            latencies.append(time.perf_counter() - start)
+            hits.append([r.chunk_id for r in results])
+
+            start = time.perf_counter()
+            store.search("bench", query_list, top_k=top_k, filters=filters)
+            filtered_latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        store.search_batch("bench", queries, top_k=top_k)
+        batch_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    return {
+        "build_s": build_s,
+        "p50_ms": percentile_ms(latencies, 50),
+        "p99_ms": percentile_ms(latencies, 99),
+        "filtered_p50_ms": percentile_ms(filtered_latencies, 50),
+        "filtered_p99_ms": percentile_ms(filtered_latencies, 99),
+        "batch_ms_per_query": batch_ms,
+        "hits": hits,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark numpy vs Qdrant in-memory vector store")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[355, 1000, 5000])
+    parser.add_argument("--dim", type=int, default=3072)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--artifact", type=str, default=None,
+                        help="Benchmark the real corpus from a prebuilt index artifact")
+    parser.add_argument("--output", type=str, default=None, help="Save results as JSON")
+    args = parser.parse_args()
+
+    if args.artifact:
+        artifact = IndexArtifact(args.artifact)
+        corpora = [("artifact", [
+            {"chunk_id": p["chunk_id"], "text": p["text"], "metadata": p["metadata"]}
+            for p in artifact.payloads
+        ], np.asarray(artifact.vectors))]
+        filters = {"language": artifact.payloads[0]["metadata"].get("language")}
+    else:
+        corpora = [(str(size), *synthetic_corpus(size, args.dim)) for size in args.sizes]
+        filters = {"type": DOC_TYPES[0]}
+
+    print(f"\n{'corpus':>8} | {'backend':>7} | {'build (s)':>9} | {'p50 (ms)':>8} | {'p99 (ms)':>8} | "
+          f"{'filt p50':>8} | {'filt p99':>8} | {'batch/q':>8} | {'overlap':>7}")
+    print("-" * 99)
+
+    results = []
+    for label, chunks, embeddings in corpora:
+        # 질의 = 코퍼스 벡터 + 노이즈 (현실적인 점수 분포)
+        rng = np.random.default_rng(7)
+        picks = rng.integers(0, len(embeddings), size=args.queries)
+        queries = embeddings[picks] + 0.5 * rng.standard_normal(
+            (args.queries, embeddings.shape[1])
+        ).astype(np.float32) * float(np.abs(embeddings).mean())
+
+        measured = {
+            backend: run_backend(backend, chunks, embeddings, queries, args.top_k, filters)
+            for backend in ("qdrant", "numpy")
+        }
+        overlap = float(np.mean([
+            len(set(a) & set(b)) / max(1, len(a))
+            for a, b in zip(measured["qdrant"]["hits"], measured["numpy"]["hits"])
+        ]))
+
+        for backend, m in measured.items():
+            print(f"{label:>8} | {backend:>7} | {m['build_s']:>9.3f} | {m['p50_ms']:>8.3f} | "
+                  f"{m['p99_ms']:>8.3f} | {m['filtered_p50_ms']:>8.3f} | {m['filtered_p99_ms']:>8.3f} | "
+                  f"{m['batch_ms_per_query']:>8.3f} | "
+                  f"{overlap:>7.3f}")
+            results.append({
+                "corpus": label,
+                "backend": backend,
+                "vectors": len(embeddings),
+                "dimension": int(embeddings.shape[1]),
+                **{k: round(v, 4) for k, v in m.items() if k != "hits"},
+                "top_k_overlap": round(overlap, 4),
+            })
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"top_k": args.top_k, "queries": args.queries, "results": results},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Matryoshka 차원 축소 오프라인 평가 스크립트
+- text-embedding-3-large(3072차원) 벡터를 잘라 재정규화했을 때의 검색 품질 측정
+- 기준: 전체 차원 검색 결과 대비 recall@k
+- 메모리 사용량 / 쿼리당 검색 지연 시간 비교
+
+사용법:
+    python scripts/evaluate_dimensions.py
+    python scripts/evaluate_dimensions.py --dims 3072 1536 1024 512 256 --top-k 5
+    python scripts/evaluate_dimensions.py --base-url http://localhost:8765/v1  # 스텁 서버
+"""
+
+import sys
+import json
+import re
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import List, Dict
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+import os
+from src.services.embedding_service import EmbeddingService
+
+
+DEFAULT_QUERIES = [
+    "거래선 등록 방법",
+    "미팅메모 작성하는 방법",
+    "주문 승인 프로세스",
+    "연락처 관리 방법",
+    "계약 정보 입력",
+    "How to register a new account",
+    "How to write a meeting memo",
+    "Order approval process",
+    "How to manage contacts",
+    "Entering contract information",
+]
+
+
+def load_chunks_by_collection(processed_dir: str = "data/processed") -> Dict[str, List[Dict]]:
+    """JSON 파일에서 컬렉션별 청크 로드 (예: crm_account_ko_v1_0 -> crm_account_ko)"""
+    chunks_by_collection = {}
+    for json_file in sorted(Path(processed_dir).glob("*_chunks.json")):
+        with open(json_file, 'r', encoding='utf-8') as f:
+            chunks = json.load(f)
+
+        doc_id = json_file.stem.replace('_chunks', '')
+        parts = doc_id.split('_')
+        collection_name = f"{parts[0]}_{parts[1]}_{parts[2]}" if len(parts) >= 4 else doc_id
+        chunks_by_collection.setdefault(collection_name, []).extend(chunks)
+
+    return chunks_by_collection
+
+
+def build_queries(
+    chunks_by_collection: Dict[str, List[Dict]],
+    samples_per_collection: int,
+    seed: int = 42
+) -> List[str]:
+    """기본 질의 + 각 컬렉션 청크 첫 줄에서 뽑은 의사(pseudo) 질의"""
+    rng = random.Random(seed)
+    queries = list(DEFAULT_QUERIES)
+
+    for chunks in chunks_by_collection.values():
+        for chunk in rng.sample(chunks, min(samples_per_collection, len(chunks))):
+            first_line = next((line.strip() for line in chunk["text"].splitlines() if line.strip()), "")
+            if first_line:
+                queries.append(first_line[:100])
+
+    return queries
+
+
+def reduce_dimension(matrix: np.ndarray, dim: int) -> np.ndarray:
+    """앞쪽 dim개 성분만 남기고 L2 재정규화"""
+    reduced = np.ascontiguousarray(matrix[:, :dim])
+    norms = np.linalg.norm(reduced, axis=1, keepdims=True)
+    return reduced / np.where(norms == 0, 1.0, norms)
+
+
+def search_top_k(
+    query_matrix: np.ndarray,
+    corpus: np.ndarray,
+    candidate_mask: np.ndarray,
+    top_k: int
+) -> List[np.ndarray]:
+    """질의별로 후보(같은 언어 컬렉션) 중 코사인 유사도 상위 k개 인덱스"""
+    scores = query_matrix @ corpus.T
+    results = []
+    for q in range(len(query_matrix)):
+        candidates = np.flatnonzero(candidate_mask[q])
+        k = min(top_k, len(candidates))
+        top = candidates[np.argpartition(-scores[q, candidates], k - 1)[:k]]
+        results.append(set(top.tolist()))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate Matryoshka dimension reduction")
+    parser.add_argument("--dims", type=int, nargs="+", default=[3072, 2048, 1536, 1024, 768, 512, 256])
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--samples-per-collection", type=int, default=10,
+                        help="Pseudo-queries sampled from each collection")
+    parser.add_argument("--processed-dir", type=str, default="data/processed")
+    parser.add_argument("--base-url", type=str, default=None,
+                        help="OpenAI-compatible API URL (e.g. local stub server, embedding cache disabled)")
+    parser.add_argument("--output", type=str, default=None, help="Save results as JSON")
+    args = parser.parse_args()
+
+    load_dotenv()
+    api_key = os.getenv("OPENAI_API_KEY") or ("stub" if args.base_url else None)
+    if not api_key:
+        print("❌ OPENAI_API_KEY not found in .env")
+        sys.exit(1)
+
+    # 전체 차원 임베딩 (캐시 재사용, 스텁/호환 서버 벡터는 운영 캐시에 쓰지 않음)
+    embedding_service = EmbeddingService(
+        model_name="openai/text-embedding-3-large",
+        api_key=api_key,
+        cache_enabled=args.base_url is None,
+        base_url=args.base_url
+    )
+
+    chunks_by_collection = load_chunks_by_collection(args.processed_dir)
+    collections = []
+    texts = []
+    for collection_name, chunks in chunks_by_collection.items():
+        collections.extend([collection_name] * len(chunks))
+        texts.extend(chunk["text"] for chunk in chunks)
+    collections = np.array(collections)
+
+    print(f"📂 {len(chunks_by_collection)} collections, {len(texts)} chunks")
+
+    corpus_full = embedding_service.embed_batch(texts, show_progress=True, as_numpy=True)
+    queries = build_queries(chunks_by_collection, args.samples_per_collection)
+    query_full = embedding_service.embed_batch(queries, show_progress=False, as_numpy=True)
+
+    # 질의 언어에 해당하는 컬렉션만 검색 (앱과 동일)
+    is_korean = np.array([bool(re.search(r'[가-힣]', q)) for q in queries])
+    is_ko_collection = np.char.endswith(collections.astype(str), "_ko")
+    candidate_mask = np.where(is_korean[:, None], is_ko_collection[None, :], ~is_ko_collection[None, :])
+
+    native_dim = corpus_full.shape[1]
+    baseline = search_top_k(
+        reduce_dimension(query_full, native_dim),
+        reduce_dimension(corpus_full, native_dim),
+        candidate_mask,
+        args.top_k
+    )
+
+    print(f"\n{'dim':>6} | {'recall@' + str(args.top_k):>10} | {'memory (MB)':>12} | {'latency (ms/query)':>18}")
+    print("-" * 58)
+
+    results = []
+    for dim in sorted(set(d for d in args.dims if d <= native_dim), reverse=True):
+        corpus = reduce_dimension(corpus_full, dim).astype(np.float32)
+        query_matrix = reduce_dimension(query_full, dim).astype(np.float32)
+
+        start = time.perf_counter()
+        retrieved = search_top_k(query_matrix, corpus, candidate_mask, args.top_k)
+        latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+        recall = np.mean([
+            len(r & b) / max(1, len(b)) for r, b in zip(retrieved, baseline)
+        ])
+        memory_mb = corpus.nbytes / (1024 * 1024)
+
+        print(f"{dim:>6} | {recall:>10.3f} | {memory_mb:>12.2f} | {latency_ms:>18.3f}")
+        results.append({
+            "dimension": dim,
+            f"recall_at_{args.top_k}": round(float(recall), 4),
+            "memory_mb": round(memory_mb, 2),
+            "latency_ms_per_query": round(latency_ms, 4),
+        })
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                "collections": len(chunks_by_collection),
+                "chunks": len(texts),
+                "queries": len(queries),
+                "top_k": args.top_k,
+                "results": results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
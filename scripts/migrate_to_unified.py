@@ -0,0 +1,131 @@
+"""
+8개 컬렉션 → 단일 통합 컬렉션 마이그레이션 스크립트
+- crm_{type}_{lang} 컬렉션의 포인트(벡터 + payload)를 그대로 복사 (재임베딩 없음)
+- 통합 컬렉션에 type/language/document_id payload 인덱스 생성
+
+사용법:
+    python scripts/migrate_to_unified.py
+    python scripts/migrate_to_unified.py --recreate --batch-size 256
+    python scripts/migrate_to_unified.py --delete-source   # 복사 검증 후 원본 컬렉션 삭제
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from dotenv import load_dotenv
+from qdrant_client.models import Batch
+
+from src.core.config import get_settings
+from src.services.vector_store import (
+    VectorStore,
+    UnifiedCollectionVectorStore,
+    DOC_TYPE_PAYLOAD,
+    LANGUAGE_PAYLOAD,
+)
+
+
+def migrate_collection(
+    store: VectorStore,
+    source: str,
+    target: str,
+    doc_type: str,
+    language: str,
+    batch_size: int
+) -> int:
+    """원본 컬렉션 포인트를 scroll로 읽어 통합 컬렉션에 upsert"""
+    copied = 0
+    offset = None
+
+    while True:
+        records, offset = store.client.scroll(
+            collection_name=source,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        if not records:
+            break
+
+        payloads = []
+        for record in records:
+            payload = dict(record.payload or {})
+            payload.setdefault("type", DOC_TYPE_PAYLOAD[doc_type])
+            payload.setdefault("language", LANGUAGE_PAYLOAD[language])
+            payloads.append(payload)
+
+        store.client.upsert(
+            collection_name=target,
+            points=Batch(
+                ids=[record.id for record in records],
+                vectors=[record.vector for record in records],
+                payloads=payloads
+            )
+        )
+        copied += len(records)
+
+        if offset is None:
+            break
+
+    return copied
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate crm_{type}_{lang} collections into one unified collection")
+    parser.add_argument("--collection", type=str, default="crm_unified", help="Unified collection name")
+    parser.add_argument("--recreate", action="store_true", help="Recreate the unified collection first")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--delete-source", action="store_true",
+                        help="Delete source collections after verifying point counts")
+    args = parser.parse_args()
+
+    load_dotenv()
+    settings = get_settings()
+
+    store = VectorStore(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        api_key=settings.qdrant_api_key
+    )
+
+    sources = [
+        (f"crm_{doc_type}_{language}", doc_type, language)
+        for doc_type in DOC_TYPE_PAYLOAD
+        for language in LANGUAGE_PAYLOAD
+        if store.collection_exists(f"crm_{doc_type}_{language}")
+    ]
+    if not sources:
+        print("❌ No crm_{type}_{lang} collections found")
+        sys.exit(1)
+
+    vector_size = store.get_collection_info(sources[0][0])["config"]["vector_size"]
+    unified = UnifiedCollectionVectorStore(collection_name=args.collection, store=store)
+    unified.initialize_crm_collections(vector_size=vector_size, recreate=args.recreate)
+
+    print(f"\n🚚 Migrating {len(sources)} collections -> {args.collection}")
+    total = 0
+    for source, doc_type, language in sources:
+        expected = store.get_collection_info(source)["points_count"]
+        copied = migrate_collection(store, source, args.collection, doc_type, language, args.batch_size)
+        total += copied
+        status = "✅" if copied == expected else "⚠️ "
+        print(f"   {status} {source}: {copied}/{expected} points")
+
+    target_count = store.get_collection_info(args.collection)["points_count"]
+    print(f"\n📊 Unified collection: {target_count} points (copied {total})")
+
+    if args.delete_source:
+        if target_count < total:
+            print("❌ Point count mismatch, source collections kept")
+            sys.exit(1)
+        for source, _, _ in sources:
+            store.delete_collection(source)
+
+    print("\n✅ Migration completed! Set VECTOR_LAYOUT=unified to use the unified collection.")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ sys.path.append(str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 from src.core.config import get_settings
 from src.core.pipeline import create_pipeline
+from src.services.rate_limiter import TokenBucketRateLimiter
+from src.services.index_artifact import DEFAULT_INDEX_ARTIFACT_PATH
 
 
 def main():
@@ -48,6 +50,12 @@ def main():
         help="Disable embedding cache"
     )
 
+    parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Disable the page-level PDF parse cache (default dir: PDF_PARSE_CACHE_DIR)"
+    )
+
     parser.add_argument(
         "--batch-size",
         type=int,
@@ -55,6 +63,59 @@ def main():
         help="Batch size for embedding (default: 100)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Max in-flight embedding requests (default: EMBEDDING_CONCURRENCY)"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parse/chunk worker processes for folders (default: INGEST_WORKERS, 1 = sequential)"
+    )
+
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="Page extraction worker processes per PDF (default: PDF_PARSE_WORKERS, 1 = sequential)"
+    )
+
+    parser.add_argument(
+        "--hybrid-extraction",
+        action="store_true",
+        help="Extract with PyMuPDF first and re-extract only low-quality pages in layout mode "
+             "(default: PDF_HYBRID_EXTRACTION)"
+    )
+
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="Stream pages -> chunks -> embeddings -> upsert through bounded queues (default: INGEST_STREAMING)"
+    )
+
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Reprocess every file (ignore the incremental manifest)"
+    )
+
+    parser.add_argument(
+        "--index-output",
+        type=str,
+        default=DEFAULT_INDEX_ARTIFACT_PATH,
+        help=f"Prebuilt index artifact path (default: {DEFAULT_INDEX_ARTIFACT_PATH})"
+    )
+
+    parser.add_argument(
+        "--no-index-artifact",
+        action="store_true",
+        help="Skip building the prebuilt index artifact"
+    )
+
     args = parser.parse_args()
 
     # Load environment variables
@@ -68,7 +129,9 @@ def main():
     print(f"Strategy: {args.strategy}")
     print(f"Recreate Collections: {args.recreate_collections}")
     print(f"Cache: {'Disabled' if args.no_cache else 'Enabled'}")
+    print(f"Parse Cache: {'Disabled' if args.no_parse_cache else 'Enabled'}")
     print(f"Batch Size: {args.batch_size}")
+    print(f"Incremental: {'Disabled' if args.full else 'Enabled'}")
     print("=" * 60)
 
     # Check input path
@@ -77,6 +140,7 @@ def main():
         print(f"❌ Error: Path not found: {args.input_path}")
         sys.exit(1)
 
+    pipeline = None
     try:
         # Create pipeline (use_memory=True to skip Qdrant connection attempt)
         pipeline = create_pipeline(
@@ -84,13 +148,28 @@ def main():
             qdrant_host=settings.qdrant_host,
             qdrant_port=settings.qdrant_port,
             vector_size=settings.embedding_dimension,
-            use_memory=True  # Use in-memory mode when Docker is not available
+            use_memory=True,  # Use in-memory mode when Docker is not available
+            dimension_strategy=settings.embedding_dimension_strategy,
+            layout=settings.vector_layout,
+            parse_workers=max(1, args.parse_workers or settings.pdf_parse_workers),
+            hybrid_extraction=args.hybrid_extraction or settings.pdf_hybrid_extraction,
+            parse_cache_dir=None if args.no_parse_cache else settings.pdf_parse_cache_dir
         )
 
         # Override cache setting
         if args.no_cache:
             pipeline.embedding_service.cache_enabled = False
 
+        # Embedding concurrency / rate limits
+        embedding_service = pipeline.embedding_service
+        embedding_service.max_concurrency = max(1, args.concurrency or settings.embedding_concurrency)
+        embedding_service.rate_limiter = TokenBucketRateLimiter(
+            requests_per_minute=settings.embedding_requests_per_minute,
+            tokens_per_minute=settings.embedding_tokens_per_minute
+        )
+        embedding_service.max_tokens_per_request = settings.embedding_max_tokens_per_request
+        embedding_service.max_retries = settings.embedding_max_retries
+
         # Recreate collections if requested
         if args.recreate_collections:
             print("\n⚠️  Recreating collections (existing data will be deleted)...")
@@ -99,13 +178,20 @@ def main():
                 recreate=True
             )
 
+        # The manifest tracks the on-disk outputs (chunk JSON, index artifact, embedding cache);
+        # recreated collections start empty, so reprocess everything
+        incremental = not (args.full or args.recreate_collections)
+        streaming = args.streaming or settings.ingest_streaming
+
         # Process
         if input_path.is_file():
             # Single file
             stats = pipeline.process_document(
                 pdf_path=str(input_path),
                 chunking_strategy=args.strategy,
-                save_intermediate=True
+                save_intermediate=True,
+                incremental=incremental,
+                streaming=streaming
             )
             print("\n✅ Processing completed!")
             print(f"   - Document ID: {stats['document_id']}")
@@ -117,7 +203,10 @@ def main():
             stats_list = pipeline.process_folder(
                 folder_path=str(input_path),
                 chunking_strategy=args.strategy,
-                file_pattern="*.pdf"
+                file_pattern="*.pdf",
+                incremental=incremental,
+                max_workers=max(1, args.workers or settings.ingest_workers),
+                streaming=streaming
             )
             print("\n✅ All processing completed!")
 
@@ -125,11 +214,24 @@ def main():
             print(f"❌ Error: Invalid path type: {args.input_path}")
             sys.exit(1)
 
+        # Prebuilt index artifact (apps mmap it at startup instead of re-embedding)
+        if not args.no_index_artifact:
+            if args.no_cache:
+                print("\n⚠️  Skipping index artifact: it is built from the embedding cache (--no-cache)")
+            elif pipeline.last_errors:
+                print(f"\n⚠️  Skipping index artifact: {len(pipeline.last_errors)} file(s) failed")
+            else:
+                pipeline.export_index_artifact(args.index_output)
+
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        # Shut down the page extraction worker pool
+        if pipeline is not None:
+            pipeline.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,138 @@
+"""
+로컬 스텁 임베딩 서버
+- OpenAI /v1/embeddings 호환 엔드포인트
+- API 키 없이 EmbeddingService 동시성/속도 제한 동작 확인용
+
+사용법:
+    python scripts/stub_embedding_server.py --port 8765 --latency 0.2
+    python scripts/stub_embedding_server.py --failure-rate 0.3   # 429/503 재현
+    EmbeddingService(..., api_key="stub", base_url="http://localhost:8765/v1")
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import random
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubEmbeddingHandler(BaseHTTPRequestHandler):
+    """결정적(deterministic) 임베딩을 반환하는 핸들러"""
+
+    dimension = 3072
+    latency = 0.0
+    failure_rate = 0.0
+    in_flight = 0
+    max_in_flight = 0
+    request_count = 0
+    _lock = threading.Lock()
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/embeddings"):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+
+        # 일시적 오류 재현 (429 + Retry-After 또는 503)
+        if self.failure_rate and random.random() < self.failure_rate:
+            status = random.choice([429, 503])
+            payload = json.dumps({"error": {"message": "stub failure", "type": "stub"}}).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            if status == 429:
+                self.send_header("Retry-After", "0.1")
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        inputs = body.get("input", [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimension = body.get("dimensions") or self.dimension
+
+        cls = type(self)
+        with cls._lock:
+            cls.in_flight += 1
+            cls.request_count += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+
+            use_base64 = body.get("encoding_format") == "base64"
+            data = []
+            for i, text in enumerate(inputs):
+                embedding = self._embed(text, dimension)
+                if use_base64:
+                    embedding = base64.b64encode(struct.pack(f"<{dimension}f", *embedding)).decode()
+                data.append({"object": "embedding", "index": i, "embedding": embedding})
+            response = {
+                "object": "list",
+                "data": data,
+                "model": body.get("model", "stub"),
+                "usage": {"prompt_tokens": 0, "total_tokens": 0},
+            }
+            payload = json.dumps(response).encode()
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with cls._lock:
+                cls.in_flight -= 1
+
+    @staticmethod
+    def _embed(text: str, dimension: int) -> list:
+        """텍스트 해시로 시드한 의사 난수 벡터"""
+        values = []
+        seed = hashlib.sha256(text.encode()).digest()
+        counter = 0
+        while len(values) < dimension:
+            block = hashlib.sha256(seed + struct.pack("<I", counter)).digest()
+            values.extend((b - 127.5) / 127.5 for b in block)
+            counter += 1
+        return values[:dimension]
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub OpenAI embedding server")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dimension", type=int, default=3072)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Artificial latency per request in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with 429/503")
+    args = parser.parse_args()
+
+    StubEmbeddingHandler.dimension = args.dimension
+    StubEmbeddingHandler.latency = args.latency
+    StubEmbeddingHandler.failure_rate = args.failure_rate
+
+    server = ThreadingHTTPServer((args.host, args.port), StubEmbeddingHandler)
+    print(f"🧪 Stub embedding server on http://{args.host}:{args.port}/v1")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"📊 Requests: {StubEmbeddingHandler.request_count}, "
+              f"max in flight: {StubEmbeddingHandler.max_in_flight}")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     qdrant_host: str = Field(default="localhost", env="QDRANT_HOST")
     qdrant_port: int = Field(default=6333, env="QDRANT_PORT")
     qdrant_api_key: Optional[str] = Field(default=None, env="QDRANT_API_KEY")
+    vector_store_backend: Literal["qdrant", "numpy"] = Field(default="numpy", env="VECTOR_STORE_BACKEND")
+    vector_layout: Literal["multi", "unified"] = Field(default="multi", env="VECTOR_LAYOUT")
 
     # Embedding
     embedding_model: str = Field(
@@ -26,6 +28,15 @@ class Settings(BaseSettings):
         env="EMBEDDING_MODEL"
     )
     embedding_dimension: int = Field(default=3072, env="EMBEDDING_DIMENSION")
+    embedding_dimension_strategy: Literal["truncate", "api"] = Field(
+        default="truncate",
+        env="EMBEDDING_DIMENSION_STRATEGY"
+    )
+    embedding_local_backend: Literal["torch", "torch-int8", "onnx", "onnx-int8"] = Field(
+        default="torch",
+        env="EMBEDDING_LOCAL_BACKEND"
+    )
+    embedding_local_threads: Optional[int] = Field(default=None, env="EMBEDDING_LOCAL_THREADS")
 
     # Chunking
     chunk_size: int = Field(default=1000, env="CHUNK_SIZE")
@@ -40,10 +51,22 @@ class Settings(BaseSettings):
     # Cache
     cache_enabled: bool = Field(default=True, env="CACHE_ENABLED")
     cache_dir: str = Field(default="data/embeddings", env="CACHE_DIR")
+    cache_backend: Literal["json", "packed"] = Field(default="packed", env="CACHE_BACKEND")
+    memory_cache_bytes: int = Field(default=64 * 1024 * 1024, env="MEMORY_CACHE_BYTES")
 
     # Processing
     batch_size: int = Field(default=100, env="BATCH_SIZE")
+    embedding_concurrency: int = Field(default=4, env="EMBEDDING_CONCURRENCY")
+    embedding_requests_per_minute: Optional[int] = Field(default=3000, env="EMBEDDING_RPM")
+    embedding_tokens_per_minute: Optional[int] = Field(default=1_000_000, env="EMBEDDING_TPM")
+    embedding_max_tokens_per_request: int = Field(default=100_000, env="EMBEDDING_MAX_TOKENS_PER_REQUEST")
+    embedding_max_retries: int = Field(default=5, env="EMBEDDING_MAX_RETRIES")
     save_intermediate: bool = Field(default=True, env="SAVE_INTERMEDIATE")
+    ingest_workers: int = Field(default=1, env="INGEST_WORKERS")
+    ingest_streaming: bool = Field(default=False, env="INGEST_STREAMING")
+    pdf_parse_workers: int = Field(default=1, env="PDF_PARSE_WORKERS")
+    pdf_hybrid_extraction: bool = Field(default=False, env="PDF_HYBRID_EXTRACTION")
+    pdf_parse_cache_dir: str = Field(default="data/parse_cache", env="PDF_PARSE_CACHE_DIR")
 
     # Paths
     pdf_input_dir: str = Field(default="PDF", env="PDF_INPUT_DIR")
@@ -57,6 +80,7 @@ class Settings(BaseSettings):
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
+        extra = "ignore"  # .env에 앱 전용 키(INDEX_ARTIFACT_PATH 등)가 있어도 허용
 
 
 def get_settings() -> Settings:
@@ -0,0 +1,97 @@
+"""
+증분 처리 매니페스트
+- 문서별 파일 해시, 파서/청커 설정 해시, 청크 해시 기록
+- 변경 없는 파일은 건너뛰고, 변경된 파일은 바뀐 청크만 재임베딩/업서트
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+MANIFEST_VERSION = 1
+
+
+class IngestionManifest:
+    """
+    문서 처리 매니페스트 (JSON 파일)
+
+    구조:
+        {"version": 1, "documents": {document_id: {
+            "source_file", "file_hash", "config_hash",
+            "chunk_hashes": {chunk_id: content_hash}, "updated_at"
+        }}}
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 매니페스트 파일 경로
+        """
+        self.path = Path(path)
+        self.documents: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self):
+        """매니페스트 로드 (없거나 버전이 다르면 빈 상태로 시작)"""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Ignoring unreadable manifest {self.path}: {e}")
+            return
+
+        if data.get("version") != MANIFEST_VERSION:
+            print(f"⚠️  Manifest version mismatch, starting fresh: {self.path}")
+            return
+
+        self.documents = data.get("documents", {})
+
+    def get(self, document_id: str) -> Optional[Dict]:
+        """문서 항목 조회"""
+        return self.documents.get(document_id)
+
+    def is_unchanged(self, document_id: str, file_digest: str, config_digest: str) -> bool:
+        """파일과 설정이 모두 이전 처리와 같은지 확인"""
+        entry = self.documents.get(document_id)
+        return (
+            entry is not None
+            and entry.get("file_hash") == file_digest
+            and entry.get("config_hash") == config_digest
+        )
+
+    def update(
+        self,
+        document_id: str,
+        source_file: str,
+        file_digest: str,
+        config_digest: str,
+        chunk_hashes: Dict[str, str]
+    ):
+        """문서 항목 갱신 후 즉시 저장 (중간 실패 시에도 처리 완료분 유지)"""
+        self.documents[document_id] = {
+            "source_file": source_file,
+            "file_hash": file_digest,
+            "config_hash": config_digest,
+            "chunk_hashes": chunk_hashes,
+            "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self.save()
+
+    def save(self):
+        """임시 파일에 기록 후 교체"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "documents": self.documents},
+                f,
+                ensure_ascii=False,
+                indent=2
+            )
+        os.replace(tmp_path, self.path)
@@ -4,19 +4,187 @@
 """
 
 import json
+import multiprocessing
+import os
+import queue
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import asdict
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+from dataclasses import asdict, dataclass
 
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.utils.pdf_parser import PDFParser, PDFDocument
+from src.utils.pdf_parser import PDFParser, PDFDocument, PDFParseSession
 from src.utils.chunker import DocumentChunker, Chunk
 from src.utils.metadata_extractor import MetadataExtractor, DocumentMetadata
 from src.services.embedding_service import EmbeddingService
-from src.services.vector_store import MultiCollectionVectorStore
+from src.services.vector_store import (
+    MultiCollectionVectorStore,
+    UnifiedCollectionVectorStore,
+    content_hash,
+    make_point_id,
+)
+from src.core.manifest import IngestionManifest
+from src.utils.hashing import config_hash, file_hash
+from src.services.index_artifact import write_index_artifact, DEFAULT_INDEX_ARTIFACT_PATH
+
+
+@dataclass
+class ParsedDocument:
+    """파싱/청킹 결과 (워커 프로세스 → 임베딩/업로드 단계)"""
+    pdf_path: str
+    doc_metadata: DocumentMetadata
+    total_pages: int
+    total_chars: int
+    chunks: List[Chunk]
+    elapsed_seconds: float
+
+
+def chunk_base_metadata(doc_metadata: DocumentMetadata) -> Dict:
+    """모든 청크에 공통으로 들어가는 문서 메타데이터"""
+    return {
+        "document_id": doc_metadata.document_id,
+        "type": doc_metadata.type,
+        "language": doc_metadata.language,
+        "version": doc_metadata.version,
+        "source_file": doc_metadata.source_file,
+    }
+
+
+def chunk_record(chunk: Chunk) -> Dict:
+    """청크 JSON 저장 형식"""
+    return {
+        "chunk_id": chunk.chunk_id,
+        "text": chunk.text,
+        "metadata": chunk.metadata,
+        "char_count": chunk.char_count,
+        "token_count": chunk.token_count
+    }
+
+
+def parse_and_chunk(
+    pdf_path: str,
+    doc_metadata: DocumentMetadata,
+    chunking_strategy: str,
+    pdf_parser: PDFParser,
+    metadata_extractor: MetadataExtractor,
+    chunker: DocumentChunker,
+    file_digest: Optional[str] = None,
+    session: Optional[PDFParseSession] = None
+) -> ParsedDocument:
+    """PDF 파싱 + 청킹 (CPU 작업, 워커 프로세스에서도 실행, session이 있으면 열린 파일 재사용)"""
+    start_time = time.time()
+
+    # 2. PDF 파싱
+    print(f"\n2️⃣  Parsing PDF: {Path(pdf_path).name}")
+    if session is not None:
+        pdf_document = session.parse(extract_images=False)
+    else:
+        pdf_document = pdf_parser.parse(str(pdf_path), extract_images=False, file_digest=file_digest)
+    print(f"   - Pages: {pdf_document.total_pages}")
+    print(f"   - Language: {pdf_document.language}")
+
+    # 전체 텍스트 추출
+    full_text = "\n\n".join([page.text for page in pdf_document.pages])
+
+    # 메타데이터 보강
+    content_metadata = metadata_extractor.extract_from_content(
+        full_text,
+        doc_metadata
+    )
+
+    # 3. 청킹
+    print(f"\n3️⃣  Chunking with strategy: {chunking_strategy}...")
+    chunks = chunker.chunk_document(
+        text=full_text,
+        metadata=chunk_base_metadata(doc_metadata),
+        strategy=chunking_strategy
+    )
+    print(f"   - Generated {len(chunks)} chunks")
+    print(f"   - Avg chunk size: {sum(c.char_count for c in chunks) // len(chunks)} chars")
+
+    return ParsedDocument(
+        pdf_path=str(pdf_path),
+        doc_metadata=doc_metadata,
+        total_pages=pdf_document.total_pages,
+        total_chars=len(full_text),
+        chunks=chunks,
+        elapsed_seconds=time.time() - start_time
+    )
+
+
+# 워커 프로세스별 파서/청커 (프로세스당 1회 생성)
+_worker_components: Optional[Tuple[PDFParser, MetadataExtractor, DocumentChunker]] = None
+
+
+def _init_parse_worker(parser_options: Dict, chunker_options: Dict):
+    global _worker_components
+    _worker_components = (
+        PDFParser(**parser_options),
+        MetadataExtractor(),
+        DocumentChunker(**chunker_options)
+    )
+
+
+def _parse_in_worker(
+    pdf_path: str,
+    doc_metadata: DocumentMetadata,
+    chunking_strategy: str,
+    file_digest: Optional[str] = None
+) -> ParsedDocument:
+    pdf_parser, metadata_extractor, chunker = _worker_components
+    return parse_and_chunk(
+        pdf_path, doc_metadata, chunking_strategy, pdf_parser, metadata_extractor, chunker, file_digest
+    )
+
+
+# 스트리밍 스테이지 종료 표시
+_STREAM_END = object()
+
+
+def _stream_put(outbox: queue.Queue, item, stop: threading.Event) -> bool:
+    """큐가 가득 차면 대기 (다른 스테이지가 실패해 stop이 켜지면 포기)"""
+    while not stop.is_set():
+        try:
+            outbox.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _stream_get(inbox: queue.Queue, stop: threading.Event) -> Iterator:
+    """종료 표시가 올 때까지 큐 항목을 yield (stop이 켜지면 중단)"""
+    while not stop.is_set():
+        try:
+            item = inbox.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if item is _STREAM_END:
+            return
+        yield item
+
+
+def _run_stream_stage(
+    name: str,
+    produce: Callable[[], Iterable],
+    outbox: queue.Queue,
+    stop: threading.Event,
+    errors: List[Tuple[str, BaseException]]
+):
+    """스테이지 스레드 본체: produce()의 결과를 outbox로 넘기고 끝나면 종료 표시 전달"""
+    try:
+        for item in produce():
+            if not _stream_put(outbox, item, stop):
+                return
+    except BaseException as e:
+        errors.append((name, e))
+        stop.set()
+        return
+    _stream_put(outbox, _STREAM_END, stop)
 
 
 class DocumentProcessingPipeline:
@@ -35,15 +203,26 @@ class DocumentProcessingPipeline:
         self,
         embedding_service: EmbeddingService,
         vector_store: MultiCollectionVectorStore,
-        output_dir: str = "data/processed"
+        output_dir: str = "data/processed",
+        parse_workers: int = 1,
+        hybrid_extraction: bool = False,
+        parse_cache_dir: Optional[str] = None
     ):
         """
         Args:
             embedding_service: 임베딩 서비스
             vector_store: 벡터 스토어
             output_dir: 처리된 데이터 저장 디렉토리
+            parse_workers: 문서 하나의 페이지 추출 워커 프로세스 수
+            hybrid_extraction: PyMuPDF 우선 추출, 품질 미달 페이지만 레이아웃 모드
+            parse_cache_dir: 페이지 파싱 캐시 디렉토리 (None이면 미사용)
         """
-        self.pdf_parser = PDFParser(preserve_layout=True)
+        self.pdf_parser = PDFParser(
+            preserve_layout=True,
+            workers=parse_workers,
+            hybrid=hybrid_extraction,
+            cache_dir=parse_cache_dir
+        )
         self.metadata_extractor = MetadataExtractor()
         self.chunker = DocumentChunker(
             chunk_size=1000,
@@ -55,12 +234,42 @@ class DocumentProcessingPipeline:
         self.vector_store = vector_store
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # 매니페스트는 디스크 산출물(청크 JSON, 인덱스 아티팩트, 임베딩 캐시) 기준
+        # (벡터 스토어를 비웠다면 incremental=False로 전체 재처리)
+        self.manifest = IngestionManifest(self.output_dir / "manifest.json")
+        self.last_errors: List[Dict] = []
+
+        # 스트리밍 처리: 스테이지 간 큐 크기(배치 수)와 임베딩 배치당 청크 수
+        self.stream_queue_size = 4
+        self.stream_batch_size = 64
+
+    def _config_fingerprint(self, chunking_strategy: str) -> str:
+        """파서/청커/임베딩 설정 해시 (바뀌면 전체 재처리)"""
+        return config_hash({
+            "parser": {
+                "preserve_layout": self.pdf_parser.preserve_layout,
+                "hybrid": self.pdf_parser.hybrid,
+            },
+            "chunker": {
+                "strategy": chunking_strategy,
+                "chunk_size": self.chunker.chunk_size,
+                "chunk_overlap": self.chunker.chunk_overlap,
+                "min_chunk_size": self.chunker.min_chunk_size,
+                "max_chunk_size": self.chunker.max_chunk_size,
+            },
+            "embedding": {
+                "model": self.embedding_service.cache_key_model,
+                "dimension": self.embedding_service.dimension,
+            },
+        })
 
     def process_document(
         self,
         pdf_path: str,
         chunking_strategy: str = "recursive",
-        save_intermediate: bool = True
+        save_intermediate: bool = True,
+        incremental: bool = True,
+        streaming: bool = False
     ) -> Dict:
         """
         단일 문서 처리
@@ -69,6 +278,10 @@ class DocumentProcessingPipeline:
             pdf_path: PDF 파일 경로
             chunking_strategy: 청킹 전략
             save_intermediate: 중간 결과 저장 여부
+            incremental: 매니페스트 기준 증분 처리
+                         (파일/설정 동일 → 건너뜀, 변경 → 바뀐 청크만 임베딩/업서트)
+            streaming: 페이지 → 청킹 → 임베딩 → 업서트를 큐로 연결해 동시에 진행
+                       (대용량 문서도 메모리 일정, 임베딩과 파싱이 겹침)
 
         Returns:
             처리 결과 통계
@@ -80,6 +293,64 @@ class DocumentProcessingPipeline:
         print(f"📄 Processing: {pdf_path.name}")
         print(f"{'='*60}\n")
 
+        # 파일은 한 번만 열고 해시 계산/파싱이 같은 세션(매핑)을 공유
+        with self.pdf_parser.open(str(pdf_path)) as session:
+            doc_metadata, file_digest, config_digest, skipped_stats = self._check_document(
+                pdf_path, chunking_strategy, incremental, start_time, file_digest=session.file_digest
+            )
+            if skipped_stats:
+                return skipped_stats
+
+            if streaming:
+                return self._stream_document(
+                    pdf_path,
+                    doc_metadata,
+                    chunking_strategy,
+                    file_digest,
+                    config_digest,
+                    save_intermediate=save_intermediate,
+                    incremental=incremental,
+                    start_time=start_time,
+                    session=session
+                )
+
+            parsed = parse_and_chunk(
+                str(pdf_path),
+                doc_metadata,
+                chunking_strategy,
+                self.pdf_parser,
+                self.metadata_extractor,
+                self.chunker,
+                file_digest,
+                session=session
+            )
+
+        return self._store_document(
+            parsed,
+            file_digest,
+            config_digest,
+            save_intermediate=save_intermediate,
+            incremental=incremental,
+            start_time=start_time
+        )
+
+    def _check_document(
+        self,
+        pdf_path: Path,
+        chunking_strategy: str,
+        incremental: bool,
+        start_time: float,
+        file_digest: Optional[str] = None
+    ) -> Tuple[DocumentMetadata, str, str, Optional[Dict]]:
+        """
+        메타데이터 추출 + 증분 처리 판단
+
+        Args:
+            file_digest: 파일 내용 해시 (파싱 세션에서 이미 계산했으면 전달, 없으면 파일을 읽어 계산)
+
+        Returns:
+            (문서 메타데이터, 파일 해시, 설정 해시, 건너뛸 경우 통계 / 아니면 None)
+        """
         # 1. 메타데이터 추출
         print("1️⃣  Extracting metadata...")
         doc_metadata = self.metadata_extractor.extract_from_filename(str(pdf_path))
@@ -87,85 +358,121 @@ class DocumentProcessingPipeline:
         print(f"   - Type: {doc_metadata.type}")
         print(f"   - Language: {doc_metadata.language}")
 
-        # 2. PDF 파싱
-        print("\n2️⃣  Parsing PDF...")
-        pdf_document = self.pdf_parser.parse(str(pdf_path), extract_images=False)
-        print(f"   - Pages: {pdf_document.total_pages}")
-        print(f"   - Language: {pdf_document.language}")
+        # 증분 처리: 파일/설정이 그대로면 건너뜀
+        if file_digest is None:
+            file_digest = file_hash(str(pdf_path))
+        config_digest = self._config_fingerprint(chunking_strategy)
+
+        if (
+            incremental
+            and self.manifest.is_unchanged(doc_metadata.document_id, file_digest, config_digest)
+            and self._chunks_file(doc_metadata.document_id).exists()
+        ):
+            print("   ⏭️  Unchanged since last run, skipping")
+            previous = self.manifest.get(doc_metadata.document_id)
+            return doc_metadata, file_digest, config_digest, {
+                "document_id": doc_metadata.document_id,
+                "source_file": doc_metadata.source_file,
+                "type": doc_metadata.type,
+                "language": doc_metadata.language,
+                "total_chunks": len(previous["chunk_hashes"]),
+                "embedded_chunks": 0,
+                "skipped": True,
+                "processing_time_seconds": round(time.time() - start_time, 2),
+                "collection_name": self._collection_name(doc_metadata)
+            }
 
-        # 전체 텍스트 추출
-        full_text = "\n\n".join([page.text for page in pdf_document.pages])
+        return doc_metadata, file_digest, config_digest, None
 
-        # 메타데이터 보강
-        content_metadata = self.metadata_extractor.extract_from_content(
-            full_text,
-            doc_metadata
-        )
+    @staticmethod
+    def _collection_codes(doc_metadata: DocumentMetadata) -> Tuple[str, str]:
+        """문서 타입/언어 → 컬렉션 코드 (예: account_contact/korean → account/ko)"""
+        doc_type_short = doc_metadata.type.replace("_contact", "").replace("_memo", "").replace("_fulfillment", "").replace("_master", "")
+        lang_code = "ko" if doc_metadata.language == "korean" else "en"
+        return doc_type_short, lang_code
 
-        # 3. 청킹
-        print(f"\n3️⃣  Chunking with strategy: {chunking_strategy}...")
-        base_metadata = {
-            "document_id": doc_metadata.document_id,
-            "type": doc_metadata.type,
-            "language": doc_metadata.language,
-            "version": doc_metadata.version,
-            "source_file": doc_metadata.source_file,
-        }
+    def _collection_name(self, doc_metadata: DocumentMetadata) -> str:
+        doc_type_short, lang_code = self._collection_codes(doc_metadata)
+        return f"crm_{doc_type_short}_{lang_code}"
 
-        chunks = self.chunker.chunk_document(
-            text=full_text,
-            metadata=base_metadata,
-            strategy=chunking_strategy
-        )
-        print(f"   - Generated {len(chunks)} chunks")
-        print(f"   - Avg chunk size: {sum(c.char_count for c in chunks) // len(chunks)} chars")
+    def _store_document(
+        self,
+        parsed: ParsedDocument,
+        file_digest: str,
+        config_digest: str,
+        save_intermediate: bool,
+        incremental: bool,
+        start_time: float
+    ) -> Dict:
+        """청크 저장 → (바뀐 청크만) 임베딩 → 벡터 DB 업서트 → 매니페스트 갱신"""
+        doc_metadata = parsed.doc_metadata
+        chunks = parsed.chunks
+        doc_type_short, lang_code = self._collection_codes(doc_metadata)
 
         # 중간 결과 저장
         if save_intermediate:
             self._save_chunks(doc_metadata.document_id, chunks)
 
+        # 증분 처리: 설정이 같으면 이전과 동일한 청크(chunk_id + 내용 해시)는 재임베딩/업서트 생략
+        previous = self.manifest.get(doc_metadata.document_id)
+        chunk_hashes = {chunk.chunk_id: content_hash(chunk.text) for chunk in chunks}
+        if incremental and previous and previous.get("config_hash") == config_digest:
+            previous_hashes = previous.get("chunk_hashes", {})
+            changed_chunks = [
+                chunk for chunk in chunks
+                if previous_hashes.get(chunk.chunk_id) != chunk_hashes[chunk.chunk_id]
+            ]
+            print(f"   - Changed chunks: {len(changed_chunks)}/{len(chunks)}")
+        else:
+            changed_chunks = chunks
+
         # 4. 임베딩 생성
         print(f"\n4️⃣  Generating embeddings...")
-        chunk_texts = [chunk.text for chunk in chunks]
+        chunk_texts = [chunk.text for chunk in changed_chunks]
         embeddings = self.embedding_service.embed_batch(
             texts=chunk_texts,
-            batch_size=50,
-            show_progress=True
+            batch_size=512,  # 요청 크기는 토큰 예산 기준으로 결정
+            show_progress=True,
+            as_numpy=True
         )
         print(f"   - Generated {len(embeddings)} embeddings")
 
         # 5. 벡터 DB 저장
         print(f"\n5️⃣  Saving to vector database...")
 
-        # 벡터 DB용 데이터 준비
+        # 벡터 DB용 데이터 준비 (임베딩은 (N, dim) 행렬로 별도 전달)
         vector_chunks = []
-        for chunk, embedding in zip(chunks, embeddings):
+        for chunk in changed_chunks:
             vector_chunk = {
                 "chunk_id": chunk.chunk_id,
                 "text": chunk.text,
-                "embedding": embedding,
                 "metadata": chunk.metadata
             }
             vector_chunks.append(vector_chunk)
 
-        # 문서 타입과 언어에 맞는 컬렉션에 저장
-        doc_type_short = doc_metadata.type.replace("_contact", "").replace("_memo", "").replace("_fulfillment", "").replace("_master", "")
-        if doc_type_short == "account":
-            doc_type_short = "account"
-        elif doc_type_short == "meeting":
-            doc_type_short = "meeting"
-        elif doc_type_short == "order":
-            doc_type_short = "order"
-        elif doc_type_short == "common":
-            doc_type_short = "common"
-
-        lang_code = "ko" if doc_metadata.language == "korean" else "en"
-
-        self.vector_store.add_document_chunks(
+        if vector_chunks:
+            self.vector_store.add_document_chunks(
+                document_type=doc_type_short,
+                language=lang_code,
+                chunks=vector_chunks,
+                batch_size=100,
+                embeddings=embeddings
+            )
+
+        # 재처리 시 사라지거나 바뀐 청크의 이전 포인트 정리
+        self.vector_store.prune_document(
             document_type=doc_type_short,
             language=lang_code,
-            chunks=vector_chunks,
-            batch_size=100
+            document_id=doc_metadata.document_id,
+            keep_ids=[make_point_id(chunk.chunk_id, chunk.text) for chunk in chunks]
+        )
+
+        self.manifest.update(
+            doc_metadata.document_id,
+            source_file=doc_metadata.source_file,
+            file_digest=file_digest,
+            config_digest=config_digest,
+            chunk_hashes=chunk_hashes
         )
 
         # 처리 시간
@@ -177,9 +484,208 @@ class DocumentProcessingPipeline:
             "source_file": doc_metadata.source_file,
             "type": doc_metadata.type,
             "language": doc_metadata.language,
-            "total_pages": pdf_document.total_pages,
+            "total_pages": parsed.total_pages,
             "total_chunks": len(chunks),
-            "total_chars": len(full_text),
+            "embedded_chunks": len(changed_chunks),
+            "skipped": False,
+            "total_chars": parsed.total_chars,
+            "processing_time_seconds": round(elapsed_time, 2),
+            "collection_name": f"crm_{doc_type_short}_{lang_code}"
+        }
+
+        print(f"\n✅ Processing completed in {elapsed_time:.2f}s")
+        print(f"   - Saved to collection: crm_{doc_type_short}_{lang_code}")
+
+        return stats
+
+    def _stream_document(
+        self,
+        pdf_path: Path,
+        doc_metadata: DocumentMetadata,
+        chunking_strategy: str,
+        file_digest: str,
+        config_digest: str,
+        save_intermediate: bool,
+        incremental: bool,
+        start_time: float,
+        session: Optional[PDFParseSession] = None
+    ) -> Dict:
+        """
+        스트리밍 처리: 페이지 → 청킹 → 임베딩 → 업서트
+
+        파싱/청킹/임베딩은 각각 스레드 하나, 업서트는 호출 스레드에서 실행하고
+        스테이지 사이는 크기 제한 큐로 연결. 네트워크 대기(임베딩) 동안 다음 페이지를
+        파싱하고, 메모리에는 큐에 든 배치만 올라감 (청크 ID/해시만 끝까지 유지)
+        """
+        doc_type_short, lang_code = self._collection_codes(doc_metadata)
+        base_metadata = chunk_base_metadata(doc_metadata)
+
+        # 증분 처리: 설정이 같으면 이전과 동일한 청크는 재임베딩/업서트 생략
+        previous = self.manifest.get(doc_metadata.document_id)
+        previous_hashes = None
+        if incremental and previous and previous.get("config_hash") == config_digest:
+            previous_hashes = previous.get("chunk_hashes", {})
+
+        print(f"\n2️⃣  Streaming pages → chunks ({chunking_strategy}) → embeddings → vector database...")
+
+        stop = threading.Event()
+        errors: List[Tuple[str, BaseException]] = []
+        page_queue = queue.Queue(maxsize=self.stream_queue_size)
+        batch_queue = queue.Queue(maxsize=self.stream_queue_size)
+        embedded_queue = queue.Queue(maxsize=self.stream_queue_size)
+
+        page_stats = {"pages": 0, "chars": 0}
+        chunk_hashes: Dict[str, str] = {}
+        keep_ids: List[str] = []
+
+        def read_pages():
+            if session is not None:
+                pages = session.iter_pages()
+            else:
+                pages = self.pdf_parser.iter_pages(str(pdf_path), file_digest=file_digest)
+            for page in pages:
+                # parse_and_chunk의 "\n\n".join과 같은 길이 (페이지 사이 구분자 포함)
+                page_stats["chars"] += len(page.text) + (2 if page_stats["pages"] else 0)
+                page_stats["pages"] += 1
+                yield page.text
+
+        def chunk_batches():
+            batch = []
+            for chunk in self.chunker.chunk_stream(
+                _stream_get(page_queue, stop), base_metadata, chunking_strategy
+            ):
+                batch.append(chunk)
+                if len(batch) >= self.stream_batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        def embed_batches():
+            for batch in _stream_get(batch_queue, stop):
+                changed = []
+                for chunk in batch:
+                    digest = content_hash(chunk.text)
+                    chunk_hashes[chunk.chunk_id] = digest
+                    keep_ids.append(make_point_id(chunk.chunk_id, chunk.text))
+                    if previous_hashes is None or previous_hashes.get(chunk.chunk_id) != digest:
+                        changed.append(chunk)
+
+                embeddings = None
+                if changed:
+                    embeddings = self.embedding_service.embed_batch(
+                        texts=[chunk.text for chunk in changed],
+                        batch_size=512,
+                        show_progress=False,
+                        as_numpy=True
+                    )
+                yield batch, changed, embeddings
+
+        stages = [
+            ("parse", read_pages, page_queue),
+            ("chunk", chunk_batches, batch_queue),
+            ("embed", embed_batches, embedded_queue),
+        ]
+        threads = [
+            threading.Thread(
+                target=_run_stream_stage,
+                args=(name, produce, outbox, stop, errors),
+                name=f"ingest-{name}",
+                daemon=True
+            )
+            for name, produce, outbox in stages
+        ]
+        for thread in threads:
+            thread.start()
+
+        # 중간 결과는 임시 파일에 배치 단위로 기록 후 성공 시 교체
+        chunks_file = self._chunks_file(doc_metadata.document_id)
+        tmp_file = chunks_file.with_suffix(".json.tmp")
+        writer = open(tmp_file, 'w', encoding='utf-8') if save_intermediate else None
+
+        total_chunks = 0
+        embedded_chunks = 0
+        try:
+            if writer:
+                writer.write("[")
+            for batch, changed, embeddings in _stream_get(embedded_queue, stop):
+                if writer:
+                    for chunk in batch:
+                        record = json.dumps(chunk_record(chunk), ensure_ascii=False, indent=2)
+                        writer.write(("," if total_chunks else "") + "\n  " + record.replace("\n", "\n  "))
+                        total_chunks += 1
+                else:
+                    total_chunks += len(batch)
+
+                if changed:
+                    self.vector_store.add_document_chunks(
+                        document_type=doc_type_short,
+                        language=lang_code,
+                        chunks=[
+                            {"chunk_id": chunk.chunk_id, "text": chunk.text, "metadata": chunk.metadata}
+                            for chunk in changed
+                        ],
+                        batch_size=100,
+                        embeddings=embeddings
+                    )
+                    embedded_chunks += len(changed)
+            if writer:
+                writer.write("\n]" if total_chunks else "]")
+        except BaseException as e:
+            errors.append(("upsert", e))
+        finally:
+            if errors:
+                stop.set()
+            for thread in threads:
+                thread.join()
+            if writer:
+                writer.close()
+
+        if errors:
+            if writer:
+                tmp_file.unlink(missing_ok=True)
+            stage, error = errors[0]
+            print(f"   ❌ Streaming stage '{stage}' failed: {error}")
+            raise error
+
+        if writer:
+            os.replace(tmp_file, chunks_file)
+            print(f"   💾 Saved chunks to: {chunks_file}")
+
+        print(f"   - Pages: {page_stats['pages']}")
+        print(f"   - Generated {total_chunks} chunks")
+        if previous_hashes is not None:
+            print(f"   - Changed chunks: {embedded_chunks}/{total_chunks}")
+        print(f"   - Generated {embedded_chunks} embeddings")
+
+        # 재처리 시 사라지거나 바뀐 청크의 이전 포인트 정리
+        self.vector_store.prune_document(
+            document_type=doc_type_short,
+            language=lang_code,
+            document_id=doc_metadata.document_id,
+            keep_ids=keep_ids
+        )
+
+        self.manifest.update(
+            doc_metadata.document_id,
+            source_file=doc_metadata.source_file,
+            file_digest=file_digest,
+            config_digest=config_digest,
+            chunk_hashes=chunk_hashes
+        )
+
+        elapsed_time = time.time() - start_time
+
+        stats = {
+            "document_id": doc_metadata.document_id,
+            "source_file": doc_metadata.source_file,
+            "type": doc_metadata.type,
+            "language": doc_metadata.language,
+            "total_pages": page_stats["pages"],
+            "total_chunks": total_chunks,
+            "embedded_chunks": embedded_chunks,
+            "skipped": False,
+            "total_chars": page_stats["chars"],
             "processing_time_seconds": round(elapsed_time, 2),
             "collection_name": f"crm_{doc_type_short}_{lang_code}"
         }
@@ -193,7 +699,10 @@ class DocumentProcessingPipeline:
         self,
         folder_path: str,
         chunking_strategy: str = "recursive",
-        file_pattern: str = "*.pdf"
+        file_pattern: str = "*.pdf",
+        incremental: bool = True,
+        max_workers: int = 1,
+        streaming: bool = False
     ) -> List[Dict]:
         """
         폴더 내 모든 PDF 처리
@@ -202,6 +711,9 @@ class DocumentProcessingPipeline:
             folder_path: PDF 폴더 경로
             chunking_strategy: 청킹 전략
             file_pattern: 파일 패턴
+            incremental: 변경 없는 파일 건너뛰기 / 바뀐 청크만 재임베딩
+            max_workers: 파싱/청킹 워커 프로세스 수 (1이면 순차 처리)
+            streaming: 순차 처리 시 문서별 스트리밍 처리 (process_document 참고)
 
         Returns:
             각 문서의 처리 결과 통계 리스트
@@ -214,6 +726,49 @@ class DocumentProcessingPipeline:
         print(f"   Found {len(pdf_files)} PDF files")
         print(f"{'='*60}")
 
+        if max_workers > 1 and len(pdf_files) > 1:
+            all_stats, errors = self._process_files_parallel(
+                pdf_files, chunking_strategy, incremental, max_workers
+            )
+        else:
+            all_stats, errors = self._process_files_sequential(
+                pdf_files, chunking_strategy, incremental, streaming
+            )
+
+        # 최종 요약
+        print(f"\n{'='*60}")
+        print(f"📊 Processing Summary")
+        print(f"{'='*60}")
+        print(f"✅ Successfully processed: {len(all_stats)}")
+        print(f"❌ Failed: {len(errors)}")
+        if all_stats:
+            total_chunks = sum(s["total_chunks"] for s in all_stats)
+            embedded_chunks = sum(s["embedded_chunks"] for s in all_stats)
+            skipped = sum(1 for s in all_stats if s["skipped"])
+            total_time = sum(s["processing_time_seconds"] for s in all_stats)
+            print(f"⏭️  Unchanged (skipped): {skipped}")
+            print(f"📦 Total chunks: {total_chunks} (re-embedded: {embedded_chunks})")
+            print(f"⏱️  Total time: {total_time:.2f}s")
+
+        if errors:
+            print(f"\n❌ Errors:")
+            for error in errors:
+                print(f"   - {error['file']}: {error['error']}")
+
+        # 결과 저장
+        self.last_errors = errors
+        self._save_processing_report(all_stats, errors)
+
+        return all_stats
+
+    def _process_files_sequential(
+        self,
+        pdf_files: List[Path],
+        chunking_strategy: str,
+        incremental: bool,
+        streaming: bool = False
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """파일을 하나씩 처리"""
         all_stats = []
         errors = []
 
@@ -223,7 +778,9 @@ class DocumentProcessingPipeline:
                 stats = self.process_document(
                     pdf_path=str(pdf_file),
                     chunking_strategy=chunking_strategy,
-                    save_intermediate=True
+                    save_intermediate=True,
+                    incremental=incremental,
+                    streaming=streaming
                 )
                 all_stats.append(stats)
             except Exception as e:
@@ -234,42 +791,149 @@ class DocumentProcessingPipeline:
                 errors.append(error_info)
                 print(f"\n❌ Error processing {pdf_file.name}: {e}")
 
-        # 최종 요약
-        print(f"\n{'='*60}")
-        print(f"📊 Processing Summary")
-        print(f"{'='*60}")
-        print(f"✅ Successfully processed: {len(all_stats)}")
-        print(f"❌ Failed: {len(errors)}")
-        if all_stats:
-            total_chunks = sum(s["total_chunks"] for s in all_stats)
-            total_time = sum(s["processing_time_seconds"] for s in all_stats)
-            print(f"📦 Total chunks: {total_chunks}")
-            print(f"⏱️  Total time: {total_time:.2f}s")
+        return all_stats, errors
 
-        if errors:
-            print(f"\n❌ Errors:")
-            for error in errors:
-                print(f"   - {error['file']}: {error['error']}")
+    def _process_files_parallel(
+        self,
+        pdf_files: List[Path],
+        chunking_strategy: str,
+        incremental: bool,
+        max_workers: int
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        워커 프로세스에서 파싱/청킹, 메인 프로세스에서 임베딩/업로드
 
-        # 결과 저장
-        self._save_processing_report(all_stats, errors)
+        임베딩 서비스(캐시, 속도 제한)와 벡터 스토어는 메인 프로세스 하나만 사용하고,
+        먼저 끝난 문서부터 임베딩하므로 파싱과 임베딩이 겹쳐 진행됨
+        """
+        stats_by_file: Dict[str, Dict] = {}
+        errors = []
+        pending = []
 
-        return all_stats
+        # 메타데이터/증분 판단은 가벼우므로 메인 프로세스에서 먼저 처리
+        for pdf_file in pdf_files:
+            try:
+                start_time = time.time()
+                doc_metadata, file_digest, config_digest, skipped_stats = self._check_document(
+                    pdf_file, chunking_strategy, incremental, start_time
+                )
+                if skipped_stats:
+                    stats_by_file[pdf_file.name] = skipped_stats
+                else:
+                    pending.append((pdf_file, doc_metadata, file_digest, config_digest))
+            except Exception as e:
+                errors.append({"file": pdf_file.name, "error": str(e)})
+                print(f"\n❌ Error processing {pdf_file.name}: {e}")
+
+        if pending:
+            workers = min(max_workers, len(pending), os.cpu_count() or 1)
+            print(f"\n⚙️  Parsing {len(pending)} documents with {workers} worker processes")
+
+            parser_options = {
+                "preserve_layout": self.pdf_parser.preserve_layout,
+                "hybrid": self.pdf_parser.hybrid,
+                "cache_dir": str(self.pdf_parser.cache.cache_dir) if self.pdf_parser.cache else None,
+            }
+            chunker_options = {
+                "chunk_size": self.chunker.chunk_size,
+                "chunk_overlap": self.chunker.chunk_overlap,
+                "min_chunk_size": self.chunker.min_chunk_size,
+                "max_chunk_size": self.chunker.max_chunk_size,
+            }
+
+            # spawn: 메인 프로세스의 임베딩 스레드 풀 상태를 fork로 복제하지 않음
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parse_worker,
+                initargs=(parser_options, chunker_options)
+            ) as executor:
+                futures = {
+                    executor.submit(_parse_in_worker, str(pdf_file), doc_metadata, chunking_strategy, file_digest):
+                        (pdf_file, file_digest, config_digest)
+                    for pdf_file, doc_metadata, file_digest, config_digest in pending
+                }
+
+                for future in as_completed(futures):
+                    pdf_file, file_digest, config_digest = futures[future]
+                    try:
+                        parsed = future.result()
+                        print(f"\n📄 Storing: {pdf_file.name}")
+                        stats_by_file[pdf_file.name] = self._store_document(
+                            parsed,
+                            file_digest,
+                            config_digest,
+                            save_intermediate=True,
+                            incremental=incremental,
+                            start_time=time.time() - parsed.elapsed_seconds
+                        )
+                    except Exception as e:
+                        errors.append({"file": pdf_file.name, "error": str(e)})
+                        print(f"\n❌ Error processing {pdf_file.name}: {e}")
+
+        # 입력 파일 순서로 통계 정렬
+        all_stats = [stats_by_file[f.name] for f in pdf_files if f.name in stats_by_file]
+        return all_stats, errors
+
+    def export_index_artifact(self, output_path: str = DEFAULT_INDEX_ARTIFACT_PATH) -> Dict:
+        """
+        저장된 청크 JSON으로 사전 빌드 인덱스 아티팩트 생성
+
+        앱과 동일하게 파일 이름으로 컬렉션을 구분 (예: crm_account_ko_v1_0 -> crm_account_ko)
+        임베딩은 처리 중 저장된 캐시에서만 가져옴 (API 재호출 없음)
+
+        Args:
+            output_path: 아티팩트 파일 경로
+
+        Returns:
+            아티팩트 헤더 정보
+
+        Raises:
+            ValueError: 임베딩 캐시가 꺼져 있거나 캐시에 없는 청크가 있을 때
+        """
+        if not self.embedding_service.cache_enabled:
+            raise ValueError("Index artifact is built from the embedding cache, which is disabled")
+
+        print(f"\n📦 Building index artifact from: {self.output_dir}")
+
+        chunks_by_collection = {}
+        for json_file in sorted(self.output_dir.glob("*_chunks.json")):
+            with open(json_file, 'r', encoding='utf-8') as f:
+                chunks = json.load(f)
+
+            doc_id = json_file.stem.replace('_chunks', '')
+            parts = doc_id.split('_')
+            collection_name = f"{parts[0]}_{parts[1]}_{parts[2]}" if len(parts) >= 4 else doc_id
+            chunks_by_collection.setdefault(collection_name, []).extend(chunks)
+
+        collections = {}
+        for collection_name, chunks in chunks_by_collection.items():
+            embeddings = self.embedding_service.get_cached_batch(
+                [chunk["text"] for chunk in chunks],
+                as_numpy=True
+            )
+            if embeddings is None:
+                raise ValueError(
+                    f"Missing cached embeddings for {collection_name}; reprocess with --full"
+                )
+            collections[collection_name] = (chunks, embeddings)
+
+        return write_index_artifact(
+            output_path,
+            collections,
+            model=self.embedding_service.cache_key_model,
+            dimension=self.embedding_service.dimension
+        )
+
+    def _chunks_file(self, document_id: str) -> Path:
+        """문서별 청크 JSON 경로"""
+        return self.output_dir / f"{document_id}_chunks.json"
 
     def _save_chunks(self, document_id: str, chunks: List[Chunk]):
         """청크를 JSON 파일로 저장"""
-        output_file = self.output_dir / f"{document_id}_chunks.json"
+        output_file = self._chunks_file(document_id)
 
-        chunks_data = []
-        for chunk in chunks:
-            chunk_data = {
-                "chunk_id": chunk.chunk_id,
-                "text": chunk.text,
-                "metadata": chunk.metadata,
-                "char_count": chunk.char_count,
-                "token_count": chunk.token_count
-            }
-            chunks_data.append(chunk_data)
+        chunks_data = [chunk_record(chunk) for chunk in chunks]
 
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(chunks_data, f, ensure_ascii=False, indent=2)
@@ -294,13 +958,28 @@ class DocumentProcessingPipeline:
 
         print(f"\n💾 Report saved to: {report_file}")
 
+    def close(self):
+        """파서의 페이지 추출 프로세스 풀 종료 (with 문 종료 시 자동 호출)"""
+        self.pdf_parser.close()
+
+    def __enter__(self) -> "DocumentProcessingPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
 
 def create_pipeline(
     openai_api_key: str,
     qdrant_host: str = "localhost",
     qdrant_port: int = 6333,
     vector_size: int = 3072,
-    use_memory: bool = False
+    use_memory: bool = False,
+    dimension_strategy: str = "truncate",
+    layout: str = "multi",
+    parse_workers: int = 1,
+    hybrid_extraction: bool = False,
+    parse_cache_dir: Optional[str] = None
 ) -> DocumentProcessingPipeline:
     """
     파이프라인 생성 헬퍼 함수
@@ -309,8 +988,13 @@ def create_pipeline(
         openai_api_key: OpenAI API 키
         qdrant_host: Qdrant 호스트
         qdrant_port: Qdrant 포트
-        vector_size: 벡터 차원
+        vector_size: 벡터 차원 (3072 미만이면 Matryoshka 차원 축소)
         use_memory: 메모리 모드 사용 (Docker 없을 때)
+        dimension_strategy: 차원 축소 방식 ("truncate" 또는 "api")
+        layout: 벡터 DB 레이아웃 ("multi": 8개 컬렉션, "unified": 단일 컬렉션)
+        parse_workers: PDF 페이지 추출 워커 프로세스 수 (1이면 순차 추출)
+        hybrid_extraction: PyMuPDF 우선 추출 + 품질 미달 페이지만 pdfplumber 레이아웃 모드
+        parse_cache_dir: 페이지 파싱 캐시 디렉토리 (None이면 미사용)
 
     Returns:
         DocumentProcessingPipeline 인스턴스
@@ -319,7 +1003,9 @@ def create_pipeline(
     embedding_service = EmbeddingService(
         model_name="openai/text-embedding-3-large",
         api_key=openai_api_key,
-        cache_enabled=True
+        cache_enabled=True,
+        output_dimension=vector_size,
+        dimension_strategy=dimension_strategy
     )
 
     # 벡터 스토어 초기화 (자동으로 연결 시도)
@@ -327,7 +1013,8 @@ def create_pipeline(
         if use_memory:
             raise ConnectionError("Memory mode requested")
 
-        vector_store = MultiCollectionVectorStore(
+        store_class = UnifiedCollectionVectorStore if layout == "unified" else MultiCollectionVectorStore
+        vector_store = store_class(
             host=qdrant_host,
             port=qdrant_port
         )
@@ -355,15 +1042,24 @@ def create_pipeline(
                         )
                         self.collections[collection_name] = True
 
-            def add_document_chunks(self, document_type, language, chunks, batch_size=100):
+            def add_document_chunks(self, document_type, language, chunks, batch_size=100, embeddings=None,
+                                    replace_documents=False):
                 collection_name = f"crm_{document_type}_{language}"
                 self.store.add_documents(
                     collection_name=collection_name,
                     chunks=chunks,
-                    batch_size=batch_size
+                    batch_size=batch_size,
+                    embeddings=embeddings,
+                    replace_documents=replace_documents
                 )
 
-        vector_store = MemoryMultiCollectionVectorStore(vector_store_memory)
+            def prune_document(self, document_type, language, document_id, keep_ids):
+                self.store.delete_stale_points(f"crm_{document_type}_{language}", document_id, keep_ids)
+
+        if layout == "unified":
+            vector_store = UnifiedCollectionVectorStore(store=vector_store_memory)
+        else:
+            vector_store = MemoryMultiCollectionVectorStore(vector_store_memory)
 
     # 컬렉션 생성
     vector_store.initialize_crm_collections(
@@ -374,7 +1070,10 @@ def create_pipeline(
     # 파이프라인 생성
     pipeline = DocumentProcessingPipeline(
         embedding_service=embedding_service,
-        vector_store=vector_store
+        vector_store=vector_store,
+        parse_workers=parse_workers,
+        hybrid_extraction=hybrid_extraction,
+        parse_cache_dir=parse_cache_dir
     )
 
     return pipeline
@@ -401,15 +1100,16 @@ if __name__ == "__main__":
     )
 
     # 테스트: 단일 파일 처리
-    if len(sys.argv) > 1:
-        pdf_path = sys.argv[1]
-        if Path(pdf_path).is_file():
-            stats = pipeline.process_document(pdf_path)
-            print(f"\n✅ Processing complete!")
-            print(json.dumps(stats, indent=2, ensure_ascii=False))
-        elif Path(pdf_path).is_dir():
-            stats = pipeline.process_folder(pdf_path)
+    with pipeline:
+        if len(sys.argv) > 1:
+            pdf_path = sys.argv[1]
+            if Path(pdf_path).is_file():
+                stats = pipeline.process_document(pdf_path)
+                print(f"\n✅ Processing complete!")
+                print(json.dumps(stats, indent=2, ensure_ascii=False))
+            elif Path(pdf_path).is_dir():
+                stats = pipeline.process_folder(pdf_path)
+            else:
+                print(f"❌ Path not found: {pdf_path}")
         else:
-            print(f"❌ Path not found: {pdf_path}")
-    else:
-        print("Usage: python pipeline.py <pdf_file_or_folder>")
+            print("Usage: python pipeline.py <pdf_file_or_folder>")
@@ -0,0 +1,102 @@
+"""
+임베딩 배치 플래너
+- 텍스트 개수가 아닌 토큰 수 기준으로 요청 단위 구성
+- 요청당 토큰 예산 대비 채움 비율 리포트
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Callable
+
+from ..utils.token_estimator import estimate_tokens
+
+# Optional: tiktoken for exact token counts
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+    tiktoken = None
+
+
+@dataclass
+class EmbeddingBatch:
+    """단일 임베딩 요청 단위"""
+    indices: List[int] = field(default_factory=list)
+    token_count: int = 0
+
+
+def get_token_counter(use_tokenizer: bool = True) -> Callable[[str], int]:
+    """
+    토큰 카운터 반환
+
+    tiktoken이 설치되어 있으면 cl100k_base(text-embedding-3 계열) 사용,
+    없으면 문자 기반 휴리스틱 사용
+    """
+    if use_tokenizer and TIKTOKEN_AVAILABLE:
+        encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    return estimate_tokens
+
+
+def plan_token_batches(
+    token_counts: List[int],
+    max_tokens_per_request: int,
+    max_items_per_request: int = 2048
+) -> List[EmbeddingBatch]:
+    """
+    토큰 수 기준 배치 구성 (First-Fit Decreasing)
+
+    긴 텍스트부터 배치에 채워 넣어 요청당 토큰 예산을 최대한 채움.
+    예산보다 큰 텍스트는 단독 배치로 구성
+
+    Args:
+        token_counts: 텍스트별 토큰 수
+        max_tokens_per_request: 요청당 최대 토큰 수
+        max_items_per_request: 요청당 최대 텍스트 수
+
+    Returns:
+        배치 리스트 (각 배치의 indices는 오름차순)
+    """
+    order = sorted(range(len(token_counts)), key=lambda i: token_counts[i], reverse=True)
+
+    batches: List[EmbeddingBatch] = []
+    for i in order:
+        tokens = max(1, token_counts[i])
+        target = None
+        for batch in batches:
+            if (batch.token_count + tokens <= max_tokens_per_request
+                    and len(batch.indices) < max_items_per_request):
+                target = batch
+                break
+
+        if target is None:
+            target = EmbeddingBatch()
+            batches.append(target)
+
+        target.indices.append(i)
+        target.token_count += tokens
+
+    for batch in batches:
+        batch.indices.sort()
+    batches.sort(key=lambda b: b.indices[0])
+
+    return batches
+
+
+def summarize_batches(
+    batches: List[EmbeddingBatch],
+    max_tokens_per_request: int
+) -> Dict:
+    """배치별 토큰 예산 채움 비율 요약"""
+    if not batches:
+        return {"requests": 0, "total_tokens": 0, "avg_fill": 0.0, "min_fill": 0.0}
+
+    fills = [min(1.0, b.token_count / max_tokens_per_request) for b in batches]
+    return {
+        "requests": len(batches),
+        "total_tokens": sum(b.token_count for b in batches),
+        "avg_items": sum(len(b.indices) for b in batches) / len(batches),
+        "avg_fill": sum(fills) / len(fills),
+        "min_fill": min(fills),
+        "fills": fills,
+    }
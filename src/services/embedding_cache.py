@@ -0,0 +1,453 @@
+"""
+임베딩 캐시 모듈
+- JSON 파일 기반 캐시 (벡터당 파일 1개, 레거시)
+- 세그먼트 바이너리 파일 + mmap 기반 packed 캐시
+- 프로세스 내 메모리 LRU 캐시 (바이트 크기 기반 제거)
+
+모든 캐시는 float32 NumPy 배열을 반환하고, 저장 시 리스트/배열을 모두 받음
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Dict, Optional, Literal, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없음 (단일 프로세스 사용 전제)
+    fcntl = None
+
+Vector = Union[List[float], np.ndarray]
+
+
+class EmbeddingCache:
+    """임베딩 캐시 (로컬 파일 기반)"""
+
+    def __init__(self, cache_dir: str = "data/embeddings"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _get_cache_key(self, text: str, model: str) -> str:
+        """캐시 키 생성"""
+        content = f"{model}:{text}"
+        return hashlib.md5(content.encode()).hexdigest()
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        """캐시에서 임베딩 조회"""
+        cache_key = self._get_cache_key(text, model)
+        cache_file = self.cache_dir / f"{cache_key}.json"
+
+        if cache_file.exists():
+            with open(cache_file, 'r') as f:
+                data = json.load(f)
+                return np.asarray(data["embedding"], dtype=np.float32)
+        return None
+
+    def set(self, text: str, model: str, embedding: Vector):
+        """캐시에 임베딩 저장"""
+        cache_key = self._get_cache_key(text, model)
+        cache_file = self.cache_dir / f"{cache_key}.json"
+
+        with open(cache_file, 'w') as f:
+            json.dump({
+                "text": text[:100],  # 처음 100자만 저장 (참고용)
+                "model": model,
+                "embedding": [float(x) for x in embedding],
+                "timestamp": time.time()
+            }, f)
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[np.ndarray]]:
+        """여러 텍스트의 임베딩 일괄 조회 (없으면 None)"""
+        return [self.get(text, model) for text in texts]
+
+    def set_many(self, texts: List[str], model: str, embeddings: Sequence[Vector]):
+        """여러 임베딩 일괄 저장"""
+        for text, embedding in zip(texts, embeddings):
+            self.set(text, model, embedding)
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for cache_file in self.cache_dir.glob("*.json"):
+            cache_file.unlink()
+
+
+class PackedEmbeddingCache:
+    """
+    Packed 임베딩 캐시 (세그먼트 바이너리 파일 + mmap)
+
+    디스크 구조 (cache_dir/packed/):
+    - seg_00000.bin, seg_00001.bin, ...: float32 벡터를 이어 붙인 세그먼트
+    - index.bin: 고정 길이 레코드 (md5 16B, segment u32, offset u64, dim u32)
+
+    - 시작 시 인덱스 파일 1회 읽기 + 세그먼트당 mmap 1회
+    - 벡터당 디스크 사용량 ≈ 4 bytes × dim (JSON 대비 약 1/5)
+    - 레거시 JSON 캐시가 있으면 최초 1회 자동 변환
+    """
+
+    INDEX_RECORD = struct.Struct("<16sIQI")
+    INDEX_FILE = "index.bin"
+    SEGMENT_PATTERN = "seg_{:05d}.bin"
+
+    def __init__(
+        self,
+        cache_dir: str = "data/embeddings",
+        segment_max_bytes: int = 256 * 1024 * 1024,
+        migrate_legacy: bool = True
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (레거시 JSON 캐시와 동일 위치)
+            segment_max_bytes: 세그먼트 파일 최대 크기 (초과 시 새 세그먼트)
+            migrate_legacy: 레거시 JSON 캐시 자동 변환 여부
+        """
+        self.cache_dir = Path(cache_dir)
+        self.pack_dir = self.cache_dir / "packed"
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_max_bytes = segment_max_bytes
+
+        self._lock = threading.RLock()
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._files: Dict[int, object] = {}
+
+        self._load_index()
+        self._active_segment = self._find_active_segment()
+
+        if migrate_legacy and not self._index:
+            self.migrate_from_json(self.cache_dir)
+
+    def _get_cache_key(self, text: str, model: str) -> bytes:
+        """캐시 키 생성 (EmbeddingCache와 동일한 md5, 바이너리 형태)"""
+        content = f"{model}:{text}"
+        return hashlib.md5(content.encode()).digest()
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.pack_dir / self.SEGMENT_PATTERN.format(segment)
+
+    def _load_index(self):
+        """인덱스 파일을 한 번에 읽어 key → (segment, offset, dim) 구성"""
+        index_file = self.pack_dir / self.INDEX_FILE
+        if not index_file.exists():
+            return
+
+        data = index_file.read_bytes()
+        record_size = self.INDEX_RECORD.size
+        valid_size = len(data) - (len(data) % record_size)
+
+        # 쓰기 도중 중단되어 잘린 마지막 레코드는 버림
+        if valid_size != len(data):
+            with open(index_file, 'r+b') as f:
+                f.truncate(valid_size)
+
+        segment_sizes: Dict[int, int] = {}
+        for key, segment, offset, dim in self.INDEX_RECORD.iter_unpack(data[:valid_size]):
+            if segment not in segment_sizes:
+                path = self._segment_path(segment)
+                segment_sizes[segment] = path.stat().st_size if path.exists() else 0
+            # 세그먼트에 실제로 기록되지 않은 벡터는 무시
+            if offset + dim * 4 <= segment_sizes[segment]:
+                self._index[key] = (segment, offset, dim)
+
+    def _find_active_segment(self) -> int:
+        """append 대상 세그먼트 번호"""
+        segments = sorted(
+            int(p.stem.split("_")[1]) for p in self.pack_dir.glob("seg_*.bin")
+        )
+        return segments[-1] if segments else 0
+
+    def _get_map(self, segment: int, required_size: int) -> Optional[mmap.mmap]:
+        """세그먼트 mmap 반환 (append로 커진 경우 재매핑)"""
+        current = self._maps.get(segment)
+        if current is not None and len(current) >= required_size:
+            return current
+
+        if current is not None:
+            current.close()
+            self._maps.pop(segment)
+
+        f = self._files.get(segment)
+        if f is None:
+            path = self._segment_path(segment)
+            if not path.exists():
+                return None
+            f = open(path, 'rb')
+            self._files[segment] = f
+
+        # 빈 파일은 mmap 불가
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+
+        self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[segment]
+
+    def _read(self, segment: int, offset: int, dim: int) -> Optional[np.ndarray]:
+        end = offset + dim * 4
+        segment_map = self._get_map(segment, end)
+        if segment_map is None or len(segment_map) < end:
+            return None
+        return np.frombuffer(segment_map, dtype=np.float32, count=dim, offset=offset).copy()
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        """캐시에서 임베딩 조회"""
+        key = self._get_cache_key(text, model)
+        with self._lock:
+            location = self._index.get(key)
+            if location is None:
+                return None
+            return self._read(*location)
+
+    def set(self, text: str, model: str, embedding: Vector):
+        """캐시에 임베딩 저장 (세그먼트 append + 인덱스 레코드 append)"""
+        key = self._get_cache_key(text, model)
+        vector = np.asarray(embedding, dtype=np.float32)
+        self._append([(key, vector)])
+
+    def get_many(self, texts: List[str], model: str) -> List[Optional[np.ndarray]]:
+        """
+        여러 텍스트의 임베딩 일괄 조회
+
+        키를 한 번에 해싱하고, 인덱스 조회 후 세그먼트·오프셋 순으로 읽음
+
+        Returns:
+            입력 순서대로 임베딩 (없으면 None)
+        """
+        keys = [self._get_cache_key(text, model) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+
+        with self._lock:
+            locations = [
+                (self._index[key], i) for i, key in enumerate(keys) if key in self._index
+            ]
+            locations.sort()
+            for (segment, offset, dim), i in locations:
+                results[i] = self._read(segment, offset, dim)
+
+        return results
+
+    def set_many(self, texts: List[str], model: str, embeddings: Sequence[Vector]):
+        """
+        여러 임베딩 일괄 저장
+
+        세그먼트에 벡터를 한 번에 기록한 뒤 인덱스 레코드를 단일 write로 추가.
+        중간에 중단되면 인덱스에 반영되지 않은 벡터는 다음 로드 시 무시됨
+        """
+        items = []
+        seen = set()
+        for text, embedding in zip(texts, embeddings):
+            key = self._get_cache_key(text, model)
+            if key in seen or key in self._index:
+                continue
+            seen.add(key)
+            items.append((key, np.asarray(embedding, dtype=np.float32)))
+
+        if items:
+            self._append(items)
+
+    def _append(self, items: List[Tuple[bytes, np.ndarray]]):
+        """
+        벡터 데이터를 먼저 기록하고, 이후 인덱스 레코드를 기록
+
+        앱과 야간 처리 등 여러 프로세스가 같은 캐시 디렉토리에 쓰므로, 세그먼트 파일에
+        배타적 flock을 건 상태에서 파일 끝 위치를 오프셋으로 쓰고 인덱스까지 기록
+        """
+        data = b"".join(vector.tobytes() for _, vector in items)
+
+        with self._lock:
+            segment = self._active_segment
+            while True:
+                with open(self._segment_path(segment), 'ab') as f:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                    try:
+                        # 잠금 이후의 파일 끝 (다른 프로세스가 그 사이 추가했을 수 있음)
+                        f.seek(0, os.SEEK_END)
+                        offset = f.tell()
+                        if offset >= self.segment_max_bytes:
+                            segment += 1
+                            continue
+
+                        records = []
+                        locations = []
+                        for key, vector in items:
+                            records.append(self.INDEX_RECORD.pack(key, segment, offset, vector.shape[0]))
+                            locations.append((key, (segment, offset, vector.shape[0])))
+                            offset += vector.nbytes
+
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+
+                        with open(self.pack_dir / self.INDEX_FILE, 'ab') as index_file:
+                            index_file.write(b"".join(records))
+                    finally:
+                        if fcntl is not None:
+                            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                break
+
+            self._active_segment = segment
+            self._index.update(locations)
+
+    def migrate_from_json(self, json_dir: Path) -> int:
+        """
+        레거시 JSON 캐시(EmbeddingCache)를 packed 형식으로 변환
+
+        Returns:
+            변환된 벡터 수
+        """
+        json_files = list(Path(json_dir).glob("*.json"))
+        if not json_files:
+            return 0
+
+        items = []
+        for cache_file in json_files:
+            try:
+                with open(cache_file, 'r') as f:
+                    data = json.load(f)
+                key = bytes.fromhex(cache_file.stem)
+                items.append((key, np.asarray(data["embedding"], dtype=np.float32)))
+            except (ValueError, KeyError, json.JSONDecodeError):
+                continue
+
+        if items:
+            self._append(items)
+            print(f"📦 Migrated {len(items)} cached embeddings to packed cache")
+        return len(items)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self):
+        """mmap 및 파일 핸들 해제"""
+        with self._lock:
+            for segment_map in self._maps.values():
+                segment_map.close()
+            for f in self._files.values():
+                f.close()
+            self._maps.clear()
+            self._files.clear()
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self.close()
+            for path in self.pack_dir.glob("seg_*.bin"):
+                path.unlink()
+            index_file = self.pack_dir / self.INDEX_FILE
+            if index_file.exists():
+                index_file.unlink()
+            self._index.clear()
+            self._active_segment = 0
+
+
+class LRUEmbeddingCache:
+    """
+    메모리 LRU 캐시 (디스크 캐시 앞단)
+
+    - 반복 질의는 파일 시스템 접근 없이 응답
+    - 저장된 벡터의 총 바이트 수가 max_bytes를 넘으면 오래된 항목부터 제거
+    - hit / miss / eviction 카운터 제공
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: 메모리 캐시 최대 크기 (바이트)
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+
+    def _get_cache_key(self, text: str, model: str) -> bytes:
+        """캐시 키 생성"""
+        content = f"{model}:{text}"
+        return hashlib.md5(content.encode()).digest()
+
+    def get(self, text: str, model: str) -> Optional[np.ndarray]:
+        """메모리에서 임베딩 조회 (조회된 항목은 최신으로 이동, 읽기 전용 배열)"""
+        key = self._get_cache_key(text, model)
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return vector
+
+    def set(self, text: str, model: str, embedding: Vector):
+        """메모리에 임베딩 저장 후 용량 초과분 제거"""
+        key = self._get_cache_key(text, model)
+        vector = np.array(embedding, dtype=np.float32)
+        if vector.nbytes > self.max_bytes:
+            return
+        vector.flags.writeable = False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous.nbytes
+
+            self._entries[key] = vector
+            self.current_bytes += vector.nbytes
+
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        """캐시 전체 삭제 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+
+def create_embedding_cache(
+    backend: Literal["json", "packed"] = "packed",
+    cache_dir: str = "data/embeddings"
+):
+    """
+    캐시 백엔드 생성
+
+    Args:
+        backend: "json" (벡터당 JSON 파일) 또는 "packed" (세그먼트 + mmap)
+        cache_dir: 캐시 디렉토리
+
+    Returns:
+        EmbeddingCache 또는 PackedEmbeddingCache 인스턴스
+    """
+    if backend == "json":
+        return EmbeddingCache(cache_dir)
+    elif backend == "packed":
+        return PackedEmbeddingCache(cache_dir)
+    else:
+        raise ValueError(f"Unknown cache backend: {backend}")
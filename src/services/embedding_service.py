@@ -6,65 +6,53 @@
 - 다양한 임베딩 모델 지원
 """
 
-import hashlib
-import json
+import base64
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import List, Dict, Optional, Literal
-from pathlib import Path
+import random
 import time
+import unicodedata
+from urllib.parse import urlsplit
 
 import numpy as np
-from openai import OpenAI
+from openai import (
+    OpenAI,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    BadRequestError,
+    RateLimitError,
+)
 from tqdm import tqdm
 
-# Optional: sentence_transformers for local models
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    SentenceTransformer = None
-
-
-class EmbeddingCache:
-    """임베딩 캐시 (로컬 파일 기반)"""
-
-    def __init__(self, cache_dir: str = "data/embeddings"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-
-    def _get_cache_key(self, text: str, model: str) -> str:
-        """캐시 키 생성"""
-        content = f"{model}:{text}"
-        return hashlib.md5(content.encode()).hexdigest()
-
-    def get(self, text: str, model: str) -> Optional[List[float]]:
-        """캐시에서 임베딩 조회"""
-        cache_key = self._get_cache_key(text, model)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        if cache_file.exists():
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                return data["embedding"]
-        return None
-
-    def set(self, text: str, model: str, embedding: List[float]):
-        """캐시에 임베딩 저장"""
-        cache_key = self._get_cache_key(text, model)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        with open(cache_file, 'w') as f:
-            json.dump({
-                "text": text[:100],  # 처음 100자만 저장 (참고용)
-                "model": model,
-                "embedding": embedding,
-                "timestamp": time.time()
-            }, f)
-
-    def clear(self):
-        """캐시 전체 삭제"""
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
+from .embedding_cache import (
+    EmbeddingCache,
+    PackedEmbeddingCache,
+    LRUEmbeddingCache,
+    create_embedding_cache,
+)
+from .rate_limiter import TokenBucketRateLimiter
+from .batch_planner import (
+    EmbeddingBatch,
+    get_token_counter,
+    plan_token_batches,
+    summarize_batches,
+)
+
+from .local_embedding import LocalEmbeddingModel, LocalBackend, SENTENCE_TRANSFORMERS_AVAILABLE
+
+
+DEFAULT_OPENAI_ENDPOINT = "https://api.openai.com/v1"
+
+
+class PartialEmbeddingError(Exception):
+    """분할 재시도 중 일부 하위 배치만 성공한 경우 (완료된 임베딩 + 원래 예외)"""
+
+    def __init__(self, error: Exception, completed: Dict[int, np.ndarray]):
+        super().__init__(str(error))
+        self.error = error
+        self.completed = completed  # 요청 텍스트 내 위치 → 임베딩
 
 
 class EmbeddingService:
@@ -81,7 +69,22 @@ class EmbeddingService:
         model_name: str = "openai/text-embedding-3-large",
         api_key: Optional[str] = None,
         cache_enabled: bool = True,
-        cache_dir: str = "data/embeddings"
+        cache_dir: str = "data/embeddings",
+        cache_backend: Literal["json", "packed"] = "packed",
+        memory_cache_bytes: int = 64 * 1024 * 1024,
+        dedup_cache_bytes: int = 64 * 1024 * 1024,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = 3000,
+        tokens_per_minute: Optional[int] = 1_000_000,
+        base_url: Optional[str] = None,
+        max_tokens_per_request: int = 100_000,
+        max_retries: int = 5,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 60.0,
+        local_backend: LocalBackend = "torch",
+        local_threads: Optional[int] = None,
+        output_dimension: Optional[int] = None,
+        dimension_strategy: Literal["truncate", "api"] = "truncate"
     ):
         """
         Args:
@@ -89,40 +92,122 @@ class EmbeddingService:
             api_key: OpenAI API 키 (OpenAI 모델 사용 시)
             cache_enabled: 캐싱 활성화 여부
             cache_dir: 캐시 디렉토리
+            cache_backend: 캐시 백엔드 ("json" 또는 "packed")
+            memory_cache_bytes: 질의 임베딩용 메모리 LRU 캐시 크기 (0이면 비활성화)
+            dedup_cache_bytes: 문서 간 중복 제거용 메모리 LRU 크기 (정규화 텍스트 → 임베딩,
+                               디스크 캐시 설정과 무관, 0이면 배치 내 중복만 제거)
+            max_concurrency: 동시에 보낼 수 있는 최대 OpenAI 요청 수
+            requests_per_minute: 분당 요청 수 제한 (None이면 제한 없음)
+            tokens_per_minute: 분당 토큰 수 제한 (None이면 제한 없음)
+            base_url: OpenAI 호환 API 주소 (로컬 스텁 서버 테스트용, 기본 주소가 아니면 캐시 키에 포함)
+            max_tokens_per_request: 요청당 토큰 예산 (배치 구성 기준)
+            max_retries: 일시적 오류(429, 5xx, 타임아웃) 재시도 횟수
+            retry_base_delay: 지수 백오프 기본 대기 시간 (초)
+            retry_max_delay: 재시도 대기 시간 상한 (초)
+            local_backend: 로컬 모델 실행 백엔드 (torch, torch-int8, onnx, onnx-int8)
+            local_threads: 로컬 모델 CPU 스레드 수
+            output_dimension: 출력 차원 (None이면 모델 기본 차원, Matryoshka 축소)
+            dimension_strategy: 차원 축소 방식
+                - "truncate": 전체 차원을 캐시하고 앞부분만 잘라 재정규화 (기존 캐시 재사용)
+                - "api": OpenAI API의 dimensions 파라미터 사용 (차원별로 별도 캐시)
         """
         self.model_name = model_name
         self.provider, self.model = self._parse_model_name(model_name)
+        self.cache_key_model = model_name
 
         # 캐시 설정
         self.cache_enabled = cache_enabled
         if cache_enabled:
-            self.cache = EmbeddingCache(cache_dir)
+            self.cache = create_embedding_cache(cache_backend, cache_dir)
         else:
             self.cache = None
 
+        # 메모리 캐시 (디스크 캐시 앞단, embed_text 전용)
+        if cache_enabled and memory_cache_bytes > 0:
+            self.memory_cache = LRUEmbeddingCache(max_bytes=memory_cache_bytes)
+        else:
+            self.memory_cache = None
+
+        # 정규화 텍스트 기준 중복 제거 (공백만 다른 머리글/바닥글 등, 문서·배치 간)
+        if dedup_cache_bytes > 0:
+            self.dedup_cache = LRUEmbeddingCache(max_bytes=dedup_cache_bytes)
+        else:
+            self.dedup_cache = None
+
         # 모델 초기화
         if self.provider == "openai":
             if not api_key:
                 raise ValueError("OpenAI API key is required")
-            self.client = OpenAI(api_key=api_key)
+            # 재시도는 _embed_openai_with_retry에서 직접 처리
+            self.client = OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+            # 기본 주소가 아닌 엔드포인트(스텁/호환 서버)의 벡터는 별도 키로 캐시
+            # (OPENAI_BASE_URL 환경 변수로 지정된 주소 포함)
+            endpoint = self._normalize_endpoint(str(self.client.base_url))
+            if endpoint != DEFAULT_OPENAI_ENDPOINT:
+                self.cache_key_model = f"{model_name}#{endpoint}"
             self.dimension = self._get_openai_dimension(self.model)
         elif self.provider == "sentence-transformers":
-            if not SENTENCE_TRANSFORMERS_AVAILABLE:
-                raise ImportError(
-                    "sentence-transformers is not installed. "
-                    "Install it with: pip install sentence-transformers"
-                )
-            self.model_st = SentenceTransformer(self.model)
-            self.dimension = self.model_st.get_sentence_embedding_dimension()
+            self.model_st = LocalEmbeddingModel(
+                self.model,
+                backend=local_backend,
+                num_threads=local_threads
+            )
+            self.dimension = self.model_st.dimension
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
 
+        # 출력 차원 (Matryoshka)
+        self.native_dimension = self.dimension
+        self.api_dimensions: Optional[int] = None
+        self.truncate_dimension: Optional[int] = None
+        if output_dimension and output_dimension != self.native_dimension:
+            if output_dimension > self.native_dimension:
+                raise ValueError(
+                    f"output_dimension ({output_dimension}) exceeds model dimension "
+                    f"({self.native_dimension})"
+                )
+            if dimension_strategy == "api" and self.provider == "openai":
+                self.api_dimensions = output_dimension
+                self.cache_key_model = f"{self.cache_key_model}@{output_dimension}"
+            else:
+                self.truncate_dimension = output_dimension
+            self.dimension = output_dimension
+
+        # 동시 요청 및 속도 제한
+        self.max_concurrency = max(1, max_concurrency)
+        self.rate_limiter = TokenBucketRateLimiter(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute
+        )
+
+        # 토큰 기준 배치 구성
+        self.max_tokens_per_request = max_tokens_per_request
+        self.count_tokens = get_token_counter()
+        self.last_batch_report: Optional[Dict] = None
+
+        # 중복 제거 통계 (누적)
+        self.dedup_stats = {"texts_saved": 0, "requests_saved": 0}
+
+        # 재시도 정책
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+
         print(f"✅ Embedding service initialized: {model_name} (dim={self.dimension})")
 
+    @staticmethod
+    def _normalize_endpoint(base_url: str) -> str:
+        """캐시 키용 API 주소 정규화 (scheme/host 소문자, 끝 슬래시 제거)"""
+        parts = urlsplit(base_url.strip())
+        return f"{parts.scheme.lower()}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
     def _parse_model_name(self, model_name: str) -> tuple[str, str]:
         """모델 이름 파싱"""
         if "/" in model_name:
             provider, model = model_name.split("/", 1)
+            # "local/<model>"은 sentence-transformers 로컬 모델
+            if provider == "local":
+                provider = "sentence-transformers"
         else:
             # 기본 provider
             provider = "sentence-transformers"
@@ -138,25 +223,39 @@ class EmbeddingService:
         }
         return dimensions.get(model, 1536)
 
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str, as_numpy: bool = False):
         """
         단일 텍스트 임베딩
 
         Args:
             text: 임베딩할 텍스트
+            as_numpy: True면 (dim,) float32 배열 반환
 
         Returns:
             임베딩 벡터
         """
+        embedding = self._reduce_dimension(self._embed_text(text))
+        return self._format_vector(embedding, as_numpy)
+
+    def _embed_text(self, text: str):
+        """캐시 계층을 거쳐 단일 텍스트 임베딩"""
+        # 메모리 캐시 확인
+        if self.cache_enabled and self.memory_cache is not None:
+            cached = self.memory_cache.get(text, self.cache_key_model)
+            if cached is not None:
+                return cached
+
         # 캐시 확인
         if self.cache_enabled:
-            cached = self.cache.get(text, self.model_name)
+            cached = self.cache.get(text, self.cache_key_model)
             if cached is not None:
+                if self.memory_cache is not None:
+                    self.memory_cache.set(text, self.cache_key_model, cached)
                 return cached
 
         # 임베딩 생성
         if self.provider == "openai":
-            embedding = self._embed_openai([text])[0]
+            embedding = self._embed_openai_with_retry([text])[0]
         elif self.provider == "sentence-transformers":
             embedding = self._embed_sentence_transformer([text])[0]
         else:
@@ -164,7 +263,9 @@ class EmbeddingService:
 
         # 캐시 저장
         if self.cache_enabled:
-            self.cache.set(text, self.model_name, embedding)
+            self.cache.set(text, self.cache_key_model, embedding)
+            if self.memory_cache is not None:
+                self.memory_cache.set(text, self.cache_key_model, embedding)
 
         return embedding
 
@@ -172,31 +273,29 @@ class EmbeddingService:
         self,
         texts: List[str],
         batch_size: int = 100,
-        show_progress: bool = True
-    ) -> List[List[float]]:
+        show_progress: bool = True,
+        as_numpy: bool = False
+    ):
         """
         배치 텍스트 임베딩
 
         Args:
             texts: 임베딩할 텍스트 리스트
-            batch_size: 배치 크기
+            batch_size: 요청당 최대 텍스트 수 (토큰 예산과 함께 적용)
             show_progress: 진행률 표시
+            as_numpy: True면 (N, dim) float32 행렬 반환
 
         Returns:
-            임베딩 벡터 리스트
+            임베딩 벡터 리스트 (as_numpy=True면 행렬)
         """
-        embeddings = []
         uncached_texts = []
         uncached_indices = []
 
-        # 캐시 확인
+        # 캐시 확인 (일괄 조회)
         if self.cache_enabled:
-            for i, text in enumerate(texts):
-                cached = self.cache.get(text, self.model_name)
-                if cached is not None:
-                    embeddings.append(cached)
-                else:
-                    embeddings.append(None)
+            embeddings = self.cache.get_many(texts, self.cache_key_model)
+            for i, (text, cached) in enumerate(zip(texts, embeddings)):
+                if cached is None:
                     uncached_texts.append(text)
                     uncached_indices.append(i)
         else:
@@ -206,59 +305,389 @@ class EmbeddingService:
 
         # 캐시되지 않은 텍스트 임베딩
         if uncached_texts:
-            print(f"📊 Embedding {len(uncached_texts)} texts (cached: {len(texts) - len(uncached_texts)})")
+            # 정규화 기준 중복 제거 (배치 내 + 이전에 임베딩한 텍스트는 메모리에서 재사용)
+            unique_texts, unique_keys, unique_embeddings, fanout = self._deduplicate(uncached_texts)
 
-            batches = [
-                uncached_texts[i:i + batch_size]
-                for i in range(0, len(uncached_texts), batch_size)
-            ]
+            pending = [i for i, emb in enumerate(unique_embeddings) if emb is None]
+            pending_texts = [unique_texts[i] for i in pending]
 
-            batch_embeddings = []
-            iterator = tqdm(batches, desc="Embedding") if show_progress else batches
+            print(
+                f"📊 Embedding {len(pending_texts)} texts "
+                f"(cached: {len(texts) - len(pending_texts) - (len(uncached_texts) - len(unique_texts))}, "
+                f"duplicates: {len(uncached_texts) - len(unique_texts)})"
+            )
 
-            for batch in iterator:
-                if self.provider == "openai":
-                    batch_emb = self._embed_openai(batch)
-                elif self.provider == "sentence-transformers":
-                    batch_emb = self._embed_sentence_transformer(batch)
-                else:
-                    raise ValueError(f"Unknown provider: {self.provider}")
+            if pending_texts:
+                batches = self._plan_batches(pending_texts, batch_size)
+                self._record_dedup_savings(uncached_texts, batches, batch_size)
 
-                batch_embeddings.extend(batch_emb)
+                pending_embeddings = self._embed_planned(pending_texts, batches, show_progress)
+                for i, emb in zip(pending, pending_embeddings):
+                    unique_embeddings[i] = emb
+                    if self.dedup_cache is not None:
+                        self.dedup_cache.set(unique_keys[i], self.cache_key_model, emb)
 
-                # Rate limiting for OpenAI
-                if self.provider == "openai":
-                    time.sleep(0.1)
+            # 결과 펼치기 (중복 텍스트 모두에 동일 임베딩)
+            batch_embeddings = [unique_embeddings[u] for u in fanout]
 
-            # 캐시 저장 및 결과 업데이트
-            for idx, text, emb in zip(uncached_indices, uncached_texts, batch_embeddings):
-                if self.cache_enabled:
-                    self.cache.set(text, self.model_name, emb)
+            # 캐시 저장: 텍스트당 원문 키 하나 (정규화 키는 메모리 중복 제거에만 사용)
+            if self.cache_enabled:
+                self.cache.set_many(uncached_texts, self.cache_key_model, batch_embeddings)
+            for idx, emb in zip(uncached_indices, batch_embeddings):
                 embeddings[idx] = emb
 
-        return embeddings
+        if not embeddings:
+            return np.empty((0, self.dimension), dtype=np.float32) if as_numpy else []
+
+        matrix = self._reduce_dimension(np.stack(embeddings).astype(np.float32, copy=False))
+        if as_numpy:
+            return matrix
+        return matrix.tolist()
+
+    def get_cached_batch(self, texts: List[str], as_numpy: bool = False):
+        """
+        캐시에 저장된 임베딩만 조회 (API 호출 없음)
+
+        Returns:
+            embed_batch와 같은 형식, 캐시가 꺼져 있거나 하나라도 없으면 None
+        """
+        if not self.cache_enabled:
+            return None
+
+        embeddings = self.cache.get_many(texts, self.cache_key_model)
+        if any(emb is None for emb in embeddings):
+            return None
+        if not embeddings:
+            return np.empty((0, self.dimension), dtype=np.float32) if as_numpy else []
+
+        matrix = self._reduce_dimension(np.stack(embeddings).astype(np.float32, copy=False))
+        if as_numpy:
+            return matrix
+        return matrix.tolist()
+
+    def _reduce_dimension(self, vectors):
+        """
+        Matryoshka 차원 축소 (truncate 방식)
+
+        앞쪽 output_dimension개 성분만 남기고 L2 재정규화
+        """
+        if self.truncate_dimension is None:
+            return vectors
+
+        reduced = np.asarray(vectors, dtype=np.float32)[..., :self.truncate_dimension]
+        norms = np.linalg.norm(reduced, axis=-1, keepdims=True)
+        return reduced / np.where(norms == 0, 1.0, norms)
+
+    @staticmethod
+    def _format_vector(embedding, as_numpy: bool):
+        """벡터 출력 형식 통일 (float32 배열 또는 float 리스트)"""
+        if as_numpy:
+            return np.asarray(embedding, dtype=np.float32)
+        if isinstance(embedding, np.ndarray):
+            return embedding.tolist()
+        return embedding
+
+    def _embed_planned(
+        self,
+        texts: List[str],
+        batches: List[EmbeddingBatch],
+        show_progress: bool
+    ) -> List[np.ndarray]:
+        """계획된 배치 실행 (실패 시 성공한 임베딩을 캐시에 저장한 뒤 예외 전달)"""
+        results = [None] * len(texts)
+        try:
+            for batch, batch_emb in self._run_batches(texts, batches, show_progress):
+                for i, emb in zip(batch.indices, batch_emb):
+                    results[i] = emb
+        except Exception:
+            completed = [i for i, emb in enumerate(results) if emb is not None]
+            if self.cache_enabled and completed:
+                self.cache.set_many(
+                    [texts[i] for i in completed],
+                    self.cache_key_model,
+                    [results[i] for i in completed]
+                )
+                print(f"💾 Saved {len(completed)}/{len(texts)} embeddings before failure")
+            raise
+        return results
+
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """중복 판정용 정규화 (유니코드 NFC, 공백 통일)"""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    def _deduplicate(
+        self,
+        texts: List[str]
+    ) -> tuple[List[str], List[str], List[Optional[np.ndarray]], List[int]]:
+        """
+        정규화 텍스트 기준 중복 제거
+
+        배치 안의 중복은 하나로 합치고, 이전 호출(다른 문서)에서 임베딩한 정규화 텍스트는
+        메모리 LRU(dedup_cache)에서 임베딩을 가져옴
+
+        Returns:
+            (고유 텍스트, 고유 텍스트의 정규화 키, 이미 알고 있는 임베딩 또는 None,
+             입력 위치 → 고유 위치 매핑)
+        """
+        positions: Dict[str, int] = {}
+        unique_texts = []
+        fanout = []
+        for text in texts:
+            key = self._normalize_text(text)
+            if key not in positions:
+                positions[key] = len(unique_texts)
+                unique_texts.append(text)
+            fanout.append(positions[key])
+
+        unique_keys = list(positions)
+        if self.dedup_cache is not None:
+            known = [self.dedup_cache.get(key, self.cache_key_model) for key in unique_keys]
+        else:
+            known = [None] * len(unique_keys)
+        return unique_texts, unique_keys, known, fanout
+
+    def _record_dedup_savings(
+        self,
+        uncached_texts: List[str],
+        batches: List[EmbeddingBatch],
+        batch_size: int
+    ):
+        """중복 제거로 절약한 텍스트 수 / API 요청 수 누적"""
+        saved_texts = len(uncached_texts) - sum(len(b.indices) for b in batches)
+        if saved_texts <= 0:
+            return
+
+        if self.provider == "openai":
+            requests_without_dedup = len(plan_token_batches(
+                [self.count_tokens(text) for text in uncached_texts],
+                max_tokens_per_request=self.max_tokens_per_request,
+                max_items_per_request=min(batch_size, 2048)
+            ))
+        else:
+            requests_without_dedup = -(-len(uncached_texts) // batch_size)
+
+        saved_requests = max(0, requests_without_dedup - len(batches))
+        self.dedup_stats["texts_saved"] += saved_texts
+        self.dedup_stats["requests_saved"] += saved_requests
+        print(f"   - Deduplication saved {saved_texts} texts / {saved_requests} API requests")
+
+    def _plan_batches(self, texts: List[str], batch_size: int) -> List[EmbeddingBatch]:
+        """
+        요청 단위 배치 구성
+
+        OpenAI는 요청당 토큰 예산(max_tokens_per_request)과
+        텍스트 수(batch_size)를 함께 고려해 채우고, 로컬 모델은 개수 기준으로 분할
+        """
+        if self.provider != "openai":
+            return [
+                EmbeddingBatch(indices=list(range(i, min(i + batch_size, len(texts)))))
+                for i in range(0, len(texts), batch_size)
+            ]
+
+        token_counts = [self.count_tokens(text) for text in texts]
+        batches = plan_token_batches(
+            token_counts,
+            max_tokens_per_request=self.max_tokens_per_request,
+            max_items_per_request=min(batch_size, 2048)
+        )
+
+        self.last_batch_report = summarize_batches(batches, self.max_tokens_per_request)
+        print(
+            f"   - {self.last_batch_report['requests']} requests, "
+            f"~{self.last_batch_report['total_tokens']} tokens, "
+            f"avg fill {self.last_batch_report['avg_fill']:.0%} "
+            f"(min {self.last_batch_report['min_fill']:.0%})"
+        )
+        return batches
+
+    def _run_batches(
+        self,
+        texts: List[str],
+        batches: List[EmbeddingBatch],
+        show_progress: bool
+    ):
+        """
+        배치 임베딩 실행
+
+        OpenAI는 최대 max_concurrency개 요청을 동시에 보내고
+        (속도 제한기 통과 후), 로컬 모델은 순차 실행.
+        (batch, embeddings) 쌍을 입력 배치 순서대로 반환
+        """
+        if self.provider == "openai":
+            embed_fn = lambda batch: self._embed_openai_with_retry(
+                [texts[i] for i in batch.indices],
+                tokens=batch.token_count
+            )
+        elif self.provider == "sentence-transformers":
+            embed_fn = lambda batch: self._embed_sentence_transformer(
+                [texts[i] for i in batch.indices]
+            )
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+
+        if self.provider == "openai" and self.max_concurrency > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                futures = [executor.submit(embed_fn, batch) for batch in batches]
+                iterator = tqdm(futures, desc="Embedding") if show_progress else futures
+
+                # 실패가 나도 이미 진행 중인 요청의 결과는 모두 전달한 뒤 예외 발생
+                first_error = None
+                for batch, future in zip(batches, iterator):
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        if isinstance(e, PartialEmbeddingError):
+                            yield self._completed_part(batch, e)
+                            e = e.error
+                        if first_error is None:
+                            first_error = e
+                            for pending in futures:
+                                pending.cancel()
+                        continue
+                    yield batch, result
+
+                if first_error is not None:
+                    raise first_error
+            return
+
+        iterator = tqdm(batches, desc="Embedding") if show_progress else batches
+        for batch in iterator:
+            try:
+                result = embed_fn(batch)
+            except PartialEmbeddingError as e:
+                yield self._completed_part(batch, e)
+                raise e.error
+            yield batch, result
+
+    @staticmethod
+    def _completed_part(batch: EmbeddingBatch, error: PartialEmbeddingError):
+        """실패한 배치 중 분할 재시도로 완료된 부분 (batch, embeddings)"""
+        positions = sorted(error.completed)
+        return (
+            replace(batch, indices=[batch.indices[i] for i in positions]),
+            np.stack([error.completed[i] for i in positions])
+        )
+
+    def _embed_openai_with_retry(
+        self,
+        texts: List[str],
+        tokens: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        재시도 정책을 적용한 OpenAI 임베딩
+
+        - 429 / 408 / 409 / 5xx / 연결 오류 / 타임아웃: 지수 백오프(jitter) 후 재시도,
+          Retry-After 헤더가 있으면 그 시간을 우선. 재시도를 모두 쓰면 그대로 예외
+          (장애/속도 제한 중에 분할 요청으로 부하를 늘리지 않음)
+        - 400 / 413 (요청 크기 초과 등): 배치를 반으로 나눠 각각 요청
+        - 분할 후 한쪽이 실패하면 완료된 임베딩을 PartialEmbeddingError로 함께 전달
+        """
+        if tokens is None:
+            tokens = sum(self.count_tokens(text) for text in texts)
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(tokens=tokens)
+            try:
+                return self._embed_openai(texts)
+            except (RateLimitError, APIConnectionError, APITimeoutError, APIStatusError) as e:
+                if self._is_payload_error(e):
+                    # 요청 자체가 너무 큼 (토큰 초과 등): 재시도 대신 분할
+                    if len(texts) == 1:
+                        raise
+                    break
+                if isinstance(e, APIStatusError) and not self._is_retryable_status(e):
+                    raise
+                if attempt == self.max_retries:
+                    raise
+
+                delay = self._get_retry_delay(e, attempt)
+                print(f"⏳ Retrying {len(texts)} texts in {delay:.1f}s "
+                      f"(attempt {attempt + 1}/{self.max_retries}): {type(e).__name__}")
+                time.sleep(delay)
+
+        # 배치 분할 후 재시도 (완료된 하위 배치는 실패해도 전달)
+        mid = len(texts) // 2
+        print(f"✂️  Splitting oversized batch of {len(texts)} texts")
+        parts = []
+        completed: Dict[int, np.ndarray] = {}
+        for offset, part in ((0, texts[:mid]), (mid, texts[mid:])):
+            try:
+                part_embeddings = self._embed_openai_with_retry(part)
+            except Exception as e:
+                error = e
+                if isinstance(e, PartialEmbeddingError):
+                    completed.update({offset + i: emb for i, emb in e.completed.items()})
+                    error = e.error
+                if completed:
+                    raise PartialEmbeddingError(error, completed) from error
+                raise error
+            completed.update({offset + i: emb for i, emb in enumerate(part_embeddings)})
+            parts.append(part_embeddings)
+        return np.concatenate(parts)
+
+    @staticmethod
+    def _is_payload_error(error: Exception) -> bool:
+        """배치를 나누면 해결될 수 있는 오류 (400 잘못된 요청, 413 요청 크기 초과)"""
+        return isinstance(error, BadRequestError) or (
+            isinstance(error, APIStatusError) and error.status_code == 413
+        )
+
+    @staticmethod
+    def _is_retryable_status(error: APIStatusError) -> bool:
+        """재시도 가능한 HTTP 상태 코드 여부"""
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+
+    def _get_retry_delay(self, error: Exception, attempt: int) -> float:
+        """Retry-After 헤더 또는 jitter 지수 백오프로 대기 시간 계산"""
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
 
-    def _embed_openai(self, texts: List[str]) -> List[List[float]]:
-        """OpenAI API로 임베딩"""
+        retry_after_ms = headers.get("retry-after-ms")
+        retry_after = headers.get("retry-after")
         try:
+            if retry_after_ms is not None:
+                return min(float(retry_after_ms) / 1000.0, self.retry_max_delay)
+            if retry_after is not None:
+                return min(float(retry_after), self.retry_max_delay)
+        except ValueError:
+            pass
+
+        # Full jitter: [0, base * 2^attempt]
+        cap = min(self.retry_max_delay, self.retry_base_delay * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    def _embed_openai(self, texts: List[str]) -> np.ndarray:
+        """
+        OpenAI API로 임베딩 ((N, dim) float32 배열)
+
+        base64 인코딩으로 받아 float 리스트 파싱 없이 바로 배열로 변환
+        """
+        try:
+            params = {}
+            if self.api_dimensions:
+                params["dimensions"] = self.api_dimensions
             response = self.client.embeddings.create(
                 model=self.model,
-                input=texts
+                input=texts,
+                encoding_format="base64",
+                **params
             )
-            embeddings = [data.embedding for data in response.data]
-            return embeddings
+            return np.stack([self._decode_embedding(data.embedding) for data in response.data])
         except Exception as e:
             print(f"❌ OpenAI embedding error: {e}")
             raise
 
-    def _embed_sentence_transformer(self, texts: List[str]) -> List[List[float]]:
-        """SentenceTransformer로 임베딩"""
-        embeddings = self.model_st.encode(
-            texts,
-            convert_to_numpy=True,
-            show_progress_bar=False
-        )
-        return embeddings.tolist()
+    @staticmethod
+    def _decode_embedding(embedding) -> np.ndarray:
+        """base64(float32) 또는 float 리스트 응답을 float32 배열로 변환"""
+        if isinstance(embedding, str):
+            return np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+        return np.asarray(embedding, dtype=np.float32)
+
+    def _embed_sentence_transformer(self, texts: List[str]) -> np.ndarray:
+        """로컬 모델로 임베딩 ((N, dim) float32 배열)"""
+        return self.model_st.encode(texts)
 
     def compute_similarity(
         self,
@@ -291,7 +720,13 @@ class EmbeddingService:
             "provider": self.provider,
             "model": self.model,
             "dimension": self.dimension,
-            "cache_enabled": self.cache_enabled
+            "native_dimension": self.native_dimension,
+            "local_backend": self.model_st.backend if self.provider == "sentence-transformers" else None,
+            "cache_enabled": self.cache_enabled,
+            "max_concurrency": self.max_concurrency,
+            "dedup_stats": dict(self.dedup_stats),
+            "cache_backend": type(self.cache).__name__ if self.cache else None,
+            "memory_cache": self.memory_cache.stats() if self.memory_cache else None
         }
 
 
@@ -410,7 +845,9 @@ class MultilingualEmbeddingService:
 # 유틸리티 함수
 def create_embedding_service(
     provider: Literal["openai", "local"] = "openai",
-    api_key: Optional[str] = None
+    api_key: Optional[str] = None,
+    local_backend: LocalBackend = "torch",
+    local_threads: Optional[int] = None
 ) -> EmbeddingService:
     """
     간편한 임베딩 서비스 생성
@@ -418,6 +855,8 @@ def create_embedding_service(
     Args:
         provider: "openai" 또는 "local"
         api_key: OpenAI API 키
+        local_backend: 로컬 모델 실행 백엔드 (torch, torch-int8, onnx, onnx-int8)
+        local_threads: 로컬 모델 CPU 스레드 수
 
     Returns:
         EmbeddingService 인스턴스
@@ -432,7 +871,9 @@ def create_embedding_service(
     elif provider == "local":
         # 로컬 모델 (무료)
         return EmbeddingService(
-            model_name="sentence-transformers/all-MiniLM-L6-v2"
+            model_name="sentence-transformers/all-MiniLM-L6-v2",
+            local_backend=local_backend,
+            local_threads=local_threads
         )
     else:
         raise ValueError(f"Unknown provider: {provider}")
@@ -0,0 +1,200 @@
+"""
+사전 빌드 인덱스 아티팩트 모듈
+- 청크 payload + float32 벡터 행렬 + 컬렉션별 오프셋을 단일 바이너리 파일로 저장
+- 앱 시작 시 mmap으로 열어 재임베딩/JSON 재파싱 없이 바로 사용
+
+파일 구조 (little-endian):
+    magic (8B) | version (u32) | header_len (u32) | header JSON | payload JSON | padding | vectors
+    - header: model, dimension, rows, collections[{name, offset, count}],
+              payload_offset, payload_length, vectors_offset
+    - vectors: (rows, dimension) float32, 64바이트 정렬
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+
+
+INDEX_MAGIC = b"CRMIDX\x00\x00"
+INDEX_FORMAT_VERSION = 1
+DEFAULT_INDEX_ARTIFACT_PATH = "data/processed/crm_index.bin"
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+
+def write_index_artifact(
+    path: str,
+    collections: Dict[str, Tuple[List[Dict], np.ndarray]],
+    model: str,
+    dimension: int
+) -> Dict:
+    """
+    인덱스 아티팩트 저장
+
+    Args:
+        path: 출력 파일 경로
+        collections: {컬렉션 이름: (청크 리스트, (N, dim) 임베딩 행렬)}
+        model: 임베딩 모델 이름
+        dimension: 벡터 차원
+
+    Returns:
+        헤더 정보
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    payloads = []
+    rows = 0
+    for name, (chunks, embeddings) in collections.items():
+        if len(chunks) != len(embeddings):
+            raise ValueError(
+                f"Embeddings count ({len(embeddings)}) does not match chunks ({len(chunks)}) in {name}"
+            )
+        if len(embeddings) and embeddings.shape[1] != dimension:
+            raise ValueError(f"Dimension mismatch in {name}: {embeddings.shape[1]} != {dimension}")
+
+        entries.append({"name": name, "offset": rows, "count": len(chunks)})
+        payloads.extend(
+            {"chunk_id": c["chunk_id"], "text": c["text"], "metadata": c.get("metadata", {})}
+            for c in chunks
+        )
+        rows += len(chunks)
+
+    payload_bytes = json.dumps(payloads, ensure_ascii=False).encode("utf-8")
+
+    # 헤더 길이가 오프셋 값에 따라 달라지므로 고정점이 될 때까지 계산
+    header = {
+        "model": model,
+        "dimension": dimension,
+        "rows": rows,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "collections": entries,
+        "payload_offset": 0,
+        "payload_length": len(payload_bytes),
+        "vectors_offset": 0,
+    }
+    while True:
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+        payload_offset = _PREAMBLE.size + len(header_bytes)
+        vectors_offset = -(-(payload_offset + len(payload_bytes)) // _ALIGNMENT) * _ALIGNMENT
+        if header["payload_offset"] == payload_offset and header["vectors_offset"] == vectors_offset:
+            break
+        header["payload_offset"] = payload_offset
+        header["vectors_offset"] = vectors_offset
+
+    # 임시 파일에 기록 후 교체 (읽는 중인 앱이 깨진 파일을 보지 않도록)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(INDEX_MAGIC, INDEX_FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        f.write(payload_bytes)
+        f.write(b"\x00" * (vectors_offset - f.tell()))
+        for name, (_, embeddings) in collections.items():
+            if len(embeddings):
+                f.write(np.ascontiguousarray(embeddings, dtype=np.float32).tobytes())
+    os.replace(tmp_path, path)
+
+    print(f"💾 Index artifact saved to: {path} ({rows} vectors, dim={dimension})")
+    return header
+
+
+class IndexArtifact:
+    """
+    mmap으로 연 인덱스 아티팩트
+
+    벡터는 파일을 직접 참조하는 읽기 전용 배열로 제공 (복사 없음)
+    """
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: 아티팩트 파일이 아니거나, 버전이 다르거나, 잘리거나 깨진 경우
+        """
+        self.path = Path(path)
+        self.vectors = None
+        self._file = open(self.path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _PREAMBLE.size:
+            self._file.close()
+            raise ValueError(f"Truncated index artifact ({size} bytes): {self.path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._load(size)
+        except ValueError:
+            self.close()
+            raise
+        except (KeyError, TypeError) as e:
+            self.close()
+            raise ValueError(f"Corrupt index artifact header ({e!r}): {self.path}") from e
+
+    def _load(self, size: int):
+        """프리앰블/헤더/payload 검증 후 벡터 뷰 생성"""
+        magic, version, header_len = _PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"Not an index artifact: {self.path}")
+        if version != INDEX_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported index artifact version {version} (expected {INDEX_FORMAT_VERSION})"
+            )
+
+        header_start = _PREAMBLE.size
+        self.header = json.loads(self._mmap[header_start:header_start + header_len])
+        self.model: str = self.header["model"]
+        self.dimension: int = self.header["dimension"]
+        self.rows: int = self.header["rows"]
+        self.collections: Dict[str, Dict] = {c["name"]: c for c in self.header["collections"]}
+
+        vectors_end = self.header["vectors_offset"] + self.rows * self.dimension * 4
+        if vectors_end > size:
+            raise ValueError(f"Truncated index artifact ({size} < {vectors_end} bytes): {self.path}")
+
+        payload_start = self.header["payload_offset"]
+        self.payloads: List[Dict] = json.loads(
+            self._mmap[payload_start:payload_start + self.header["payload_length"]]
+        )
+
+        self.vectors = np.frombuffer(
+            self._mmap,
+            dtype=np.float32,
+            count=self.rows * self.dimension,
+            offset=self.header["vectors_offset"]
+        ).reshape(self.rows, self.dimension)
+
+    @classmethod
+    def open(cls, path: str) -> Optional["IndexArtifact"]:
+        """파일이 있으면 열고, 없으면 None"""
+        if not Path(path).exists():
+            return None
+        return cls(path)
+
+    def get_vectors(self, collection_name: str) -> np.ndarray:
+        """컬렉션의 (N, dim) 벡터 행렬 (mmap 뷰)"""
+        entry = self.collections[collection_name]
+        return self.vectors[entry["offset"]:entry["offset"] + entry["count"]]
+
+    def get_chunks(self, collection_name: str) -> List[Dict]:
+        """컬렉션의 청크 payload 리스트"""
+        entry = self.collections[collection_name]
+        return self.payloads[entry["offset"]:entry["offset"] + entry["count"]]
+
+    def chunks_by_collection(self) -> Dict[str, List[Dict]]:
+        """{컬렉션 이름: 청크 리스트}"""
+        return {name: self.get_chunks(name) for name in self.collections}
+
+    def is_compatible(self, model: str, dimension: int) -> bool:
+        """임베딩 모델/차원이 일치하는지 확인"""
+        return self.model == model and self.dimension == dimension
+
+    def close(self):
+        """mmap 및 파일 핸들 해제"""
+        self.vectors = None
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,133 @@
+"""
+로컬 CPU 임베딩 모듈
+- SentenceTransformer 기반 로컬 모델
+- 스레드 수 설정, int8 동적 양자화, ONNX Runtime 실행 옵션
+- float32 NumPy 배열 출력
+"""
+
+from typing import List, Optional, Literal
+
+import numpy as np
+
+# Optional: sentence_transformers for local models
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    SentenceTransformer = None
+
+
+LocalBackend = Literal["torch", "torch-int8", "onnx", "onnx-int8"]
+
+
+class LocalEmbeddingModel:
+    """
+    로컬 CPU 임베딩 모델
+
+    실행 백엔드:
+    - torch: 기본 PyTorch 실행
+    - torch-int8: Linear 레이어 int8 동적 양자화 (추가 의존성 없음)
+    - onnx: ONNX Runtime 실행 (sentence-transformers>=3.2, onnxruntime 필요)
+    - onnx-int8: 양자화된 ONNX 모델 파일 사용
+    """
+
+    ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+    def __init__(
+        self,
+        model_name: str,
+        backend: LocalBackend = "torch",
+        num_threads: Optional[int] = None,
+        normalize: bool = True,
+        batch_size: int = 64
+    ):
+        """
+        Args:
+            model_name: SentenceTransformer 모델 이름 또는 경로
+            backend: 실행 백엔드
+            num_threads: CPU 스레드 수 (None이면 라이브러리 기본값)
+            normalize: L2 정규화 여부 (코사인 유사도 = 내적)
+            batch_size: encode 내부 배치 크기
+        """
+        if not SENTENCE_TRANSFORMERS_AVAILABLE:
+            raise ImportError(
+                "sentence-transformers is not installed. "
+                "Install it with: pip install sentence-transformers"
+            )
+
+        self.model_name = model_name
+        self.backend = backend
+        self.num_threads = num_threads
+        self.normalize = normalize
+        self.batch_size = batch_size
+
+        if num_threads:
+            self._set_num_threads(num_threads)
+
+        self.model = self._load_model(model_name, backend)
+        self.dimension = self.model.get_sentence_embedding_dimension()
+
+    @staticmethod
+    def _set_num_threads(num_threads: int):
+        """PyTorch CPU 스레드 수 설정 (ONNX Runtime은 세션 옵션으로 설정)"""
+        try:
+            import torch
+            torch.set_num_threads(num_threads)
+        except ImportError:
+            pass
+
+    def _load_model(self, model_name: str, backend: LocalBackend):
+        """백엔드별 모델 로드"""
+        if backend in ("torch", "torch-int8"):
+            model = SentenceTransformer(model_name, device="cpu")
+            if backend == "torch-int8":
+                import torch
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            return model
+
+        if backend in ("onnx", "onnx-int8"):
+            model_kwargs = {}
+            if self.num_threads:
+                import onnxruntime
+                session_options = onnxruntime.SessionOptions()
+                session_options.intra_op_num_threads = self.num_threads
+                model_kwargs["session_options"] = session_options
+            if backend == "onnx-int8":
+                model_kwargs["file_name"] = self.ONNX_INT8_FILE
+
+            try:
+                return SentenceTransformer(
+                    model_name,
+                    device="cpu",
+                    backend="onnx",
+                    model_kwargs=model_kwargs
+                )
+            except TypeError as e:
+                raise ImportError(
+                    "ONNX backend requires sentence-transformers>=3.2 and onnxruntime. "
+                    "Install it with: pip install 'sentence-transformers[onnx]'"
+                ) from e
+
+        raise ValueError(f"Unknown local backend: {backend}")
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트 배치 임베딩
+
+        Returns:
+            (N, dim) float32 배열
+        """
+        if not texts:
+            return np.empty((0, self.dimension), dtype=np.float32)
+
+        embeddings = self.model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=self.normalize,
+            show_progress_bar=False
+        )
+        return np.asarray(embeddings, dtype=np.float32)
@@ -0,0 +1,436 @@
+"""
+NumPy 브루트포스 벡터 스토어
+- 소규모 코퍼스(수천 청크)용 VectorStore 호환 백엔드
+- 컬렉션 = 정규화된 float32 행렬 + payload 배열
+- 검색 = 행렬-벡터 곱 1회 + argpartition (다중 쿼리는 행렬-행렬 곱 1회)
+"""
+
+import threading
+from typing import List, Dict, Optional, Any, Tuple
+
+import numpy as np
+from tqdm import tqdm
+
+from .vector_store import SearchResult, make_point_id
+
+
+class _Collection:
+    """
+    단일 컬렉션 저장소
+
+    여러 세션이 같은 스토어를 공유하므로(Streamlit cache_resource) 상태 변경은 lock 안에서만.
+    검색은 snapshot()으로 (행렬, payload, 필터 마스크)를 한 번에 잡은 뒤 lock 밖에서 계산:
+    병합/삭제는 새 객체로 교체하고 upsert는 끝에 추가만 하므로 스냅샷의 행 번호는 유지됨
+    """
+
+    def __init__(self, vector_size: int, distance: str):
+        self.vector_size = vector_size
+        self.distance = distance
+        self.payloads: List[Dict] = []
+        self.ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._blocks: List[np.ndarray] = []
+        self._matrix = np.empty((0, vector_size), dtype=np.float32)
+        self._mask_cache: Dict[tuple, np.ndarray] = {}
+        self.lock = threading.RLock()
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """(N, dim) 행렬 (추가된 블록은 첫 검색 시 한 번에 병합)"""
+        with self.lock:
+            if self._blocks:
+                self._matrix = np.vstack([self._matrix, *self._blocks])
+                self._blocks = []
+            return self._matrix
+
+    def snapshot(self, filters: Optional[Dict] = None) -> Tuple[np.ndarray, List[Dict], Optional[np.ndarray]]:
+        """검색용 (행렬, payload 리스트, 필터 마스크 - 필터 없으면 None)"""
+        with self.lock:
+            mask = self.filter_mask(filters) if filters else None
+            return self.matrix, self.payloads, mask
+
+    def upsert(self, ids: List[str], vectors: np.ndarray, payloads: List[Dict]):
+        """벡터/payload upsert (같은 ID는 제자리 덮어쓰기, 새 ID는 추가)"""
+        vectors = np.array(vectors, dtype=np.float32, copy=True).reshape(-1, self.vector_size)
+        if self.distance == "Cosine":
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors /= np.where(norms == 0, 1.0, norms)
+
+        with self.lock:
+            # 같은 호출 안의 중복 ID는 마지막 값 사용
+            latest = {point_id: i for i, point_id in enumerate(ids)}
+
+            new_rows = []
+            for point_id, i in latest.items():
+                row = self._rows.get(point_id)
+                if row is None:
+                    self._rows[point_id] = len(self.ids)
+                    self.ids.append(point_id)
+                    self.payloads.append(payloads[i])
+                    new_rows.append(i)
+                else:
+                    self.matrix[row] = vectors[i]
+                    self.payloads[row] = payloads[i]
+
+            if new_rows:
+                self._blocks.append(vectors[new_rows])
+            self._mask_cache.clear()
+
+    def keep(self, mask: np.ndarray):
+        """mask가 True인 행만 남김"""
+        with self.lock:
+            self._matrix = self.matrix[mask]
+            self.payloads = [p for p, k in zip(self.payloads, mask) if k]
+            self.ids = [i for i, k in zip(self.ids, mask) if k]
+            self._rows = {point_id: row for row, point_id in enumerate(self.ids)}
+            self._mask_cache.clear()
+
+    def filter_mask(self, filters: Dict) -> np.ndarray:
+        """Qdrant MatchValue(must)와 동일한 필터 마스크 (키/값 조합별 캐시)"""
+        with self.lock:
+            mask = np.ones(len(self.payloads), dtype=bool)
+            for key, value in filters.items():
+                cache_key = (key, value)
+                if cache_key not in self._mask_cache:
+                    self._mask_cache[cache_key] = np.fromiter(
+                        (_match_value(p.get(key), value) for p in self.payloads),
+                        dtype=bool,
+                        count=len(self.payloads)
+                    )
+                mask &= self._mask_cache[cache_key]
+            return mask
+
+
+def _match_value(field: Any, value: Any) -> bool:
+    """payload 필드가 값과 일치하는지 (리스트 필드는 원소 중 하나라도 일치)"""
+    if isinstance(field, list):
+        return value in field
+    return field == value
+
+
+class NumpyVectorStore:
+    """
+    NumPy 브루트포스 벡터 스토어
+
+    VectorStore와 같은 인터페이스/의미를 제공:
+    - Cosine/Dot: 점수 내림차순, score_threshold 이상만 반환
+    - Euclid: 거리 오름차순, score_threshold 이하만 반환
+    - filters: 모든 키/값이 일치하는 포인트만 (AND)
+    """
+
+    def __init__(self):
+        self.collections: Dict[str, _Collection] = {}
+        print("✅ Vector store initialized (numpy brute-force mode)")
+
+    def create_collection(
+        self,
+        collection_name: str,
+        vector_size: int,
+        distance: str = "Cosine",
+        recreate: bool = False
+    ):
+        """
+        컬렉션 생성
+
+        Args:
+            collection_name: 컬렉션 이름
+            vector_size: 벡터 차원
+            distance: 거리 메트릭 (Cosine, Euclid, Dot)
+            recreate: 기존 컬렉션 삭제 후 재생성
+        """
+        if distance not in ("Cosine", "Euclid", "Dot"):
+            distance = "Cosine"
+
+        if recreate and self.collection_exists(collection_name):
+            del self.collections[collection_name]
+            print(f"🗑️  Deleted existing collection: {collection_name}")
+
+        if not self.collection_exists(collection_name):
+            self.collections[collection_name] = _Collection(vector_size, distance)
+            print(f"✅ Created collection: {collection_name} (dim={vector_size})")
+        else:
+            print(f"ℹ️  Collection already exists: {collection_name}")
+
+    def collection_exists(self, collection_name: str) -> bool:
+        """컬렉션 존재 여부 확인"""
+        return collection_name in self.collections
+
+    def add_documents(
+        self,
+        collection_name: str,
+        chunks: List[Dict],  # {chunk_id, text, embedding, metadata}
+        batch_size: int = 100,
+        show_progress: bool = True,
+        embeddings: Optional[np.ndarray] = None,
+        replace_documents: bool = False
+    ):
+        """
+        문서 청크 추가 (VectorStore와 같은 결정적 ID로 upsert)
+
+        Args:
+            collection_name: 컬렉션 이름
+            chunks: 청크 리스트
+            batch_size: 배치 크기 (진행률 표시 단위)
+            show_progress: 진행률 표시
+            embeddings: (N, dim) 임베딩 행렬 (주어지면 청크의 "embedding" 대신 사용)
+            replace_documents: True면 chunks에 포함된 문서의 기존 포인트 중 이번에 넣지 않은 포인트 삭제
+        """
+        if not chunks:
+            print("⚠️  No chunks to add")
+            return
+
+        if embeddings is not None and len(embeddings) != len(chunks):
+            raise ValueError(
+                f"Embeddings count ({len(embeddings)}) does not match chunks ({len(chunks)})"
+            )
+
+        collection = self.collections[collection_name]
+        print(f"📥 Adding {len(chunks)} chunks to {collection_name}")
+
+        point_ids = [make_point_id(chunk["chunk_id"], chunk["text"]) for chunk in chunks]
+
+        starts = range(0, len(chunks), batch_size)
+        iterator = tqdm(starts, desc="Uploading") if show_progress else starts
+
+        for start in iterator:
+            batch = chunks[start:start + batch_size]
+
+            if embeddings is not None:
+                vectors = embeddings[start:start + batch_size]
+            else:
+                vectors = [chunk["embedding"] for chunk in batch]
+
+            collection.upsert(
+                point_ids[start:start + batch_size],
+                vectors,
+                [
+                    {
+                        "chunk_id": chunk["chunk_id"],
+                        "text": chunk["text"],
+                        **chunk.get("metadata", {})
+                    }
+                    for chunk in batch
+                ]
+            )
+
+        print(f"✅ Added {len(chunks)} chunks")
+
+        if replace_documents:
+            document_ids = {
+                chunk.get("metadata", {}).get("document_id")
+                for chunk in chunks
+            } - {None}
+            for document_id in sorted(document_ids):
+                self.delete_stale_points(collection_name, document_id, point_ids)
+
+    def delete_stale_points(
+        self,
+        collection_name: str,
+        document_id: str,
+        keep_ids: List[str]
+    ):
+        """
+        재처리된 문서에서 사라진 청크의 포인트 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+            document_id: 문서 ID
+            keep_ids: 유지할 포인트 ID
+        """
+        collection = self.collections[collection_name]
+        keep = set(keep_ids)
+        with collection.lock:
+            stale = collection.filter_mask({"document_id": document_id}) & np.fromiter(
+                (point_id not in keep for point_id in collection.ids),
+                dtype=bool,
+                count=len(collection.ids)
+            )
+            stale_count = int(stale.sum())
+            if stale_count == 0:
+                return
+
+            collection.keep(~stale)
+        print(f"🧹 Deleted {stale_count} stale points of {document_id}")
+
+    def search(
+        self,
+        collection_name: str,
+        query_vector: List[float],
+        top_k: int = 5,
+        filters: Optional[Dict] = None,
+        score_threshold: Optional[float] = None,
+        timeout: Optional[float] = None
+    ) -> List[SearchResult]:
+        """
+        벡터 유사도 검색
+
+        Args:
+            collection_name: 컬렉션 이름
+            query_vector: 쿼리 벡터
+            top_k: 상위 K개 결과
+            filters: 메타데이터 필터 (예: {"type": "account_contact"})
+            score_threshold: 최소 유사도 점수 (Euclid는 최대 거리)
+            timeout: VectorStore 호환용 (프로세스 내 검색이라 사용하지 않음)
+
+        Returns:
+            검색 결과 리스트
+        """
+        return self.search_batch(
+            collection_name,
+            [query_vector],
+            top_k=top_k,
+            filters=filters,
+            score_threshold=score_threshold
+        )[0]
+
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors,
+        top_k: int = 5,
+        filters: Optional[Dict] = None,
+        score_threshold: Optional[float] = None
+    ) -> List[List[SearchResult]]:
+        """
+        다중 쿼리 벡터 검색 (행렬-행렬 곱 1회)
+
+        Args:
+            collection_name: 컬렉션 이름
+            query_vectors: (Q, dim) 쿼리 행렬 또는 벡터 리스트
+            top_k: 쿼리당 상위 K개 결과
+            filters: 메타데이터 필터 (모든 쿼리에 공통 적용)
+            score_threshold: 최소 유사도 점수 (Euclid는 최대 거리)
+
+        Returns:
+            쿼리 순서대로 검색 결과 리스트
+        """
+        collection = self.collections[collection_name]
+        queries = np.asarray(query_vectors, dtype=np.float32).reshape(-1, collection.vector_size)
+        if len(queries) == 0:
+            return []
+
+        matrix, payloads, mask = collection.snapshot(filters)
+        if len(matrix) == 0 or top_k <= 0:
+            return [[] for _ in range(len(queries))]
+
+        if collection.distance == "Euclid":
+            # 거리 오름차순 = 음의 거리 내림차순
+            squared = (
+                np.einsum("ij,ij->i", queries, queries)[:, None]
+                - 2.0 * (queries @ matrix.T)
+                + np.einsum("ij,ij->i", matrix, matrix)[None, :]
+            )
+            scores = -np.sqrt(np.maximum(squared, 0.0))
+            threshold = -score_threshold if score_threshold is not None else None
+        else:
+            if collection.distance == "Cosine":
+                norms = np.linalg.norm(queries, axis=1, keepdims=True)
+                queries = queries / np.where(norms == 0, 1.0, norms)
+            scores = queries @ matrix.T
+            threshold = score_threshold
+
+        candidates = np.arange(len(matrix)) if mask is None else np.flatnonzero(mask)
+
+        return [
+            self._top_k(collection, payloads, row, candidates, top_k, threshold)
+            for row in scores
+        ]
+
+    @staticmethod
+    def _top_k(
+        collection: _Collection,
+        payloads: List[Dict],
+        scores: np.ndarray,
+        candidates: np.ndarray,
+        top_k: int,
+        threshold: Optional[float]
+    ) -> List[SearchResult]:
+        """단일 쿼리 점수 벡터에서 후보 중 상위 K개 선택 (argpartition 후 부분 정렬)"""
+        if threshold is not None:
+            candidates = candidates[scores[candidates] >= threshold]
+        if len(candidates) == 0:
+            return []
+
+        k = min(top_k, len(candidates))
+        candidate_scores = scores[candidates]
+        if k < len(candidates):
+            top = np.argpartition(-candidate_scores, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-candidate_scores[top], kind="stable")]
+
+        results = []
+        for i in top:
+            payload = payloads[candidates[i]]
+            score = float(candidate_scores[i])
+            results.append(SearchResult(
+                chunk_id=payload.get("chunk_id", ""),
+                text=payload.get("text", ""),
+                score=-score if collection.distance == "Euclid" else score,
+                metadata={k: v for k, v in payload.items()
+                          if k not in ["chunk_id", "text"]}
+            ))
+
+        return results
+
+    def search_by_filters(
+        self,
+        collection_name: str,
+        filters: Dict,
+        limit: int = 100
+    ) -> List[Dict]:
+        """
+        메타데이터 필터로 검색 (벡터 검색 없이)
+
+        Args:
+            collection_name: 컬렉션 이름
+            filters: 메타데이터 필터
+            limit: 최대 결과 수
+
+        Returns:
+            문서 리스트
+        """
+        _, payloads, mask = self.collections[collection_name].snapshot(filters)
+        indices = np.arange(len(payloads)) if mask is None else np.flatnonzero(mask)
+        return [payloads[i] for i in indices[:limit]]
+
+    def delete_documents(
+        self,
+        collection_name: str,
+        filters: Dict
+    ):
+        """
+        메타데이터 필터로 문서 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+            filters: 메타데이터 필터
+        """
+        collection = self.collections[collection_name]
+        with collection.lock:
+            collection.keep(~collection.filter_mask(filters))
+        print(f"🗑️  Deleted documents matching filters: {filters}")
+
+    def get_collection_info(self, collection_name: str) -> Dict:
+        """컬렉션 정보 조회"""
+        collection = self.collections[collection_name]
+        count = len(collection.payloads)
+        return {
+            "name": collection_name,
+            "vectors_count": count,
+            "points_count": count,
+            "status": "green",
+            "config": {
+                "vector_size": collection.vector_size,
+                "distance": collection.distance.upper()
+            }
+        }
+
+    def list_collections(self) -> List[str]:
+        """모든 컬렉션 이름 조회"""
+        return list(self.collections.keys())
+
+    def delete_collection(self, collection_name: str):
+        """컬렉션 삭제"""
+        del self.collections[collection_name]
+        print(f"🗑️  Deleted collection: {collection_name}")
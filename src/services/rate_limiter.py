@@ -0,0 +1,97 @@
+"""
+요청 속도 제한 모듈
+- 분당 요청 수(RPM) / 분당 토큰 수(TPM) 기반 토큰 버킷
+- 여러 스레드에서 공유 가능
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucketRateLimiter:
+    """
+    토큰 버킷 속도 제한기
+
+    요청 버킷과 토큰 버킷 두 개를 관리하며,
+    두 버킷 모두 여유가 있을 때만 요청을 통과시킴
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None
+    ):
+        """
+        Args:
+            requests_per_minute: 분당 최대 요청 수 (None이면 제한 없음)
+            tokens_per_minute: 분당 최대 토큰 수 (None이면 제한 없음)
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        self._request_allowance = float(requests_per_minute or 0)
+        self._token_allowance = float(tokens_per_minute or 0)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        """경과 시간만큼 버킷 충전"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.requests_per_minute:
+            self._request_allowance = min(
+                float(self.requests_per_minute),
+                self._request_allowance + elapsed * self.requests_per_minute / 60.0
+            )
+        if self.tokens_per_minute:
+            self._token_allowance = min(
+                float(self.tokens_per_minute),
+                self._token_allowance + elapsed * self.tokens_per_minute / 60.0
+            )
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        요청 1건(토큰 tokens개)을 보낼 수 있을 때까지 대기
+
+        Args:
+            tokens: 요청에 포함될 예상 토큰 수
+
+        Returns:
+            대기한 시간 (초)
+        """
+        if not self.requests_per_minute and not self.tokens_per_minute:
+            return 0.0
+
+        # 버킷 용량보다 큰 요청은 용량만큼만 차감 (무한 대기 방지)
+        if self.tokens_per_minute:
+            tokens = min(tokens, self.tokens_per_minute)
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+
+                wait_time = 0.0
+                if self.requests_per_minute and self._request_allowance < 1:
+                    wait_time = max(
+                        wait_time,
+                        (1 - self._request_allowance) * 60.0 / self.requests_per_minute
+                    )
+                if self.tokens_per_minute and self._token_allowance < tokens:
+                    wait_time = max(
+                        wait_time,
+                        (tokens - self._token_allowance) * 60.0 / self.tokens_per_minute
+                    )
+
+                if wait_time == 0.0:
+                    if self.requests_per_minute:
+                        self._request_allowance -= 1
+                    if self.tokens_per_minute:
+                        self._token_allowance -= tokens
+                    return waited
+
+            time.sleep(wait_time)
+            waited += wait_time
@@ -5,23 +5,54 @@
 - 검색 기능
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, wait
+import hashlib
+import heapq
+import itertools
+import math
+import threading
+import time
 import uuid
 
+import numpy as np
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    Batch,
     Distance,
     VectorParams,
     PointStruct,
     Filter,
     FieldCondition,
+    HasIdCondition,
     MatchValue,
+    PayloadSchemaType,
     SearchParams,
+    SearchRequest,
 )
 from tqdm import tqdm
 
 
+# 결정적 포인트 ID 네임스페이스 (변경 시 기존 포인트와 ID가 달라지므로 고정)
+POINT_ID_NAMESPACE = uuid.UUID("6f0c9a8e-3b1d-5c2e-9f47-2d8b1e6a4c30")
+
+
+def content_hash(text: str) -> str:
+    """청크 텍스트 해시 (sha256 hex)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_point_id(chunk_id: str, text: str) -> str:
+    """
+    chunk_id + 내용 해시로 결정적 포인트 ID 생성 (UUID5)
+
+    같은 청크를 다시 넣으면 같은 ID → upsert가 제자리 덮어쓰기
+    내용이 바뀌면 ID가 달라지므로 이전 포인트는 stale 정리 대상
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{chunk_id}:{content_hash(text)}"))
+
+
 @dataclass
 class SearchResult:
     """검색 결과"""
@@ -67,6 +98,10 @@ class VectorStore:
             )
             print(f"✅ Vector store connected to {host}:{port}")
 
+        # 컬렉션 이름 캐시 (collection_exists마다 전체 목록 조회 방지, 생성/삭제 시 갱신)
+        self._collection_names: Optional[Set[str]] = None
+        self._collection_lock = threading.Lock()
+
     def create_collection(
         self,
         collection_name: str,
@@ -92,6 +127,7 @@ class VectorStore:
 
         if recreate and self.collection_exists(collection_name):
             self.client.delete_collection(collection_name)
+            self._forget_collection(collection_name)
             print(f"🗑️  Deleted existing collection: {collection_name}")
 
         if not self.collection_exists(collection_name):
@@ -102,58 +138,110 @@ class VectorStore:
                     distance=distance_map.get(distance, Distance.COSINE)
                 )
             )
+            self._remember_collection(collection_name)
             print(f"✅ Created collection: {collection_name} (dim={vector_size})")
         else:
             print(f"ℹ️  Collection already exists: {collection_name}")
 
     def collection_exists(self, collection_name: str) -> bool:
-        """컬렉션 존재 여부 확인"""
-        collections = self.client.get_collections().collections
-        return any(c.name == collection_name for c in collections)
+        """컬렉션 존재 여부 확인 (캐시 사용, 최초 1회만 서버 조회)"""
+        with self._collection_lock:
+            if self._collection_names is None:
+                self._collection_names = self._fetch_collection_names()
+            return collection_name in self._collection_names
+
+    def refresh_collections(self):
+        """컬렉션 이름 캐시 무효화 (다른 프로세스가 컬렉션을 변경한 경우)"""
+        with self._collection_lock:
+            self._collection_names = None
+
+    def _fetch_collection_names(self) -> Set[str]:
+        """서버에서 컬렉션 이름 목록 조회"""
+        return {c.name for c in self.client.get_collections().collections}
+
+    def create_payload_index(self, collection_name: str, field_name: str):
+        """
+        payload 키워드 인덱스 생성 (필터 검색 가속)
+
+        Args:
+            collection_name: 컬렉션 이름
+            field_name: 인덱싱할 payload 필드
+        """
+        self.client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field_name,
+            field_schema=PayloadSchemaType.KEYWORD
+        )
+
+    def _remember_collection(self, collection_name: str):
+        with self._collection_lock:
+            if self._collection_names is not None:
+                self._collection_names.add(collection_name)
+
+    def _forget_collection(self, collection_name: str):
+        with self._collection_lock:
+            if self._collection_names is not None:
+                self._collection_names.discard(collection_name)
 
     def add_documents(
         self,
         collection_name: str,
         chunks: List[Dict],  # {chunk_id, text, embedding, metadata}
         batch_size: int = 100,
-        show_progress: bool = True
+        show_progress: bool = True,
+        embeddings: Optional[np.ndarray] = None,
+        replace_documents: bool = False
     ):
         """
-        문서 청크 추가
+        문서 청크 추가 (결정적 ID로 upsert → 재실행해도 중복 없음)
 
         Args:
             collection_name: 컬렉션 이름
             chunks: 청크 리스트
             batch_size: 배치 크기
             show_progress: 진행률 표시
+            embeddings: (N, dim) 임베딩 행렬 (주어지면 청크의 "embedding" 대신 사용)
+            replace_documents: True면 chunks에 포함된 문서(document_id)의 기존 포인트 중
+                               이번에 넣지 않은 포인트 삭제 (문서 전체 청크를 넘길 때만 사용)
         """
         if not chunks:
             print("⚠️  No chunks to add")
             return
 
-        print(f"📥 Adding {len(chunks)} chunks to {collection_name}")
+        if embeddings is not None and len(embeddings) != len(chunks):
+            raise ValueError(
+                f"Embeddings count ({len(embeddings)}) does not match chunks ({len(chunks)})"
+            )
 
-        # 배치 처리
-        batches = [
-            chunks[i:i + batch_size]
-            for i in range(0, len(chunks), batch_size)
-        ]
+        print(f"📥 Adding {len(chunks)} chunks to {collection_name}")
 
-        iterator = tqdm(batches, desc="Uploading") if show_progress else batches
+        point_ids = [make_point_id(chunk["chunk_id"], chunk["text"]) for chunk in chunks]
 
-        for batch in iterator:
-            points = []
-            for chunk in batch:
-                point = PointStruct(
-                    id=str(uuid.uuid4()),  # 고유 ID
-                    vector=chunk["embedding"],
-                    payload={
+        # 배치 처리
+        starts = range(0, len(chunks), batch_size)
+        iterator = tqdm(starts, desc="Uploading") if show_progress else starts
+
+        for start in iterator:
+            batch = chunks[start:start + batch_size]
+
+            # 배치 단위로만 float 리스트로 변환 (전체 행렬 복사 방지)
+            if embeddings is not None:
+                vectors = np.asarray(embeddings[start:start + batch_size], dtype=np.float32)
+            else:
+                vectors = np.asarray([chunk["embedding"] for chunk in batch], dtype=np.float32)
+
+            points = Batch(
+                ids=point_ids[start:start + batch_size],  # 결정적 ID
+                vectors=vectors.tolist(),
+                payloads=[
+                    {
                         "chunk_id": chunk["chunk_id"],
                         "text": chunk["text"],
                         **chunk.get("metadata", {})
                     }
-                )
-                points.append(point)
+                    for chunk in batch
+                ]
+            )
 
             self.client.upsert(
                 collection_name=collection_name,
@@ -162,13 +250,55 @@ class VectorStore:
 
         print(f"✅ Added {len(chunks)} chunks")
 
+        if replace_documents:
+            document_ids = {
+                chunk.get("metadata", {}).get("document_id")
+                for chunk in chunks
+            } - {None}
+            for document_id in sorted(document_ids):
+                self.delete_stale_points(collection_name, document_id, point_ids)
+
+    def delete_stale_points(
+        self,
+        collection_name: str,
+        document_id: str,
+        keep_ids: List[str]
+    ):
+        """
+        재처리된 문서에서 사라진 청크의 포인트 삭제
+
+        Args:
+            collection_name: 컬렉션 이름
+            document_id: 문서 ID
+            keep_ids: 유지할 포인트 ID (이번에 upsert한 ID)
+        """
+        stale_filter = Filter(
+            must=[FieldCondition(key="document_id", match=MatchValue(value=document_id))],
+            must_not=[HasIdCondition(has_id=list(keep_ids))]
+        )
+
+        stale_count = self.client.count(
+            collection_name=collection_name,
+            count_filter=stale_filter,
+            exact=True
+        ).count
+        if stale_count == 0:
+            return
+
+        self.client.delete(
+            collection_name=collection_name,
+            points_selector=stale_filter
+        )
+        print(f"🧹 Deleted {stale_count} stale points of {document_id}")
+
     def search(
         self,
         collection_name: str,
         query_vector: List[float],
         top_k: int = 5,
         filters: Optional[Dict] = None,
-        score_threshold: Optional[float] = None
+        score_threshold: Optional[float] = None,
+        timeout: Optional[float] = None
     ) -> List[SearchResult]:
         """
         벡터 유사도 검색
@@ -179,48 +309,100 @@ class VectorStore:
             top_k: 상위 K개 결과
             filters: 메타데이터 필터 (예: {"type": "account_contact"})
             score_threshold: 최소 유사도 점수
+            timeout: 요청 타임아웃(초, 정수로 올림), None이면 클라이언트 기본값
 
         Returns:
             검색 결과 리스트
         """
-        # 필터 생성
-        query_filter = None
-        if filters:
-            conditions = []
-            for key, value in filters.items():
-                conditions.append(
-                    FieldCondition(
-                        key=key,
-                        match=MatchValue(value=value)
-                    )
-                )
-            query_filter = Filter(must=conditions)
-
         # 검색
         search_result = self.client.search(
             collection_name=collection_name,
             query_vector=query_vector,
             limit=top_k,
-            query_filter=query_filter,
+            query_filter=self._build_filter(filters),
             score_threshold=score_threshold,
             with_payload=True,
-            with_vectors=False
+            with_vectors=False,
+            timeout=None if timeout is None else max(1, math.ceil(timeout))
         )
 
-        # 결과 변환
-        results = []
-        for hit in search_result:
-            payload = hit.payload
-            result = SearchResult(
-                chunk_id=payload.get("chunk_id", ""),
-                text=payload.get("text", ""),
-                score=hit.score,
-                metadata={k: v for k, v in payload.items()
-                         if k not in ["chunk_id", "text"]}
+        return [self._to_search_result(hit) for hit in search_result]
+
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors,
+        top_k: int = 5,
+        filters: Optional[Dict] = None,
+        score_threshold: Optional[float] = None
+    ) -> List[List[SearchResult]]:
+        """
+        다중 쿼리 벡터 검색 (Qdrant batch search, 1회 왕복)
+
+        Args:
+            collection_name: 컬렉션 이름
+            query_vectors: (Q, dim) 쿼리 행렬 또는 벡터 리스트
+            top_k: 쿼리당 상위 K개 결과
+            filters: 메타데이터 필터 (모든 쿼리에 공통 적용)
+            score_threshold: 최소 유사도 점수
+
+        Returns:
+            쿼리 순서대로 검색 결과 리스트
+        """
+        query_matrix = np.asarray(query_vectors, dtype=np.float32)
+        if len(query_matrix) == 0:
+            return []
+
+        query_filter = self._build_filter(filters)
+        requests = [
+            SearchRequest(
+                vector=vector,
+                filter=query_filter,
+                limit=top_k,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vector=False
             )
-            results.append(result)
+            for vector in query_matrix.tolist()
+        ]
+
+        batch_result = self.client.search_batch(
+            collection_name=collection_name,
+            requests=requests
+        )
+
+        return [
+            [self._to_search_result(hit) for hit in hits]
+            for hits in batch_result
+        ]
 
-        return results
+    @staticmethod
+    def _build_filter(filters: Optional[Dict]) -> Optional[Filter]:
+        """메타데이터 필터 딕셔너리 -> Qdrant Filter (모든 조건 AND)"""
+        if not filters:
+            return None
+
+        conditions = []
+        for key, value in filters.items():
+            conditions.append(
+                FieldCondition(
+                    key=key,
+                    match=MatchValue(value=value)
+                )
+            )
+        return Filter(must=conditions)
+
+    @staticmethod
+    def _to_search_result(hit) -> SearchResult:
+        """Qdrant ScoredPoint -> SearchResult"""
+        payload = hit.payload
+        return SearchResult(
+            chunk_id=payload.get("chunk_id", ""),
+            text=payload.get("text", ""),
+            score=hit.score,
+            metadata={k: v for k, v in payload.items()
+                     if k not in ["chunk_id", "text"]}
+        )
 
     def search_by_filters(
         self,
@@ -308,13 +490,16 @@ class VectorStore:
         }
 
     def list_collections(self) -> List[str]:
-        """모든 컬렉션 이름 조회"""
+        """모든 컬렉션 이름 조회 (서버 조회 결과로 캐시 갱신)"""
         collections = self.client.get_collections().collections
+        with self._collection_lock:
+            self._collection_names = {c.name for c in collections}
         return [c.name for c in collections]
 
     def delete_collection(self, collection_name: str):
         """컬렉션 삭제"""
         self.client.delete_collection(collection_name)
+        self._forget_collection(collection_name)
         print(f"🗑️  Deleted collection: {collection_name}")
 
 
@@ -333,9 +518,42 @@ class MultiCollectionVectorStore:
         self,
         host: str = "localhost",
         port: int = 6333,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        max_workers: int = 8,
+        search_timeout: Optional[float] = 5.0,
+        store: Optional[VectorStore] = None,
+        collection_prefix: str = "crm"
     ):
-        self.store = VectorStore(host=host, port=port, api_key=api_key)
+        """
+        Args:
+            host: Qdrant 호스트
+            port: Qdrant 포트
+            api_key: API 키 (클라우드 사용 시)
+            max_workers: 컬렉션 동시 검색 스레드 수
+            search_timeout: search_all_collections 전체 기한(초), None이면 무제한
+            store: 기존 VectorStore 재사용 (예: 메모리 모드), 주어지면 host/port 무시
+            collection_prefix: 컬렉션 이름 접두사 ({prefix}_{type}_{lang}, 벤치마크 등은 별도 접두사 사용)
+        """
+        self.store = store or VectorStore(host=host, port=port, api_key=api_key)
+        self.collection_prefix = collection_prefix
+        self.max_workers = max_workers
+        self.search_timeout = search_timeout
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """검색용 스레드 풀 (최초 사용 시 생성, 이후 재사용)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="vector-search"
+                )
+            return self._executor
+
+    def collection_name(self, document_type: str, language: str) -> str:
+        """타입/언어 코드 → 컬렉션 이름 (예: account/ko → crm_account_ko)"""
+        return f"{self.collection_prefix}_{document_type}_{language}"
 
     def initialize_crm_collections(
         self,
@@ -356,7 +574,7 @@ class MultiCollectionVectorStore:
 
         for doc_type in doc_types:
             for lang in languages:
-                collection_name = f"crm_{doc_type}_{lang}"
+                collection_name = self.collection_name(doc_type, lang)
                 self.store.create_collection(
                     collection_name=collection_name,
                     vector_size=vector_size,
@@ -369,7 +587,9 @@ class MultiCollectionVectorStore:
         document_type: str,  # account, meeting, order, common
         language: str,       # ko, en
         chunks: List[Dict],
-        batch_size: int = 100
+        batch_size: int = 100,
+        embeddings: Optional[np.ndarray] = None,
+        replace_documents: bool = False
     ):
         """
         특정 문서 타입/언어의 청크 추가
@@ -379,62 +599,131 @@ class MultiCollectionVectorStore:
             language: 언어
             chunks: 청크 리스트
             batch_size: 배치 크기
+            embeddings: (N, dim) 임베딩 행렬
+            replace_documents: 문서의 기존 포인트 중 이번에 넣지 않은 포인트 삭제
         """
-        collection_name = f"crm_{document_type}_{language}"
+        collection_name = self.collection_name(document_type, language)
         self.store.add_documents(
             collection_name=collection_name,
             chunks=chunks,
-            batch_size=batch_size
+            batch_size=batch_size,
+            embeddings=embeddings,
+            replace_documents=replace_documents
         )
 
+    def prune_document(
+        self,
+        document_type: str,
+        language: str,
+        document_id: str,
+        keep_ids: List[str]
+    ):
+        """
+        문서의 포인트 중 keep_ids에 없는 포인트 삭제 (재처리 후 stale 정리)
+
+        Args:
+            document_type: 문서 타입
+            language: 언어
+            document_id: 문서 ID
+            keep_ids: 유지할 포인트 ID (문서의 현재 전체 청크)
+        """
+        collection_name = self.collection_name(document_type, language)
+        if self.store.collection_exists(collection_name):
+            self.store.delete_stale_points(collection_name, document_id, keep_ids)
+
+    def _search_before_deadline(self, deadline: Optional[float], **kwargs) -> List[SearchResult]:
+        """남은 기한을 요청 타임아웃으로 넘겨 검색 (기한이 지났으면 검색하지 않음)"""
+        if deadline is None:
+            return self.store.search(**kwargs)
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("search deadline exceeded before the request started")
+        return self.store.search(**kwargs, timeout=remaining)
+
     def search_all_collections(
         self,
         query_vector: List[float],
         top_k: int = 5,
         language: Optional[str] = None,
-        doc_type: Optional[str] = None
+        doc_type: Optional[str] = None,
+        timeout: Optional[float] = None
     ) -> List[SearchResult]:
         """
-        여러 컬렉션에서 검색 후 결합
+        여러 컬렉션에서 동시 검색 후 결합
 
         Args:
             query_vector: 쿼리 벡터
             top_k: 컬렉션당 상위 K개 (총 결과는 더 많을 수 있음)
             language: 언어 필터 (None이면 모든 언어)
             doc_type: 문서 타입 필터 (None이면 모든 타입)
+            timeout: 전체 검색 기한(초), None이면 search_timeout 사용
+                     (기한 내 끝나지 않은 컬렉션 결과는 제외)
 
         Returns:
             통합 검색 결과 (점수 순 정렬)
         """
-        all_results = []
-
         # 검색할 컬렉션 결정
         doc_types = [doc_type] if doc_type else ["account", "meeting", "order", "common"]
         languages = [language] if language else ["ko", "en"]
 
-        for dt in doc_types:
-            for lang in languages:
-                collection_name = f"crm_{dt}_{lang}"
-
-                if self.store.collection_exists(collection_name):
-                    results = self.store.search(
-                        collection_name=collection_name,
-                        query_vector=query_vector,
-                        top_k=top_k
-                    )
-                    all_results.extend(results)
-
-        # 점수 순 정렬
-        all_results.sort(key=lambda x: x.score, reverse=True)
+        collection_names = [
+            self.collection_name(dt, lang)
+            for dt in doc_types
+            for lang in languages
+            if self.store.collection_exists(self.collection_name(dt, lang))
+        ]
+        if not collection_names:
+            return []
+
+        timeout = self.search_timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        executor = self._get_executor()
+        futures = {
+            executor.submit(
+                self._search_before_deadline,
+                deadline,
+                collection_name=collection_name,
+                query_vector=query_vector,
+                top_k=top_k
+            ): collection_name
+            for collection_name in collection_names
+        }
+        done, pending = wait(futures, timeout=timeout)
+
+        for future in pending:
+            future.cancel()
+        if pending:
+            skipped = sorted(futures[f] for f in pending)
+            print(f"⚠️  Search deadline ({timeout}s) exceeded, skipped: {', '.join(skipped)}")
+
+        result_lists = []
+        for future in done:
+            try:
+                result_lists.append(future.result())
+            except Exception as e:
+                print(f"⚠️  Search failed in {futures[future]}: {e}")
+
+        # 점수 순 상위 결과 (전체 정렬 대신 힙)
+        return heapq.nlargest(
+            top_k * 2,  # 최종 상위 결과 반환
+            itertools.chain.from_iterable(result_lists),
+            key=lambda x: x.score
+        )
 
-        return all_results[:top_k * 2]  # 최종 상위 결과 반환
+    def close(self):
+        """검색 스레드 풀 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
 
     def get_all_stats(self) -> Dict[str, Dict]:
         """모든 컬렉션 통계"""
         stats = {}
 
         for collection_name in self.store.list_collections():
-            if collection_name.startswith("crm_"):
+            if collection_name.startswith(f"{self.collection_prefix}_"):
                 try:
                     stats[collection_name] = self.store.get_collection_info(collection_name)
                 except:
@@ -443,13 +732,207 @@ class MultiCollectionVectorStore:
         return stats
 
 
+# 통합 컬렉션 레이아웃: 컬렉션 이름의 타입/언어 코드 -> 청크 payload 값
+DOC_TYPE_PAYLOAD = {
+    "account": "account_contact",
+    "meeting": "meeting_memo",
+    "order": "order_fulfillment",
+    "common": "common_master",
+}
+LANGUAGE_PAYLOAD = {"ko": "korean", "en": "english"}
+
+
+class UnifiedCollectionVectorStore:
+    """
+    단일 컬렉션 벡터 스토어 (MultiCollectionVectorStore 대체 레이아웃)
+
+    모든 청크를 하나의 컬렉션에 저장하고 type/language/document_id payload 인덱스로
+    타입/언어 제한을 필터 검색(filtered HNSW)으로 처리 → 교차 타입 질의도 검색 1회
+    """
+
+    INDEXED_FIELDS = ["type", "language", "document_id"]
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6333,
+        api_key: Optional[str] = None,
+        collection_name: str = "crm_unified",
+        store: Optional[VectorStore] = None
+    ):
+        """
+        Args:
+            host: Qdrant 호스트
+            port: Qdrant 포트
+            api_key: API 키 (클라우드 사용 시)
+            collection_name: 통합 컬렉션 이름
+            store: 기존 VectorStore 재사용 (예: 메모리 모드), 주어지면 host/port 무시
+        """
+        self.store = store or VectorStore(host=host, port=port, api_key=api_key)
+        self.collection_name = collection_name
+
+    def initialize_crm_collections(
+        self,
+        vector_size: int,
+        recreate: bool = False
+    ):
+        """
+        통합 컬렉션 + payload 인덱스 초기화
+
+        Args:
+            vector_size: 벡터 차원
+            recreate: 기존 컬렉션 삭제 후 재생성
+        """
+        print(f"🏗️  Initializing unified CRM collection (vector_size={vector_size})")
+
+        self.store.create_collection(
+            collection_name=self.collection_name,
+            vector_size=vector_size,
+            distance="Cosine",
+            recreate=recreate
+        )
+        for field_name in self.INDEXED_FIELDS:
+            self.store.create_payload_index(self.collection_name, field_name)
+
+    def add_document_chunks(
+        self,
+        document_type: str,  # account, meeting, order, common
+        language: str,       # ko, en
+        chunks: List[Dict],
+        batch_size: int = 100,
+        embeddings: Optional[np.ndarray] = None,
+        replace_documents: bool = False
+    ):
+        """
+        특정 문서 타입/언어의 청크 추가 (type/language payload가 없으면 채움)
+
+        Args:
+            document_type: 문서 타입
+            language: 언어
+            chunks: 청크 리스트
+            batch_size: 배치 크기
+            embeddings: (N, dim) 임베딩 행렬
+            replace_documents: 문서의 기존 포인트 중 이번에 넣지 않은 포인트 삭제
+        """
+        routed_chunks = []
+        for chunk in chunks:
+            metadata = dict(chunk.get("metadata", {}))
+            metadata.setdefault("type", DOC_TYPE_PAYLOAD.get(document_type, document_type))
+            metadata.setdefault("language", LANGUAGE_PAYLOAD.get(language, language))
+            routed_chunks.append({**chunk, "metadata": metadata})
+
+        self.store.add_documents(
+            collection_name=self.collection_name,
+            chunks=routed_chunks,
+            batch_size=batch_size,
+            embeddings=embeddings,
+            replace_documents=replace_documents
+        )
+
+    def prune_document(
+        self,
+        document_type: str,
+        language: str,
+        document_id: str,
+        keep_ids: List[str]
+    ):
+        """
+        문서의 포인트 중 keep_ids에 없는 포인트 삭제 (재처리 후 stale 정리)
+
+        Args:
+            document_type: 문서 타입 (인터페이스 호환용)
+            language: 언어 (인터페이스 호환용)
+            document_id: 문서 ID
+            keep_ids: 유지할 포인트 ID (문서의 현재 전체 청크)
+        """
+        if self.store.collection_exists(self.collection_name):
+            self.store.delete_stale_points(self.collection_name, document_id, keep_ids)
+
+    def search_all_collections(
+        self,
+        query_vector: List[float],
+        top_k: int = 5,
+        language: Optional[str] = None,
+        doc_type: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[SearchResult]:
+        """
+        통합 컬렉션에서 필터 검색 1회
+
+        MultiCollectionVectorStore와 같은 결과 수를 반환
+        (타입/언어가 모두 지정되면 top_k, 아니면 top_k * 2)
+
+        Args:
+            query_vector: 쿼리 벡터
+            top_k: 상위 K개
+            language: 언어 필터 (ko/en, None이면 모든 언어)
+            doc_type: 문서 타입 필터 (account/meeting/order/common, None이면 모든 타입)
+            timeout: 인터페이스 호환용 (검색 1회이므로 사용하지 않음)
+
+        Returns:
+            검색 결과 (점수 순 정렬)
+        """
+        filters = {}
+        if doc_type:
+            filters["type"] = DOC_TYPE_PAYLOAD.get(doc_type, doc_type)
+        if language:
+            filters["language"] = LANGUAGE_PAYLOAD.get(language, language)
+
+        if not self.store.collection_exists(self.collection_name):
+            return []
+
+        return self.store.search(
+            collection_name=self.collection_name,
+            query_vector=query_vector,
+            top_k=top_k if doc_type and language else top_k * 2,
+            filters=filters or None
+        )
+
+    def close(self):
+        """인터페이스 호환용 (정리할 리소스 없음)"""
+
+    def get_all_stats(self) -> Dict[str, Dict]:
+        """통합 컬렉션 통계"""
+        try:
+            return {self.collection_name: self.store.get_collection_info(self.collection_name)}
+        except:
+            return {self.collection_name: {"error": "Failed to get info"}}
+
+
 # 유틸리티 함수
+def create_vector_store(backend: str = "qdrant", **kwargs):
+    """
+    벡터 스토어 팩토리
+
+    Args:
+        backend: "qdrant" (VectorStore) 또는 "numpy" (NumpyVectorStore, 메모리 전용)
+        **kwargs: VectorStore 인자 (host, port, api_key, use_memory)
+                  numpy는 메모리 전용이라 use_memory=True만 허용
+
+    Returns:
+        VectorStore 호환 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 backend 또는 numpy에 적용할 수 없는 인자
+    """
+    if backend == "numpy":
+        unsupported = sorted(key for key, value in kwargs.items() if not (key == "use_memory" and value))
+        if unsupported:
+            raise ValueError(f"numpy vector store is in-memory only; unsupported arguments: {', '.join(unsupported)}")
+        from .numpy_vector_store import NumpyVectorStore
+        return NumpyVectorStore()
+    if backend == "qdrant":
+        return VectorStore(**kwargs)
+    raise ValueError(f"Unknown vector store backend: {backend}")
+
+
 def setup_crm_vector_store(
     host: str = "localhost",
     port: int = 6333,
     vector_size: int = 3072,  # OpenAI text-embedding-3-large
-    recreate: bool = False
-) -> MultiCollectionVectorStore:
+    recreate: bool = False,
+    layout: str = "multi"
+):
     """
     CRM RAG 챗봇용 벡터 스토어 셋업
 
@@ -458,11 +941,15 @@ def setup_crm_vector_store(
         port: Qdrant 포트
         vector_size: 벡터 차원
         recreate: 기존 컬렉션 삭제 후 재생성
+        layout: "multi" (타입/언어별 8개 컬렉션) 또는 "unified" (단일 컬렉션 + payload 인덱스)
 
     Returns:
-        MultiCollectionVectorStore 인스턴스
+        MultiCollectionVectorStore 또는 UnifiedCollectionVectorStore 인스턴스
     """
-    store = MultiCollectionVectorStore(host=host, port=port)
+    if layout == "unified":
+        store = UnifiedCollectionVectorStore(host=host, port=port)
+    else:
+        store = MultiCollectionVectorStore(host=host, port=port)
     store.initialize_crm_collections(vector_size=vector_size, recreate=recreate)
     return store
 
@@ -6,10 +6,12 @@
 """
 
 import re
-from typing import List, Dict, Optional, Literal
+from typing import Iterable, Iterator, List, Dict, Optional, Literal
 from dataclasses import dataclass, field
 import hashlib
 
+from .token_estimator import estimate_tokens
+
 try:
     from langchain.text_splitter import (
         RecursiveCharacterTextSplitter,
@@ -40,13 +42,7 @@ class Chunk:
     @staticmethod
     def _estimate_tokens(text: str) -> int:
         """토큰 수 추정 (실제 tokenizer 사용 시 더 정확)"""
-        # 영어: ~4 chars/token, 한국어: ~2 chars/token
-        # 간단한 휴리스틱
-        korean_chars = len(re.findall(r'[가-힣]', text))
-        other_chars = len(text) - korean_chars
-
-        estimated = (korean_chars / 2) + (other_chars / 4)
-        return int(estimated)
+        return estimate_tokens(text)
 
 
 class DocumentChunker:
@@ -60,6 +56,17 @@ class DocumentChunker:
     4. Token-based: 토큰 수 기반 청킹
     """
 
+    # 섹션 헤더 패턴 (다양한 형식 지원)
+    SECTION_PATTERNS = [
+        r'^#{1,6}\s+.+$',           # Markdown 헤더
+        r'^\d+\.\s+.+$',            # 1. 제목
+        r'^\d+\.\d+\s+.+$',         # 1.1 제목
+        r'^\d+\.\d+\.\d+\s+.+$',    # 1.1.1 제목
+        r'^[A-Z][^a-z]*$',          # 대문자만 (TITLE)
+        r'^제\d+장.+$',              # 제1장 ...
+        r'^제\d+절.+$',              # 제1절 ...
+    ]
+
     def __init__(
         self,
         chunk_size: int = 1000,
@@ -96,32 +103,79 @@ class DocumentChunker:
         Returns:
             청크 리스트
         """
+        chunks = self._split_text(text, metadata, strategy)
+
+        # 너무 작은 청크 필터링
+        chunks = [c for c in chunks if c.char_count >= self.min_chunk_size]
+
+        return chunks
+
+    def _split_text(self, text: str, metadata: Dict, strategy: str) -> List[Chunk]:
+        """전략별 청킹 (최소 크기 필터링 전)"""
         if strategy == "fixed":
-            chunks = self._chunk_fixed_size(text, metadata)
+            return self._chunk_fixed_size(text, metadata)
         elif strategy == "recursive":
-            chunks = self._chunk_recursive(text, metadata)
+            return self._chunk_recursive(text, metadata)
         elif strategy == "semantic":
-            chunks = self._chunk_semantic(text, metadata)
+            return self._chunk_semantic(text, metadata)
         elif strategy == "token":
-            chunks = self._chunk_by_tokens(text, metadata)
+            return self._chunk_by_tokens(text, metadata)
         else:
             raise ValueError(f"Unknown chunking strategy: {strategy}")
 
-        # 너무 작은 청크 필터링
-        chunks = [c for c in chunks if c.char_count >= self.min_chunk_size]
+    def chunk_stream(
+        self,
+        texts: Iterable[str],
+        metadata: Dict,
+        strategy: Literal["fixed", "recursive", "semantic", "token"] = "recursive"
+    ) -> Iterator[Chunk]:
+        """
+        페이지 텍스트 스트림을 청킹 (결과는 "\n\n"으로 이어 붙인 전체 텍스트의 chunk_document와 같음)
 
-        return chunks
+        - fixed: 청크 끝까지 텍스트가 모이는 대로 바로 생성
+        - semantic: 섹션(제목 줄 ~ 다음 제목 줄)이 끝날 때마다 청킹
+        - recursive/token: LangChain 분할기는 문서 전체를 보고 구분자 단계를 고르므로
+          페이지 텍스트만 모아 문서 단위로 청킹 (페이지 객체는 모으지 않음)
+
+        Args:
+            texts: 페이지 텍스트 이터러블 (순서대로)
+            metadata: 문서 메타데이터
+            strategy: 청킹 전략
+
+        Yields:
+            청크 (chunk_id/chunk_index는 문서 전체 기준)
+        """
+        if strategy == "fixed":
+            chunks = self._stream_fixed_size(texts, metadata)
+        elif strategy == "semantic":
+            chunks = self._chunk_sections(self._iter_sections(self._iter_lines(texts)), metadata)
+        else:
+            chunks = self._split_text("\n\n".join(texts), metadata, strategy)
+
+        for chunk in chunks:
+            if chunk.char_count >= self.min_chunk_size:
+                yield chunk
+
+    @staticmethod
+    def _iter_lines(texts: Iterable[str]) -> Iterator[str]:
+        """페이지들을 "\n\n"으로 이어 붙인 텍스트의 줄 단위 이터레이터"""
+        for i, text in enumerate(texts):
+            if i:
+                yield ""
+            yield from text.split("\n")
 
     def _chunk_fixed_size(self, text: str, metadata: Dict) -> List[Chunk]:
         """고정 크기로 청킹"""
-        chunks = []
+        return list(self._stream_fixed_size([text], metadata))
+
+    def _stream_fixed_size(self, texts: Iterable[str], metadata: Dict) -> Iterator[Chunk]:
+        """고정 크기 청킹 (페이지 텍스트를 이어 붙이며 청크 끝까지 모이면 바로 생성)"""
+        buffer = ""
+        offset = 0  # buffer[0]의 문서 내 위치
         start = 0
         chunk_index = 0
 
-        while start < len(text):
-            end = start + self.chunk_size
-            chunk_text = text[start:end]
-
+        def make_chunk(chunk_text: str) -> Chunk:
             chunk_id = self._generate_chunk_id(
                 metadata.get("document_id", "doc"),
                 chunk_index
@@ -131,20 +185,30 @@ class DocumentChunker:
             chunk_metadata.update({
                 "chunk_index": chunk_index,
                 "chunk_start": start,
-                "chunk_end": end,
+                "chunk_end": start + self.chunk_size,
             })
 
-            chunk = Chunk(
+            return Chunk(
                 chunk_id=chunk_id,
                 text=chunk_text,
                 metadata=chunk_metadata
             )
-            chunks.append(chunk)
 
-            start = end - self.chunk_overlap
-            chunk_index += 1
+        for i, text in enumerate(texts):
+            buffer += f"\n\n{text}" if i else text
+            while start + self.chunk_size <= offset + len(buffer):
+                yield make_chunk(buffer[start - offset:start - offset + self.chunk_size])
+                start += self.chunk_size - self.chunk_overlap
+                chunk_index += 1
 
-        return chunks
+            # 이미 지나간 앞부분은 버림
+            buffer = buffer[start - offset:]
+            offset = start
+
+        while start < offset + len(buffer):
+            yield make_chunk(buffer[start - offset:start - offset + self.chunk_size])
+            start += self.chunk_size - self.chunk_overlap
+            chunk_index += 1
 
     def _chunk_recursive(self, text: str, metadata: Dict) -> List[Chunk]:
         """
@@ -205,21 +269,11 @@ class DocumentChunker:
         섹션/소제목을 기준으로 청킹하고,
         너무 크면 추가로 분할
         """
-        # 섹션 헤더 패턴 (다양한 형식 지원)
-        section_patterns = [
-            r'^#{1,6}\s+.+$',           # Markdown 헤더
-            r'^\d+\.\s+.+$',            # 1. 제목
-            r'^\d+\.\d+\s+.+$',         # 1.1 제목
-            r'^\d+\.\d+\.\d+\s+.+$',    # 1.1.1 제목
-            r'^[A-Z][^a-z]*$',          # 대문자만 (TITLE)
-            r'^제\d+장.+$',              # 제1장 ...
-            r'^제\d+절.+$',              # 제1절 ...
-        ]
+        sections = self._split_by_sections(text, self.SECTION_PATTERNS)
+        return list(self._chunk_sections(sections, metadata))
 
-        # 섹션으로 분할
-        sections = self._split_by_sections(text, section_patterns)
-
-        chunks = []
+    def _chunk_sections(self, sections: Iterable[tuple[str, str]], metadata: Dict) -> Iterator[Chunk]:
+        """섹션 단위 청킹 (섹션이 너무 크면 추가 분할)"""
         chunk_index = 0
 
         for section_title, section_text in sections:
@@ -233,7 +287,7 @@ class DocumentChunker:
                         metadata.get("document_id", "doc"),
                         chunk_index
                     )
-                    chunks.append(sub_chunk)
+                    yield sub_chunk
                     chunk_index += 1
             else:
                 # 섹션 전체를 하나의 청크로
@@ -253,11 +307,9 @@ class DocumentChunker:
                     text=section_text,
                     metadata=chunk_metadata
                 )
-                chunks.append(chunk)
+                yield chunk
                 chunk_index += 1
 
-        return chunks
-
     def _chunk_by_tokens(self, text: str, metadata: Dict) -> List[Chunk]:
         """토큰 수 기반 청킹"""
         # TokenTextSplitter 사용 (OpenAI tokenizer)
@@ -298,8 +350,19 @@ class DocumentChunker:
         Returns:
             List of (section_title, section_content)
         """
-        lines = text.split('\n')
-        sections = []
+        return list(self._iter_sections(text.split('\n'), patterns))
+
+    def _iter_sections(
+        self,
+        lines: Iterable[str],
+        patterns: Optional[List[str]] = None
+    ) -> Iterator[tuple[str, str]]:
+        """
+        줄 단위로 섹션 분할 (다음 제목 줄이 나오면 앞 섹션을 바로 내보냄)
+
+        첫 제목 전 내용은 버리고, 제목이 하나도 없으면 전체를 "Document" 섹션으로
+        """
+        patterns = patterns or self.SECTION_PATTERNS
         current_section = None
         current_content = []
 
@@ -313,12 +376,9 @@ class DocumentChunker:
                     break
 
             if is_header:
-                # 이전 섹션 저장
+                # 이전 섹션 내보내기
                 if current_section is not None:
-                    sections.append((
-                        current_section,
-                        '\n'.join(current_content)
-                    ))
+                    yield current_section, '\n'.join(current_content)
 
                 # 새 섹션 시작
                 current_section = line.strip()
@@ -326,18 +386,11 @@ class DocumentChunker:
             else:
                 current_content.append(line)
 
-        # 마지막 섹션 저장
+        # 마지막 섹션 (섹션이 없으면 전체를 하나의 섹션으로)
         if current_section is not None:
-            sections.append((
-                current_section,
-                '\n'.join(current_content)
-            ))
-
-        # 섹션이 없으면 전체를 하나의 섹션으로
-        if not sections:
-            sections = [("Document", text)]
-
-        return sections
+            yield current_section, '\n'.join(current_content)
+        else:
+            yield "Document", '\n'.join(current_content)
 
     def _generate_chunk_id(self, document_id: str, chunk_index: int) -> str:
         """청크 ID 생성"""
@@ -0,0 +1,24 @@
+"""
+해시 유틸리티
+- 파일 내용 해시 (증분 처리 매니페스트, 파싱 캐시 키)
+- 설정 딕셔너리 해시
+"""
+
+import hashlib
+import json
+from typing import Dict
+
+
+def file_hash(path: str, block_size: int = 1 << 20) -> str:
+    """파일 내용 sha256 (블록 단위로 읽어 대용량 PDF도 메모리 일정)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def config_hash(config: Dict) -> str:
+    """설정 딕셔너리 해시 (키 정렬 JSON 기준)"""
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
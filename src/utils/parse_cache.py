@@ -0,0 +1,119 @@
+"""
+PDF 페이지 파싱 캐시
+- 파일 내용 해시 + 파서 옵션별 캐시 파일 1개, 페이지 단위 레코드
+- 청킹 설정만 바꿔 다시 실행할 때 PDF 파싱을 건너뜀
+"""
+
+import json
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, Optional, Set, Tuple
+
+from .hashing import config_hash
+
+
+# 페이지 추출/정제 로직이 바뀌면 올려서 기존 캐시 무효화
+PARSE_CACHE_VERSION = 2
+
+
+class PageParseCache:
+    """
+    페이지 단위 파싱 결과 캐시 (디스크)
+
+    디스크 구조 (cache_dir/):
+    - {파일 해시}_{옵션 해시}.pages: 레코드를 이어 붙인 추가 전용(append-only) 파일
+    - 레코드: 헤더 (page_number u32, length u32) + zlib 압축 JSON (text, tables, images, metadata)
+
+    키 = (파일 내용 해시, 파서 옵션, 페이지 번호). 파일 인덱스(페이지 → 위치)만 메모리에 두고
+    페이지는 요청 시 읽으므로 대용량 문서도 메모리 일정. 중간에 끊긴 마지막 레코드는 무시.
+    """
+
+    RECORD_HEADER = struct.Struct("<II")
+
+    def __init__(self, cache_dir: str = "data/parse_cache"):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._indexes: Dict[Path, Dict[int, Tuple[int, int]]] = {}
+
+    def _path(self, file_digest: str, options: Dict) -> Path:
+        options_digest = config_hash({"version": PARSE_CACHE_VERSION, **options})
+        return self.cache_dir / f"{file_digest[:32]}_{options_digest[:16]}.pages"
+
+    def _get_index(self, path: Path) -> Dict[int, Tuple[int, int]]:
+        """캐시 파일의 페이지 → (데이터 위치, 길이) 인덱스 (최초 1회 헤더만 스캔)"""
+        index = self._indexes.get(path)
+        if index is not None:
+            return index
+
+        index = {}
+        if path.exists():
+            file_size = path.stat().st_size
+            with open(path, 'rb') as f:
+                offset = 0
+                while offset + self.RECORD_HEADER.size <= file_size:
+                    page_number, length = self.RECORD_HEADER.unpack(f.read(self.RECORD_HEADER.size))
+                    data_offset = offset + self.RECORD_HEADER.size
+                    if data_offset + length > file_size:
+                        break  # 기록 중 끊긴 레코드
+                    index[page_number] = (data_offset, length)
+                    offset = data_offset + length
+                    f.seek(offset)
+
+            if offset < file_size:
+                # 끊긴 꼬리를 잘라내야 이후 추가하는 레코드를 다시 읽을 수 있음
+                with open(path, 'r+b') as f:
+                    f.truncate(offset)
+
+        self._indexes[path] = index
+        return index
+
+    def cached_pages(self, file_digest: str, options: Dict) -> Set[int]:
+        """캐시에 있는 페이지 번호 (1부터 시작)"""
+        with self._lock:
+            return set(self._get_index(self._path(file_digest, options)))
+
+    def get(self, file_digest: str, options: Dict, page_number: int) -> Optional[Dict]:
+        """페이지 조회 (PDFPage 필드 딕셔너리, 없으면 None)"""
+        path = self._path(file_digest, options)
+        with self._lock:
+            location = self._get_index(path).get(page_number)
+            if location is None:
+                return None
+            offset, length = location
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(length)
+
+        try:
+            return json.loads(zlib.decompress(data).decode("utf-8"))
+        except (zlib.error, ValueError) as e:
+            print(f"⚠️  Ignoring corrupt parse cache record (page {page_number}): {e}")
+            return None
+
+    def put(self, file_digest: str, options: Dict, page: Dict):
+        """페이지 저장 (page_number 포함 PDFPage 필드 딕셔너리)"""
+        data = zlib.compress(
+            json.dumps(page, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        )
+        path = self._path(file_digest, options)
+        with self._lock:
+            index = self._get_index(path)
+            with open(path, 'ab') as f:
+                offset = f.tell()
+                f.write(self.RECORD_HEADER.pack(page["page_number"], len(data)) + data)
+            index[page["page_number"]] = (offset + self.RECORD_HEADER.size, len(data))
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            for cache_file in self.cache_dir.glob("*.pages"):
+                cache_file.unlink()
+            self._indexes.clear()
@@ -4,16 +4,26 @@ PDF 파싱 모듈
 - 레이아웃 정보 보존
 """
 
+import hashlib
+import mmap
+import multiprocessing
+import os
 import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from dataclasses import asdict, dataclass, field
 
 import fitz  # PyMuPDF
 import pdfplumber
-from langdetect import detect
+from langdetect import DetectorFactory, detect
 from tqdm import tqdm
 
+# langdetect는 기본적으로 실행마다 결과가 달라질 수 있음 (경계 사례) → 고정 시드
+DetectorFactory.seed = 0
+
 
 @dataclass
 class PDFPage:
@@ -45,85 +55,224 @@ class PDFParser:
     - 이미지 추출
     - 메타데이터 추출
     - 언어 감지
+    - 페이지 구간 병렬 추출 (workers > 1)
+    - 하이브리드 추출 (PyMuPDF 우선, 품질 미달 페이지만 pdfplumber 레이아웃 모드)
+    - 파일당 파싱 세션 (open): 파일/백엔드를 한 번씩만 열어 공유
     """
 
-    def __init__(self, preserve_layout: bool = True):
+    # 하이브리드 추출: 빠른 추출 결과 품질 기준
+    GARBLED_RATIO_THRESHOLD = 0.02  # 깨진 문자(�, 사용자 정의 영역, 제어 문자) 비율
+    JAMO_RATIO_THRESHOLD = 0.1      # 한글 중 낱자모(ㄱ, ㅏ 등) 비율 (자모 분리 폰트)
+    MIN_COLUMN_BLOCK_LINES = 3      # 다단 판정에 쓰는 텍스트 블록 최소 줄 수
+
+    def __init__(
+        self,
+        preserve_layout: bool = True,
+        workers: int = 1,
+        hybrid: bool = False,
+        cache_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            preserve_layout: pdfplumber 레이아웃 모드로 텍스트 추출
+            workers: 페이지 추출 워커 프로세스 수 (1이면 순차 추출)
+            hybrid: 모든 페이지를 PyMuPDF로 먼저 추출하고, 품질 검사에 실패한 페이지만
+                    pdfplumber 레이아웃 모드로 재추출 (preserve_layout 무시)
+            cache_dir: 페이지 파싱 캐시 디렉토리 (None이면 캐시 미사용)
+        """
         self.preserve_layout = preserve_layout
+        self.workers = max(1, workers)
+        self.hybrid = hybrid
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self.cache = None
+        if cache_dir:
+            from .parse_cache import PageParseCache
+            self.cache = PageParseCache(cache_dir)
+
+    def cache_options(self, extract_images: bool) -> Dict:
+        """페이지 추출 결과에 영향을 주는 옵션 (캐시 키)"""
+        return {
+            "preserve_layout": self.preserve_layout,
+            "hybrid": self.hybrid,
+            "extract_images": extract_images,
+        }
+
+    def _get_cached_page(self, cache_key: Optional[Tuple[str, Dict]], page_number: int) -> Optional[PDFPage]:
+        if cache_key is None:
+            return None
+        cached = self.cache.get(*cache_key, page_number)
+        return PDFPage(**cached) if cached else None
+
+    def _cache_page(self, cache_key: Optional[Tuple[str, Dict]], page: PDFPage):
+        if cache_key is not None:
+            self.cache.put(*cache_key, asdict(page))
+
+    def open(self, pdf_path: str, file_digest: Optional[str] = None) -> "PDFParseSession":
+        """
+        파싱 세션 열기 (with 문으로 사용)
+
+        Args:
+            pdf_path: PDF 파일 경로
+            file_digest: 파일 내용 해시 (이미 계산했으면 전달)
+        """
+        return PDFParseSession(self, pdf_path, file_digest)
 
-    def parse(self, pdf_path: str, extract_images: bool = False) -> PDFDocument:
+    def parse(
+        self,
+        pdf_path: str,
+        extract_images: bool = False,
+        file_digest: Optional[str] = None
+    ) -> PDFDocument:
         """
         PDF 문서 파싱
 
         Args:
             pdf_path: PDF 파일 경로
             extract_images: 이미지 추출 여부
+            file_digest: 파일 내용 해시 (이미 계산했으면 전달, 캐시 키에 사용)
 
         Returns:
             PDFDocument 객체
         """
-        pdf_path = Path(pdf_path)
-        if not pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        with self.open(pdf_path, file_digest) as session:
+            return session.parse(extract_images)
 
-        print(f"📄 Parsing PDF: {pdf_path.name}")
+    def _parse_pages_parallel(self, pdf_path: str, page_nums: List[int], extract_images: bool) -> List[PDFPage]:
+        """
+        페이지 구간별 병렬 추출 후 페이지 순서대로 재조립
 
-        # PyMuPDF로 기본 정보 및 이미지 추출
-        doc_fitz = fitz.open(str(pdf_path))
-        total_pages = len(doc_fitz)
+        워커 수의 4배로 구간을 잘게 나눠 페이지별 처리 시간 편차를 흡수
+        """
+        range_count = min(len(page_nums), self._pool_size() * 4)
+        bounds = [len(page_nums) * i // range_count for i in range(range_count + 1)]
+        page_ranges = [page_nums[start:end] for start, end in zip(bounds, bounds[1:]) if start < end]
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                _parse_page_range,
+                pdf_path,
+                page_range,
+                self.preserve_layout,
+                extract_images,
+                self.hybrid
+            )
+            for page_range in page_ranges
+        ]
 
-        # pdfplumber로 텍스트 및 표 추출
         pages = []
-        with pdfplumber.open(str(pdf_path)) as pdf_plumber:
-            for page_num in tqdm(range(total_pages), desc="Processing pages"):
-                page_fitz = doc_fitz[page_num]
-                page_plumber = pdf_plumber.pages[page_num]
-
-                # 텍스트 추출
-                text = self._extract_text(page_plumber, page_fitz)
-
-                # 표 추출
-                tables = self._extract_tables(page_plumber)
-
-                # 이미지 추출 (옵션)
-                images = []
-                if extract_images:
-                    images = self._extract_images(page_fitz, page_num)
-
-                # 페이지 메타데이터
-                page_metadata = {
-                    "width": page_plumber.width,
-                    "height": page_plumber.height,
-                    "has_tables": len(tables) > 0,
-                    "has_images": len(images) > 0,
-                }
-
-                page_obj = PDFPage(
-                    page_number=page_num + 1,
-                    text=text,
-                    images=images,
-                    tables=tables,
-                    metadata=page_metadata
-                )
-                pages.append(page_obj)
+        with tqdm(total=len(page_nums), desc=f"Processing pages ({self._pool_size()} workers)") as progress:
+            for future in futures:
+                range_pages = future.result()
+                pages.extend(range_pages)
+                progress.update(len(range_pages))
+        return pages
+
+    def _pool_size(self) -> int:
+        """실제 워커 프로세스 수 (CPU 코어 수 이내)"""
+        return min(self.workers, os.cpu_count() or 1)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """페이지 추출 프로세스 풀 (최초 사용 시 생성, 이후 문서 간 재사용)"""
+        if self._executor is None:
+            # spawn: 호출 프로세스의 스레드/열린 파일 상태를 fork로 복제하지 않음
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._pool_size(),
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def close(self):
+        """페이지 추출 프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def iter_pages(
+        self,
+        pdf_path: str,
+        extract_images: bool = False,
+        file_digest: Optional[str] = None
+    ) -> Iterator[PDFPage]:
+        """
+        페이지를 하나씩 추출해 yield (스트리밍 처리용, 메모리 일정)
 
-        # 문서 메타데이터
-        doc_metadata = self._extract_document_metadata(doc_fitz)
+        Args:
+            pdf_path: PDF 파일 경로
+            extract_images: 이미지 추출 여부
+            file_digest: 파일 내용 해시 (이미 계산했으면 전달, 캐시 키에 사용)
 
-        # 언어 감지
-        language = self._detect_language(pages)
+        Yields:
+            PDFPage 객체 (페이지 순서대로, PDFParseSession.iter_pages 참고)
+        """
+        with self.open(pdf_path, file_digest) as session:
+            yield from session.iter_pages(extract_images)
 
-        doc_fitz.close()
+    def _needs_fitz(self, extract_images: bool) -> bool:
+        """페이지 추출에 PyMuPDF가 필요한지 (빠른/하이브리드 텍스트 추출, 이미지)"""
+        return self.hybrid or not self.preserve_layout or extract_images
 
-        document = PDFDocument(
-            file_path=str(pdf_path),
-            total_pages=total_pages,
-            pages=pages,
-            metadata=doc_metadata,
-            language=language
-        )
+    @staticmethod
+    def _release_plumber_page(page_plumber):
+        """pdfplumber 페이지 캐시 해제 (문서를 닫을 때까지 페이지마다 쌓이는 객체/레이아웃)"""
+        close = getattr(page_plumber, "close", None) or page_plumber.flush_cache
+        close()
 
-        print(f"✅ Parsed {total_pages} pages, Language: {language}")
-        return document
+    def _build_page(self, page_num: int, load_plumber_page: Callable, page_fitz, extract_images: bool) -> PDFPage:
+        """
+        단일 페이지 텍스트/표/이미지/메타데이터 추출
+
+        Args:
+            load_plumber_page: pdfplumber 페이지를 여는 함수 (필요할 때만 호출 - 하이브리드 모드에서
+                               빠른 추출로 끝나는 페이지는 pdfplumber 문자 파싱을 하지 않음)
+        """
+        loaded = []
+
+        def plumber_page():
+            if not loaded:
+                loaded.append(load_plumber_page())
+            return loaded[0]
+
+        try:
+            fallback_reasons = None
+            if self.hybrid:
+                # 표/다단 검사와 텍스트 모두 PyMuPDF, 품질 미달 페이지만 pdfplumber 레이아웃 모드
+                tables, table_reasons = self._extract_tables_hybrid(plumber_page, page_fitz)
+                text, fallback_reasons = self._extract_text_hybrid(plumber_page, page_fitz, tables, table_reasons)
+                width, height = page_fitz.rect.width, page_fitz.rect.height
+            else:
+                tables = self._extract_tables(plumber_page())
+                text = self._extract_text(plumber_page(), page_fitz)
+                width, height = plumber_page().width, plumber_page().height
+        finally:
+            for page_plumber in loaded:
+                self._release_plumber_page(page_plumber)
+
+        # 이미지 추출 (옵션)
+        images = []
+        if extract_images:
+            images = self._extract_images(page_fitz, page_num)
+
+        # 페이지 메타데이터
+        page_metadata = {
+            "width": width,
+            "height": height,
+            "has_tables": len(tables) > 0,
+            "has_images": len(images) > 0,
+        }
+        if fallback_reasons is not None:
+            page_metadata["text_source"] = "layout" if fallback_reasons else "fast"
+            if fallback_reasons:
+                page_metadata["fallback_reasons"] = fallback_reasons
+
+        return PDFPage(
+            page_number=page_num + 1,
+            text=text,
+            images=images,
+            tables=tables,
+            metadata=page_metadata
+        )
 
     def _extract_text(self, page_plumber, page_fitz) -> str:
         """
@@ -143,11 +292,158 @@ class PDFParser:
         text = self._clean_text(text)
         return text
 
+    def _extract_text_hybrid(
+        self,
+        plumber_page: Callable,
+        page_fitz,
+        tables,
+        table_reasons: Optional[List[str]] = None
+    ) -> Tuple[str, List[str]]:
+        """
+        PyMuPDF로 먼저 추출하고 품질 검사에 실패하면 pdfplumber 레이아웃 모드로 재추출
+
+        Args:
+            plumber_page: pdfplumber 페이지를 여는 함수 (재추출할 때만 호출)
+            table_reasons: 표를 pdfplumber로 재검출한 사유 (있으면 텍스트도 레이아웃 모드)
+
+        Returns:
+            (정제된 텍스트, 재추출 사유 리스트 - 빈 리스트면 빠른 추출 결과 사용)
+        """
+        text = page_fitz.get_text()
+        reasons = list(table_reasons or []) + self._fast_text_issues(text, page_fitz, tables)
+        if reasons:
+            text = plumber_page().extract_text(layout=True)
+        return self._clean_text(text), reasons
+
+    def _fast_text_issues(self, text: str, page_fitz, tables) -> List[str]:
+        """
+        빠른 추출 결과의 품질 문제 (값싼 휴리스틱, PyMuPDF만 사용)
+
+        - empty: 추출 텍스트가 비었지만 페이지에 글리프는 있음 (유니코드 매핑 없는 폰트 등)
+        - garbled: 깨진 문자 비율 초과 (폰트 매핑 실패)
+        - hangul: 한글이 낱자모로 분리됨
+        - columns: 나란히 놓인 다단 텍스트 블록
+        - table_order: 표 셀이 행 순서대로 나오지 않음
+        """
+        visible = [ch for ch in text if not ch.isspace()]
+        if not visible:
+            return ["empty"] if page_fitz.get_texttrace() else []
+
+        issues = []
+
+        garbled = sum(
+            1 for ch in visible
+            if ch == "\ufffd" or 0xE000 <= ord(ch) <= 0xF8FF or unicodedata.category(ch) == "Cc"
+        )
+        if garbled / len(visible) > self.GARBLED_RATIO_THRESHOLD:
+            issues.append("garbled")
+
+        jamo = sum(1 for ch in visible if 0x3131 <= ord(ch) <= 0x318E)
+        syllables = sum(1 for ch in visible if 0xAC00 <= ord(ch) <= 0xD7A3)
+        if jamo and jamo / (jamo + syllables) > self.JAMO_RATIO_THRESHOLD:
+            issues.append("hangul")
+
+        if self._has_columns(page_fitz):
+            issues.append("columns")
+
+        if not self._tables_in_reading_order(text, tables):
+            issues.append("table_order")
+
+        return issues
+
+    def _has_columns(self, page_fitz) -> bool:
+        """세로로 겹치면서 좌우로 나란한 여러 줄짜리 텍스트 블록이 있으면 다단으로 판정"""
+        half_width = page_fitz.rect.width / 2
+        blocks = [
+            (x0, y0, x1, y1)
+            for x0, y0, x1, y1, block_text, _, block_type in page_fitz.get_text("blocks")
+            if block_type == 0
+            and block_text.strip().count("\n") + 1 >= self.MIN_COLUMN_BLOCK_LINES
+            and x1 - x0 < half_width
+        ]
+
+        for left in blocks:
+            for right in blocks:
+                if left[2] > right[0]:
+                    continue
+                overlap = min(left[3], right[3]) - max(left[1], right[1])
+                if overlap > 0.5 * min(left[3] - left[1], right[3] - right[1]):
+                    return True
+        return False
+
+    @staticmethod
+    def _tables_in_reading_order(text: str, tables) -> bool:
+        """
+        여러 칸짜리 표 행의 셀 텍스트가 빠른 추출 결과에 행 순서대로 나오는지 확인
+
+        셀 첫 줄만 비교하고, 찾을 수 없는 셀(줄바꿈 차이 등)은 건너뜀
+        """
+        normalized = " ".join(text.split())
+        for table in tables:
+            position = 0
+            for row in table:
+                cells = [" ".join(cell.split("\n")[0].split()) for cell in row if cell and cell.strip()]
+                if len(cells) < 2:
+                    continue
+                for cell in cells:
+                    if len(cell) < 2:
+                        continue
+                    found = normalized.find(cell, position)
+                    if found < 0:
+                        if cell in normalized:
+                            return False  # 앞쪽에만 있음 → 순서가 뒤바뀜
+                        continue
+                    position = found + len(cell)
+        return True
+
     def _extract_tables(self, page_plumber) -> List[List[List[str]]]:
         """페이지에서 표 추출"""
         tables = page_plumber.extract_tables()
         return tables if tables else []
 
+    def _extract_tables_hybrid(self, plumber_page: Callable, page_fitz) -> Tuple[List[List[List[str]]], List[str]]:
+        """
+        하이브리드 모드 표 추출: PyMuPDF로 검출하고, 검출 결과가 괘선과 맞지 않으면 pdfplumber로 재검출
+
+        - 가로/세로 괘선이 없는 페이지는 표 검출 생략
+        - tables: 괘선과 텍스트가 있는데 PyMuPDF가 표를 찾지 못함 (곡선으로 그린 테두리 등 두 검출기가
+                  다르게 보는 경우) → pdfplumber 표 검출 (레이아웃 모드와 동일)
+
+        Returns:
+            (표 리스트, 재검출 사유 리스트)
+        """
+        drawings = page_fitz.get_drawings()
+        if not self._has_ruling_lines(drawings):
+            return [], []
+
+        tables = [table.extract() for table in page_fitz.find_tables(paths=drawings).tables]
+        if tables or not page_fitz.get_text("words"):
+            return tables, []
+        return self._extract_tables(plumber_page()), ["tables"]
+
+    @staticmethod
+    def _has_ruling_lines(drawings: List[Dict]) -> bool:
+        """표 테두리가 될 수 있는 가로/세로 선분(또는 사각형)이 각각 2개 이상 있는지"""
+        horizontal = vertical = 0
+        for drawing in drawings:
+            for item in drawing["items"]:
+                if item[0] == "l":
+                    start, end = item[1], item[2]
+                    horizontal += abs(start.y - end.y) < 1
+                    vertical += abs(start.x - end.x) < 1
+                elif item[0] == "re":
+                    rect = item[1]
+                    if rect.height < 2:
+                        horizontal += 1
+                    elif rect.width < 2:
+                        vertical += 1
+                    else:
+                        horizontal += 2
+                        vertical += 2
+            if horizontal >= 2 and vertical >= 2:
+                return True
+        return False
+
     def _extract_images(self, page_fitz, page_num: int) -> List[Dict]:
         """
         페이지에서 이미지 추출
@@ -255,7 +551,8 @@ class PDFParser:
         Returns:
             추출된 텍스트
         """
-        with pdfplumber.open(pdf_path) as pdf:
+        with self.open(pdf_path) as session:
+            pdf = session.plumber_doc
             text = ""
             for page_num in range(start_page - 1, end_page):
                 if page_num < len(pdf.pages):
@@ -266,10 +563,8 @@ class PDFParser:
 
     def get_page_count(self, pdf_path: str) -> int:
         """PDF 페이지 수 반환"""
-        doc = fitz.open(pdf_path)
-        count = len(doc)
-        doc.close()
-        return count
+        with self.open(pdf_path) as session:
+            return session.page_count
 
     def extract_toc(self, pdf_path: str) -> List[Tuple[int, str, int]]:
         """
@@ -278,10 +573,247 @@ class PDFParser:
         Returns:
             List of (level, title, page_number)
         """
-        doc = fitz.open(pdf_path)
-        toc = doc.get_toc()
-        doc.close()
-        return toc
+        with self.open(pdf_path) as session:
+            return session.get_toc()
+
+
+class PDFParseSession:
+    """
+    PDF 파일 하나의 파싱 세션
+
+    파일을 한 번 열어 읽기 전용 mmap으로 매핑하고, 파일 해시 / PyMuPDF / pdfplumber가
+    같은 매핑을 공유 (파일 I/O는 OS 페이지 캐시에서 한 번). 각 백엔드는 처음 필요할 때
+    최대 한 번만 열리고, 페이지 수 / 목차 / 문서 메타데이터 / 페이지(텍스트, 표)를
+    모두 이 세션에서 제공.
+
+    사용법:
+        with parser.open(pdf_path) as session:
+            if not manifest.is_unchanged(doc_id, session.file_digest, ...):
+                document = session.parse()
+    """
+
+    def __init__(self, parser: PDFParser, pdf_path: str, file_digest: Optional[str] = None):
+        """
+        Args:
+            parser: 추출 옵션/캐시를 가진 PDFParser
+            pdf_path: PDF 파일 경로
+            file_digest: 파일 내용 해시 (이미 계산했으면 전달)
+        """
+        self.parser = parser
+        self.pdf_path = Path(pdf_path)
+        if not self.pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {self.pdf_path}")
+
+        self._file = open(self.pdf_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Empty PDF file: {self.pdf_path}")
+
+        self._file_digest = file_digest
+        self._view: Optional[memoryview] = None
+        self._fitz_doc = None
+        self._plumber_doc = None
+
+    @property
+    def file_digest(self) -> str:
+        """파일 내용 sha256 (매니페스트/파싱 캐시 키, 같은 매핑에서 계산)"""
+        if self._file_digest is None:
+            self._file_digest = hashlib.sha256(self._map).hexdigest()
+        return self._file_digest
+
+    @property
+    def fitz_doc(self):
+        """PyMuPDF 문서 (최초 접근 시 매핑에서 엶, 복사 없음)"""
+        if self._fitz_doc is None:
+            self._view = memoryview(self._map)
+            self._fitz_doc = fitz.open(stream=self._view, filetype="pdf")
+        return self._fitz_doc
+
+    @property
+    def plumber_doc(self):
+        """pdfplumber 문서 (최초 접근 시 매핑에서 엶)"""
+        if self._plumber_doc is None:
+            self._plumber_doc = pdfplumber.open(self._map)
+        return self._plumber_doc
+
+    def plumber_page(self, page_num: int):
+        """pdfplumber 페이지 (0부터 시작, 필요할 때 문서를 엶)"""
+        return self.plumber_doc.pages[page_num]
+
+    @property
+    def page_count(self) -> int:
+        """페이지 수 (이미 열린 백엔드 우선, 없으면 가벼운 PyMuPDF)"""
+        if self._fitz_doc is None and self._plumber_doc is not None:
+            return len(self._plumber_doc.pages)
+        return len(self.fitz_doc)
+
+    @property
+    def metadata(self) -> Dict:
+        """문서 메타데이터 (제목, 작성자 등)"""
+        return self.parser._extract_document_metadata(self.fitz_doc)
+
+    def get_toc(self) -> List[Tuple[int, str, int]]:
+        """목차: List of (level, title, page_number)"""
+        return self.fitz_doc.get_toc()
+
+    def _cache_key(self, extract_images: bool) -> Optional[Tuple[str, Dict]]:
+        """(파일 해시, 옵션) 페이지 캐시 키 (캐시 미사용 시 None)"""
+        if self.parser.cache is None:
+            return None
+        return self.file_digest, self.parser.cache_options(extract_images)
+
+    def parse(self, extract_images: bool = False) -> PDFDocument:
+        """
+        문서 전체 파싱 (PDFParser.parse와 동일한 결과)
+
+        Args:
+            extract_images: 이미지 추출 여부
+
+        Returns:
+            PDFDocument 객체
+        """
+        parser = self.parser
+        print(f"📄 Parsing PDF: {self.pdf_path.name}")
+
+        # PyMuPDF로 기본 정보 및 이미지 추출
+        doc_fitz = self.fitz_doc
+        total_pages = len(doc_fitz)
+
+        # 페이지 캐시: 같은 파일/옵션으로 이미 추출한 페이지는 다시 파싱하지 않음
+        cache_key = self._cache_key(extract_images)
+        pages_by_number: Dict[int, PDFPage] = {}
+        if cache_key is not None:
+            for page_number in parser.cache.cached_pages(*cache_key):
+                page = parser._get_cached_page(cache_key, page_number)
+                if page is not None and page_number <= total_pages:
+                    pages_by_number[page_number] = page
+        missing = [page_num for page_num in range(total_pages) if page_num + 1 not in pages_by_number]
+
+        if missing and parser._pool_size() > 1 and len(missing) > 1:
+            # 페이지 구간을 워커 프로세스에 나눠 추출 (워커 프로세스는 파일을 직접 엶)
+            new_pages = parser._parse_pages_parallel(str(self.pdf_path), missing, extract_images)
+        elif missing:
+            # pdfplumber로 텍스트 및 표 추출
+            new_pages = []
+            for page_num in tqdm(missing, desc="Processing pages"):
+                new_pages.append(parser._build_page(
+                    page_num,
+                    partial(self.plumber_page, page_num),
+                    doc_fitz[page_num],
+                    extract_images
+                ))
+        else:
+            new_pages = []
+
+        for page in new_pages:
+            pages_by_number[page.page_number] = page
+            parser._cache_page(cache_key, page)
+        pages = [pages_by_number[page_number] for page_number in range(1, total_pages + 1)]
+
+        if cache_key is not None:
+            print(f"   - Parse cache: {total_pages - len(missing)}/{total_pages} pages cached")
+
+        # 언어 감지
+        language = parser._detect_language(pages)
+
+        document = PDFDocument(
+            file_path=str(self.pdf_path),
+            total_pages=total_pages,
+            pages=pages,
+            metadata=self.metadata,
+            language=language
+        )
+
+        if parser.hybrid:
+            layout_pages = sum(1 for page in pages if page.metadata.get("text_source") == "layout")
+            print(f"   - Hybrid extraction: {total_pages - layout_pages} fast, {layout_pages} layout fallback")
+
+        print(f"✅ Parsed {total_pages} pages, Language: {language}")
+        return document
+
+    def iter_pages(self, extract_images: bool = False) -> Iterator[PDFPage]:
+        """
+        페이지를 하나씩 추출해 yield (스트리밍 처리용, 메모리 일정)
+
+        parse()와 같은 PDFPage를 만들지만 문서 전체를 메모리에 모으지 않음
+        - 캐시에 있는 페이지는 읽기만 함
+        - 페이지에 필요한 백엔드만 필요할 때 엶 (레이아웃 모드 + 이미지 미추출이면
+          pdfplumber만, 캐시만으로 충분하면 페이지 수 확인용 PyMuPDF만)
+        - 추출이 끝난 페이지의 pdfplumber 캐시(문자/선 객체, 레이아웃)는 바로 해제
+
+        Args:
+            extract_images: 이미지 추출 여부
+
+        Yields:
+            PDFPage 객체 (페이지 순서대로)
+        """
+        parser = self.parser
+        cache_key = self._cache_key(extract_images)
+        needs_fitz = parser._needs_fitz(extract_images)
+
+        # 페이지 수: PyMuPDF가 필요 없는 추출이면 pdfplumber로 (백엔드 하나만 엶)
+        if needs_fitz or cache_key is not None:
+            total_pages = len(self.fitz_doc)
+        else:
+            total_pages = len(self.plumber_doc.pages)
+
+        for page_num in range(total_pages):
+            page = parser._get_cached_page(cache_key, page_num + 1)
+            if page is None:
+                page = parser._build_page(
+                    page_num,
+                    partial(self.plumber_page, page_num),
+                    self.fitz_doc[page_num] if needs_fitz else None,
+                    extract_images
+                )
+                parser._cache_page(cache_key, page)
+            yield page
+
+    def close(self):
+        """백엔드 문서와 파일 매핑 닫기"""
+        if self._plumber_doc is not None:
+            self._plumber_doc.close()
+            self._plumber_doc = None
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass  # 백엔드가 아직 버퍼를 참조 중이면 GC에 맡김
+        self._file.close()
+
+    def __enter__(self) -> "PDFParseSession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _parse_page_range(
+    pdf_path: str,
+    page_nums: List[int],
+    preserve_layout: bool,
+    extract_images: bool,
+    hybrid: bool = False
+) -> List[PDFPage]:
+    """워커 프로세스: 지정 페이지(0부터 시작) 추출 (워커가 자체 파싱 세션으로 파일을 직접 엶)"""
+    parser = PDFParser(preserve_layout=preserve_layout, hybrid=hybrid)
+    with parser.open(pdf_path) as session:
+        return [
+            parser._build_page(
+                page_num,
+                partial(session.plumber_page, page_num),
+                session.fitz_doc[page_num],
+                extract_images
+            )
+            for page_num in page_nums
+        ]
 
 
 # 유틸리티 함수
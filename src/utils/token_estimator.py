@@ -0,0 +1,19 @@
+"""
+토큰 수 추정 모듈
+- tokenizer 없이 사용할 수 있는 가벼운 휴리스틱
+"""
+
+import re
+
+_KOREAN_PATTERN = re.compile(r'[가-힣]')
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (실제 tokenizer 사용 시 더 정확)"""
+    # 영어: ~4 chars/token, 한국어: ~2 chars/token
+    # 간단한 휴리스틱
+    korean_chars = len(_KOREAN_PATTERN.findall(text))
+    other_chars = len(text) - korean_chars
+
+    estimated = (korean_chars / 2) + (other_chars / 4)
+    return int(estimated)
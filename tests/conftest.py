@@ -0,0 +1,9 @@
+"""
+pytest 공통 설정
+- 프로젝트 루트를 import 경로에 추가 (scripts/와 같은 방식, `from src...` 사용)
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
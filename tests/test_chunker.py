@@ -0,0 +1,47 @@
+"""
+DocumentChunker 스트리밍 청킹 테스트
+"""
+
+import random
+
+import pytest
+
+from src.utils.chunker import DocumentChunker
+
+
+WORDS = "account order meeting customer 거래선 주문 회의 status report shipment. memo, contact".split()
+
+
+def _random_pages(seed, n_pages=30):
+    rng = random.Random(seed)
+    pages = []
+    for _ in range(n_pages):
+        lines = []
+        for _ in range(rng.randint(3, 25)):
+            r = rng.random()
+            if r < 0.08:
+                lines.append(f"{rng.randint(1, 9)}. " + " ".join(rng.choices(WORDS, k=3)))
+            elif r < 0.12:
+                lines.append(rng.choice(["OVERVIEW", "# Guide", "1.2 Setup", "제3장 주문"]))
+            elif r < 0.2:
+                lines.append("")
+            else:
+                lines.append(" ".join(rng.choices(WORDS, k=rng.randint(1, 60))))
+        pages.append("\n".join(lines))
+    return pages
+
+
+@pytest.mark.parametrize("strategy", ["fixed", "recursive", "semantic", "token"])
+@pytest.mark.parametrize("seed", range(5))
+def test_chunk_stream_matches_chunk_document(strategy, seed):
+    if strategy == "token":
+        pytest.importorskip("tiktoken")
+    chunker = DocumentChunker()
+    pages = _random_pages(seed)
+    metadata = {"document_id": "d1"}
+
+    expected = chunker.chunk_document("\n\n".join(pages), dict(metadata), strategy)
+    streamed = list(chunker.chunk_stream(iter(pages), dict(metadata), strategy))
+
+    assert [(c.chunk_id, c.text, c.metadata) for c in streamed] == \
+        [(c.chunk_id, c.text, c.metadata) for c in expected]
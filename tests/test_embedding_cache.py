@@ -0,0 +1,41 @@
+"""
+PackedEmbeddingCache 다중 프로세스 쓰기 테스트
+"""
+
+import multiprocessing
+
+import numpy as np
+
+from src.services.embedding_cache import PackedEmbeddingCache
+
+
+DIM = 64
+
+
+def _vector(writer: int, i: int) -> np.ndarray:
+    return np.full(DIM, writer * 1000 + i, dtype=np.float32)
+
+
+def _write(cache_dir: str, writer: int):
+    cache = PackedEmbeddingCache(cache_dir, migrate_legacy=False)
+    for start in range(0, 400, 2):
+        texts = [f"w{writer}-{i}" for i in range(start, start + 2)]
+        cache.set_many(texts, "model", [_vector(writer, i) for i in range(start, start + 2)])
+
+
+def test_concurrent_processes_do_not_overwrite_each_other(tmp_path):
+    cache_dir = str(tmp_path)
+    context = multiprocessing.get_context("spawn")
+    writers = [context.Process(target=_write, args=(cache_dir, writer)) for writer in range(4)]
+    for process in writers:
+        process.start()
+    for process in writers:
+        process.join()
+        assert process.exitcode == 0
+
+    cache = PackedEmbeddingCache(cache_dir, migrate_legacy=False)
+    for writer in range(4):
+        texts = [f"w{writer}-{i}" for i in range(400)]
+        for i, vector in enumerate(cache.get_many(texts, "model")):
+            assert vector is not None
+            assert np.array_equal(vector, _vector(writer, i))
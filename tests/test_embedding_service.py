@@ -0,0 +1,140 @@
+"""
+EmbeddingService 재시도/분할 정책 테스트 (httpx MockTransport로 만든 스텁 엔드포인트)
+"""
+
+import json
+
+import httpx
+import numpy as np
+import pytest
+from openai import OpenAI, RateLimitError
+
+from src.services.embedding_service import EmbeddingService
+
+
+DIM = 3072
+
+
+def _service(handler, **kwargs) -> EmbeddingService:
+    options = dict(
+        api_key="test",
+        cache_enabled=False,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        max_retries=2,
+        retry_base_delay=0.0,
+    )
+    options.update(kwargs)
+    service = EmbeddingService(**options)
+    service.client = OpenAI(
+        api_key="test",
+        base_url="http://stub/v1",
+        max_retries=0,
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    return service
+
+
+def _embeddings_response(texts):
+    return httpx.Response(200, json={
+        "object": "list",
+        "model": "text-embedding-3-large",
+        "data": [
+            {"object": "embedding", "index": i, "embedding": [float(len(text))] * DIM}
+            for i, text in enumerate(texts)
+        ],
+        "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)},
+    })
+
+
+def _rate_limited():
+    return httpx.Response(
+        429,
+        headers={"retry-after-ms": "0"},
+        json={"error": {"message": "rate limited", "type": "rate_limit_exceeded"}},
+    )
+
+
+def test_rate_limit_retries_are_bounded_and_not_split():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return _rate_limited()
+
+    service = _service(handler)
+
+    with pytest.raises(RateLimitError):
+        service.embed_batch([f"text {i}" for i in range(64)], batch_size=64, show_progress=False)
+
+    assert len(calls) == service.max_retries + 1
+
+
+def test_oversized_batch_is_split_and_completed_parts_are_cached(tmp_path):
+    def handler(request):
+        texts = json.loads(request.content)["input"]
+        if len(texts) > 1:
+            return httpx.Response(400, json={"error": {"message": "too many tokens", "type": "invalid_request_error"}})
+        if "fail" in texts[-1]:
+            return _rate_limited()
+        return _embeddings_response(texts)
+
+    service = _service(handler, cache_enabled=True, cache_dir=str(tmp_path), memory_cache_bytes=0)
+    texts = ["a", "bb", "ccc", "fail"]
+
+    with pytest.raises(RateLimitError):
+        service.embed_batch(texts, batch_size=4, show_progress=False)
+
+    cached = service.cache.get_many(texts, service.cache_key_model)
+    assert [emb is not None for emb in cached] == [True, True, True, False]
+    assert np.allclose(cached[2], 3.0)
+
+
+def test_custom_endpoint_gets_its_own_cache_key():
+    default = EmbeddingService(api_key="test", cache_enabled=False)
+    same = EmbeddingService(api_key="test", cache_enabled=False, base_url="https://api.openai.com/v1/")
+    stub = EmbeddingService(api_key="test", cache_enabled=False, base_url="http://LocalHost:8765/v1/")
+
+    assert default.cache_key_model == same.cache_key_model == "openai/text-embedding-3-large"
+    assert stub.cache_key_model == "openai/text-embedding-3-large#http://localhost:8765/v1"
+
+
+def test_cached_batch_never_calls_the_api(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return _embeddings_response(json.loads(request.content)["input"])
+
+    service = _service(handler, cache_enabled=True, cache_dir=str(tmp_path), output_dimension=256)
+    embedded = service.embed_batch(["a", "bb"], show_progress=False, as_numpy=True)
+    requests_made = len(calls)
+
+    cached = service.get_cached_batch(["a", "bb"], as_numpy=True)
+
+    assert np.array_equal(cached, embedded)
+    assert cached.shape == (2, 256)
+    assert service.get_cached_batch(["a", "missing"]) is None
+    assert len(calls) == requests_made
+
+
+def test_normalized_duplicates_across_batches_are_embedded_once(tmp_path):
+    calls = []
+
+    def handler(request):
+        texts = json.loads(request.content)["input"]
+        calls.append(texts)
+        return _embeddings_response(texts)
+
+    uncached = _service(handler)
+    first = uncached.embed_batch(["Page  footer", "alpha"], show_progress=False, as_numpy=True)
+    second = uncached.embed_batch(["Page footer\n", "beta"], show_progress=False, as_numpy=True)
+
+    assert calls == [["Page  footer", "alpha"], ["beta"]]
+    assert np.array_equal(second[0], first[0])
+
+    cached = _service(handler, cache_enabled=True, cache_dir=str(tmp_path))
+    cached.embed_batch(["gamma", " gamma", "gamma"], show_progress=False)
+
+    # 텍스트당 한 번만 저장 (정규화 키 별칭 없음)
+    assert len(cached.cache._index) == 2
@@ -0,0 +1,37 @@
+"""
+IndexArtifact 테스트
+"""
+
+import numpy as np
+import pytest
+
+from src.services.index_artifact import IndexArtifact, write_index_artifact
+
+
+def _write(path):
+    chunks = [{"chunk_id": f"c{i}", "text": f"text {i}", "metadata": {"language": "ko"}} for i in range(3)]
+    vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+    write_index_artifact(str(path), {"crm_account_ko": (chunks, vectors)}, model="m", dimension=4)
+    return vectors
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "index.bin"
+    vectors = _write(path)
+
+    artifact = IndexArtifact.open(str(path))
+    assert artifact.is_compatible("m", 4)
+    assert np.array_equal(artifact.get_vectors("crm_account_ko"), vectors)
+    assert artifact.get_chunks("crm_account_ko")[1]["chunk_id"] == "c1"
+    artifact.close()
+
+
+def test_truncated_file_raises_value_error(tmp_path):
+    path = tmp_path / "index.bin"
+    _write(path)
+    data = path.read_bytes()
+
+    for length in [0, 1, 15, 16, 40, len(data) // 2, len(data) - 1]:
+        path.write_bytes(data[:length])
+        with pytest.raises(ValueError):
+            IndexArtifact.open(str(path))
@@ -0,0 +1,15 @@
+"""
+IngestionManifest 테스트
+"""
+
+from src.core.manifest import IngestionManifest
+
+
+def test_manifest_round_trip(tmp_path):
+    path = tmp_path / "manifest.json"
+    IngestionManifest(str(path)).update("doc", "doc.pdf", "f1", "c1", {"doc_chunk_0000": "h"})
+
+    manifest = IngestionManifest(str(path))
+    assert manifest.is_unchanged("doc", "f1", "c1")
+    assert not manifest.is_unchanged("doc", "f2", "c1")
+
@@ -0,0 +1,74 @@
+"""
+NumpyVectorStore 동시 검색 테스트
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from src.services.numpy_vector_store import NumpyVectorStore
+from src.services.vector_store import create_vector_store
+
+
+def test_concurrent_first_searches_merge_blocks_once():
+    dim = 16
+    store = NumpyVectorStore()
+    store.create_collection("crm_account_ko", vector_size=dim)
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((400, dim)).astype(np.float32)
+    for start in range(0, len(vectors), 10):
+        store.add_documents(
+            "crm_account_ko",
+            [
+                {"chunk_id": f"chunk_{i:04d}", "text": f"text {i}", "metadata": {"document_id": "doc"}}
+                for i in range(start, start + 10)
+            ],
+            show_progress=False,
+            embeddings=vectors[start:start + 10],
+        )
+
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def search(offset):
+        barrier.wait()
+        for i in range(offset, len(vectors), 8):
+            result = store.search("crm_account_ko", vectors[i], top_k=1, filters={"document_id": "doc"})
+            if result[0].chunk_id != f"chunk_{i:04d}":
+                errors.append((i, result[0].chunk_id))
+
+    threads = [threading.Thread(target=search, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    collection = store.collections["crm_account_ko"]
+    assert errors == []
+    assert len(collection.matrix) == len(collection.payloads) == len(vectors)
+
+
+def test_search_by_filters_without_filters_returns_all_payloads():
+    store = NumpyVectorStore()
+    store.create_collection("crm_account_ko", vector_size=4)
+    store.add_documents(
+        "crm_account_ko",
+        [{"chunk_id": f"chunk_{i}", "text": f"text {i}", "metadata": {"document_id": f"doc{i % 2}"}} for i in range(3)],
+        show_progress=False,
+        embeddings=np.eye(3, 4, dtype=np.float32),
+    )
+
+    assert [p["chunk_id"] for p in store.search_by_filters("crm_account_ko", {})] == ["chunk_0", "chunk_1", "chunk_2"]
+    assert [p["chunk_id"] for p in store.search_by_filters("crm_account_ko", {}, limit=2)] == ["chunk_0", "chunk_1"]
+    assert [p["chunk_id"] for p in store.search_by_filters("crm_account_ko", {"document_id": "doc1"})] == ["chunk_1"]
+
+
+def test_create_numpy_store_rejects_connection_arguments():
+    assert isinstance(create_vector_store("numpy", use_memory=True), NumpyVectorStore)
+
+    with pytest.raises(ValueError, match="host, port"):
+        create_vector_store("numpy", host="qdrant.internal", port=6333)
+    with pytest.raises(ValueError, match="use_memory"):
+        create_vector_store("numpy", use_memory=False)
@@ -0,0 +1,88 @@
+"""
+PDFParser 하이브리드 추출 테스트
+"""
+
+import fitz
+import pytest
+
+from src.utils import pdf_parser
+from src.utils.pdf_parser import PDFParser
+
+
+def _write_pdf(path, pages):
+    doc = fitz.open()
+    for lines in pages:
+        page = doc.new_page()
+        for i, line in enumerate(lines):
+            page.insert_text((72, 72 + 18 * i), line)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_hybrid_clean_pages_do_not_touch_pdfplumber(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "clean.pdf"
+    _write_pdf(pdf_path, [
+        ["CRM account guide", "Open the account menu and select a customer."],
+        ["Contact history", "Every call is recorded with its date and owner."],
+    ])
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("pdfplumber opened for a clean page")
+
+    monkeypatch.setattr(pdf_parser.pdfplumber, "open", fail_open)
+
+    parser = PDFParser(hybrid=True)
+    document = parser.parse(str(pdf_path))
+    streamed = list(parser.iter_pages(str(pdf_path)))
+
+    assert document.total_pages == 2
+    assert "account menu" in document.pages[0].text
+    for page in document.pages + streamed:
+        assert page.metadata["text_source"] == "fast"
+        assert page.tables == []
+
+
+def test_hybrid_falls_back_to_layout_for_bad_pages(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "garbled.pdf"
+    _write_pdf(pdf_path, [["CRM account guide"]])
+
+    parser = PDFParser(hybrid=True)
+    monkeypatch.setattr(parser, "_fast_text_issues", lambda text, page_fitz, tables: ["garbled"])
+    opened = []
+    real_open = pdf_parser.pdfplumber.open
+    monkeypatch.setattr(
+        pdf_parser.pdfplumber, "open", lambda *a, **k: opened.append(1) or real_open(*a, **k)
+    )
+
+    page = parser.parse(str(pdf_path)).pages[0]
+
+    assert opened == [1]
+    assert page.metadata["text_source"] == "layout"
+    assert page.metadata["fallback_reasons"] == ["garbled"]
+    assert "CRM account guide" in page.text
+
+
+def test_hybrid_rechecks_tables_with_pdfplumber_when_detectors_disagree(tmp_path, monkeypatch):
+    pdf_path = tmp_path / "ruled.pdf"
+    _write_pdf(pdf_path, [["Contents", "Step 1 Menu"]])
+
+    parser = PDFParser(hybrid=True)
+    monkeypatch.setattr(parser, "_has_ruling_lines", lambda drawings: True)
+    monkeypatch.setattr(parser, "_extract_tables", lambda page_plumber: [[["Step 1", "Menu"]]])
+
+    page = parser.parse(str(pdf_path)).pages[0]
+
+    assert page.tables == [[["Step 1", "Menu"]]]
+    assert page.metadata["text_source"] == "layout"
+    assert page.metadata["fallback_reasons"] == ["tables"]
+    assert "Step 1 Menu" in page.text
+
+@pytest.mark.parametrize("hybrid", [False, True])
+def test_layout_and_hybrid_extract_same_words(tmp_path, hybrid):
+    pdf_path = tmp_path / "doc.pdf"
+    _write_pdf(pdf_path, [["Sales order fulfillment", "Shipment status"]])
+
+    page = PDFParser(hybrid=hybrid).parse(str(pdf_path)).pages[0]
+
+    assert page.text.split() == ["Sales", "order", "fulfillment", "Shipment", "status"]
+    assert page.metadata["width"] == pytest.approx(595, abs=1)
@@ -0,0 +1,85 @@
+"""
+DocumentProcessingPipeline 테스트
+"""
+
+import json
+from types import SimpleNamespace
+
+import fitz
+import numpy as np
+import pytest
+
+from src.core.pipeline import DocumentProcessingPipeline
+from src.utils.hashing import file_hash
+
+
+def test_pipeline_context_shuts_down_parser_pool(tmp_path):
+    with DocumentProcessingPipeline(
+        embedding_service=None,
+        vector_store=None,
+        output_dir=str(tmp_path),
+        parse_workers=2
+    ) as pipeline:
+        executor = pipeline.pdf_parser._get_executor()
+
+    assert pipeline.pdf_parser._executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_unchanged_document_is_reprocessed_when_chunk_json_is_missing(tmp_path):
+    pdf_path = tmp_path / "Account_Guide_ENG.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 stub")
+    embedding_service = SimpleNamespace(cache_key_model="openai/text-embedding-3-large", dimension=3072)
+
+    def check(pipeline):
+        return pipeline._check_document(pdf_path, "recursive", incremental=True, start_time=0.0)
+
+    with DocumentProcessingPipeline(embedding_service, None, output_dir=str(tmp_path / "out")) as pipeline:
+        doc_metadata, file_digest, config_digest, skipped = check(pipeline)
+        assert skipped is None
+        pipeline.manifest.update(
+            doc_metadata.document_id, pdf_path.name, file_digest, config_digest, {"c": "h"}
+        )
+        assert file_digest == file_hash(str(pdf_path))
+
+    # 새 실행에서도 매니페스트는 디스크에서 복원
+    with DocumentProcessingPipeline(embedding_service, None, output_dir=str(tmp_path / "out")) as pipeline:
+        assert check(pipeline)[3] is None
+        pipeline._save_chunks(doc_metadata.document_id, [])
+        assert check(pipeline)[3]["skipped"] is True
+
+
+@pytest.mark.parametrize("strategy", ["fixed", "recursive", "semantic"])
+def test_streaming_and_batch_processing_agree(tmp_path, strategy):
+    pdf_path = tmp_path / "Account_Guide_ENG.pdf"
+    doc = fitz.open()
+    for p in range(6):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{p + 1}. Account section {p}")
+        for i in range(30):
+            page.insert_text((72, 100 + 18 * i), f"Customer {p}-{i} order status and meeting memo line.")
+    doc.save(str(pdf_path))
+    doc.close()
+
+    embedding_service = SimpleNamespace(
+        cache_key_model="stub",
+        dimension=8,
+        embed_batch=lambda texts, **kwargs: np.zeros((len(texts), 8), dtype=np.float32),
+    )
+    vector_store = SimpleNamespace(
+        add_document_chunks=lambda **kwargs: None,
+        prune_document=lambda **kwargs: None,
+    )
+
+    results = []
+    for streaming in (False, True):
+        output_dir = tmp_path / f"out_{streaming}"
+        with DocumentProcessingPipeline(embedding_service, vector_store, output_dir=str(output_dir)) as pipeline:
+            stats = pipeline.process_document(
+                str(pdf_path), chunking_strategy=strategy, incremental=False, streaming=streaming
+            )
+        chunks = json.loads(next(output_dir.glob("*_chunks.json")).read_text(encoding="utf-8"))
+        results.append((stats["total_pages"], stats["total_chars"], stats["total_chunks"], chunks))
+
+    assert results[0] == results[1]
@@ -0,0 +1,55 @@
+"""
+MultiCollectionVectorStore 동시 검색 기한 테스트
+"""
+
+import threading
+
+from src.services.vector_store import MultiCollectionVectorStore, SearchResult
+
+
+class SlowStore:
+    """검색마다 release 될 때까지 멈추는 스텁 스토어"""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def collection_exists(self, collection_name):
+        return True
+
+    def search(self, collection_name, query_vector, top_k=5, timeout=None):
+        self.calls.append((collection_name, timeout))
+        self.release.wait()
+        return [SearchResult(chunk_id=collection_name, text="", score=1.0, metadata={})]
+
+
+def test_deadline_cancels_queued_searches_and_passes_remaining_budget():
+    store = SlowStore()
+    multi = MultiCollectionVectorStore(store=store, max_workers=1, search_timeout=0.2)
+
+    try:
+        results = multi.search_all_collections([0.0], language="ko")
+    finally:
+        store.release.set()
+        multi.close()
+
+    assert results == []
+    # 첫 요청만 시작되고 대기 중이던 나머지는 취소됨
+    assert len(store.calls) == 1
+    assert 0 < store.calls[0][1] <= 0.2
+
+
+def test_no_deadline_searches_every_collection_without_timeout():
+    store = SlowStore()
+    store.release.set()
+    multi = MultiCollectionVectorStore(store=store, search_timeout=None)
+
+    try:
+        results = multi.search_all_collections([0.0], language="en")
+    finally:
+        multi.close()
+
+    assert sorted(r.chunk_id for r in results) == [
+        "crm_account_en", "crm_common_en", "crm_meeting_en", "crm_order_en"
+    ]
+    assert {timeout for _, timeout in store.calls} == {None}